@@ -1,8 +1,10 @@
+import concurrent.futures
 import contextlib
+import itertools
+import multiprocessing
 import sys
 import math
 import os
-import json
 from abc import ABCMeta, abstractmethod
 import copy
 import pathlib
@@ -16,6 +18,7 @@ sys.path.append(file_dir)
 
 def flatten_dimensions(data):
     dimensions = data["dimensions"]
+    flat_dimensions = {}
     for k, v in dimensions.items():
         if isinstance(v, dict):
             if "nominal" not in v or v["nominal"] is None:
@@ -26,8 +29,11 @@ def flatten_dimensions(data):
                 else:
                     v["nominal"] = round((v["maximum"] + v["minimum"]) / 2, 6)
         else:
-            dimensions[k] = {"nominal": v}
-    return {k: v["nominal"] * 1000 for k, v in dimensions.items() if k != 'alpha'}
+            v = {"nominal": v}
+            dimensions[k] = v
+        if k != 'alpha':
+            flat_dimensions[k] = v["nominal"] * 1000
+    return flat_dimensions
 
 
 class Builder:
@@ -48,31 +54,45 @@ class Builder:
         return self.engine.factory(data)
 
     def get_families(self):
-        return {
-            shaper.name.lower()
-            .replace("_", " "): self.factory({'family': shaper.name})
-            .get_dimensions_and_subtypes()
-            for shaper in self.engine.shapers
-        }
+        return self.engine.get_families()
 
     def get_spacer(self, geometrical_data):
         return self.engine.get_spacer(geometrical_data)
 
-    def get_core(self, project_name, geometrical_description, output_path=f'{os.path.dirname(os.path.abspath(__file__))}/../../output/', save_files=True, export_files=True):
+    def get_core(self, project_name, geometrical_description, output_path=utils.default_output_path, save_files=True, export_files=True):
         return self.engine.get_core(project_name, geometrical_description, output_path, save_files, export_files)
 
-    def get_core_gapping_technical_drawing(self, project_name, core_data, colors=None, output_path=f'{os.path.dirname(os.path.abspath(__file__))}/../../output/', save_files=True, export_files=True):
+    def get_core_gapping_technical_drawing(self, project_name, core_data, colors=None, output_path=utils.default_output_path, save_files=True, export_files=True):
         return self.engine.get_core_gapping_technical_drawing(project_name, core_data, colors, output_path, save_files, export_files)
 
 
+def generate_piece(data, output_path=utils.default_output_path, engine="CadQuery", save_files=False, export_files=True):
+    piece_builder = Builder(engine).factory(data)
+    piece_builder.set_output_path(output_path)
+    return piece_builder.get_piece(data, save_files=save_files, export_files=export_files)
+
+
+def generate_many(data_list, output_path=utils.default_output_path, engine="CadQuery", workers=None, save_files=False):
+    """
+    Generates the piece of every shape in data_list in parallel, one worker process per CPU by default.
+    Workers are spawned instead of forked so each one initializes its own FreeCAD or CadQuery state,
+    and every piece is built in its own document named after the shape, so they never share one.
+    Pieces are always exported, as the shapes themselves cannot be sent back from the workers;
+    the paths of the exported files are returned in the same order as data_list.
+    """
+    context = multiprocessing.get_context("spawn")
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers or os.cpu_count(), mp_context=context) as executor:
+        return list(executor.map(generate_piece,
+                                 data_list,
+                                 itertools.repeat(output_path),
+                                 itertools.repeat(engine),
+                                 itertools.repeat(save_files),
+                                 itertools.repeat(True)))
+
+
 if __name__ == '__main__':  # pragma: no cover
 
-    with open(f'{os.path.dirname(os.path.abspath(__file__))}/../../MAS/data/core_shapes.ndjson', 'r') as f:
-        for ndjson_line in f.readlines():
-            data = json.loads(ndjson_line)
-            if data["name"] == "PQ 40/40":
-            # if data["family"] in ['pm']:
-            # if data["family"] not in ['ui']:
-                core = Builder().factory(data)
-                core.get_core(data, None)
-                # break
+    # the shape to build can be given by name, e.g. "E 42/21/15"
+    data = utils.load_core_shape(sys.argv[1] if len(sys.argv) > 1 else "PQ 40/40")
+    core = Builder().factory(data)
+    core.get_piece(data)
@@ -2,9 +2,7 @@ import contextlib
 import sys
 import math
 import os
-import json
 from abc import ABCMeta, abstractmethod
-import copy
 import pathlib
 import platform
 sys.path.append(os.path.dirname(__file__))
@@ -15,8 +13,13 @@ file_dir = os.path.dirname(__file__)
 sys.path.append(file_dir)
 
 
+# Characters that cannot appear in project names, replaced in a single pass
+_NAME_TABLE = str.maketrans({" ": "_", "-": "_", "/": "_", ".": "__"})
+
+
 def flatten_dimensions(data):
     dimensions = data["dimensions"]
+    flat_dimensions = {}
     for k, v in dimensions.items():
         if isinstance(v, dict):
             if "nominal" not in v or v["nominal"] is None:
@@ -27,8 +30,18 @@ def flatten_dimensions(data):
                 else:
                     v["nominal"] = round((v["maximum"] + v["minimum"]) / 2, 6)
         else:
-            dimensions[k] = {"nominal": v}
-    return {k: v["nominal"] for k, v in dimensions.items() if k != 'alpha'}
+            v = {"nominal": v}
+            dimensions[k] = v
+        if k != 'alpha':
+            flat_dimensions[k] = v["nominal"]
+    return flat_dimensions
+
+
+def copy_shape_data(data):
+    # flatten_dimensions only rewrites the dimensions entries, so those are the only ones that need their own copy
+    shape_data = data.copy()
+    shape_data["dimensions"] = {k: (v.copy() if isinstance(v, dict) else v) for k, v in data["dimensions"].items()}
+    return shape_data
 
 
 def convert_axis(coordinates):
@@ -47,38 +60,49 @@ class CadQueryBuilder:
     """
 
     def __init__(self):
-        self.shapers = {
-            utils.ShapeFamily.ETD: self.Etd(),
-            utils.ShapeFamily.ER: self.Er(),
-            utils.ShapeFamily.EP: self.Ep(),
-            utils.ShapeFamily.EPX: self.Epx(),
-            utils.ShapeFamily.PQ: self.Pq(),
-            utils.ShapeFamily.E: self.E(),
-            utils.ShapeFamily.PM: self.Pm(),
-            utils.ShapeFamily.P: self.P(),
-            utils.ShapeFamily.RM: self.Rm(),
-            utils.ShapeFamily.EQ: self.Eq(),
-            utils.ShapeFamily.LP: self.Lp(),
-            utils.ShapeFamily.PLANAR_ER: self.Er(),
-            utils.ShapeFamily.PLANAR_E: self.E(),
-            utils.ShapeFamily.PLANAR_EL: self.El(),
-            utils.ShapeFamily.EC: self.Ec(),
-            utils.ShapeFamily.EFD: self.Efd(),
-            utils.ShapeFamily.U: self.U(),
-            utils.ShapeFamily.UR: self.Ur(),
-            utils.ShapeFamily.T: self.T()
-        }
+        self._shapers = None
+        self._families = None
+
+    @property
+    def shapers(self):
+        # Built on first use, so creating a builder stays cheap until a piece is actually needed
+        if self._shapers is None:
+            self._shapers = {
+                utils.ShapeFamily.ETD: self.Etd(),
+                utils.ShapeFamily.ER: self.Er(),
+                utils.ShapeFamily.EP: self.Ep(),
+                utils.ShapeFamily.EPX: self.Epx(),
+                utils.ShapeFamily.PQ: self.Pq(),
+                utils.ShapeFamily.E: self.E(),
+                utils.ShapeFamily.PM: self.Pm(),
+                utils.ShapeFamily.P: self.P(),
+                utils.ShapeFamily.RM: self.Rm(),
+                utils.ShapeFamily.EQ: self.Eq(),
+                utils.ShapeFamily.LP: self.Lp(),
+                utils.ShapeFamily.PLANAR_ER: self.Er(),
+                utils.ShapeFamily.PLANAR_E: self.E(),
+                utils.ShapeFamily.PLANAR_EL: self.El(),
+                utils.ShapeFamily.EC: self.Ec(),
+                utils.ShapeFamily.EFD: self.Efd(),
+                utils.ShapeFamily.U: self.U(),
+                utils.ShapeFamily.UR: self.Ur(),
+                utils.ShapeFamily.T: self.T()
+            }
+        return self._shapers
 
     def factory(self, data):
-        family = utils.ShapeFamily[data['family'].upper().replace(" ", "_")]
-        return self.shapers[family]
+        return self.shapers[utils.get_shape_family(data['family'])]
 
     def get_families(self):
+        # The families and their dimensions never change, so they are gathered once and every caller gets its own copy
+        if self._families is None:
+            self._families = {
+                family.name.lower().replace("_", " "): shaper.get_dimensions_and_subtypes()
+                for family, shaper in self.shapers.items()
+            }
         return {
-            shaper.name.lower()
-            .replace("_", " "): self.factory({'family': shaper.name})
-            .get_dimensions_and_subtypes()
-            for shaper in self.shapers
+            family: {subtype: list(dimensions) for subtype, dimensions in subtypes.items()}
+            for family, subtypes in self._families.items()
         }
 
     def get_spacer(self, geometrical_data):
@@ -89,10 +113,10 @@ class CadQueryBuilder:
         )
         return spacer
 
-    def get_core(self, project_name, geometrical_description, output_path=f'{os.path.dirname(os.path.abspath(__file__))}/../../output/', save_files=True, export_files=True):
+    def get_core(self, project_name, geometrical_description, output_path=utils.default_output_path, save_files=True, export_files=True):
         try:
             pieces_to_export = []
-            project_name = f"{project_name}_core".replace(" ", "_").replace("-", "_").replace("/", "_").replace(".", "__")
+            project_name = f"{project_name}_core".translate(_NAME_TABLE)
 
             os.makedirs(output_path, exist_ok=True)
 
@@ -102,9 +126,11 @@ class CadQueryBuilder:
                     pieces_to_export.append(spacer)
                 elif geometrical_part['type'] in ['half set', 'toroidal']:
                     shape_data = geometrical_part['shape']
-                    part_builder = CadQueryBuilder().factory(shape_data)
+                    # The shapers are shared by every call, so the output path left by a previous one is reset
+                    part_builder = self.factory(shape_data)
+                    part_builder.set_output_path(output_path)
 
-                    piece = part_builder.get_piece(data=copy.deepcopy(shape_data),
+                    piece = part_builder.get_piece(data=copy_shape_data(shape_data),
                                                    name=f"Piece_{index}",
                                                    save_files=False,
                                                    export_files=False)
@@ -114,10 +140,11 @@ class CadQueryBuilder:
                     piece = piece.rotate((0, 0, 1), (0, 0, -1), geometrical_part['rotation'][1] / math.pi * 180)
 
                     if 'machining' in geometrical_part and geometrical_part['machining'] is not None:
+                        dimensions = flatten_dimensions(shape_data)
                         for machining in geometrical_part['machining']:
                             piece = part_builder.apply_machining(piece=piece,
                                                                  machining=machining,
-                                                                 dimensions=flatten_dimensions(shape_data))
+                                                                 dimensions=dimensions)
 
                     piece = piece.translate(convert_axis(geometrical_part['coordinates']))
 
@@ -149,12 +176,12 @@ class CadQueryBuilder:
         except:  # noqa: E722
             return None, None
     
-    def get_core_gapping_technical_drawing(self, project_name, core_data, colors=None, output_path=f'{os.path.dirname(os.path.abspath(__file__))}/../../output/', save_files=True, export_files=True):
+    def get_core_gapping_technical_drawing(self, project_name, core_data, colors=None, output_path=utils.default_output_path, save_files=True, export_files=True):
         raise NotImplementedError
 
     class IPiece(metaclass=ABCMeta):
         def __init__(self):
-            self.output_path = f'{os.path.dirname(os.path.abspath(__file__))}/../../output/'
+            self.output_path = utils.default_output_path
 
         def set_output_path(self, output_path):
             self.output_path = output_path
@@ -183,7 +210,7 @@ class CadQueryBuilder:
         def get_plate(self, data, save_files=False, export_files=True):
             import FreeCAD
             try:
-                project_name = f"{data['name']}_plate".replace(" ", "_").replace("-", "_").replace("/", "_").replace(".", "__")
+                project_name = f"{data['name']}_plate".translate(_NAME_TABLE)
                 data["dimensions"] = flatten_dimensions(data)
 
                 close_file_after_finishing = False
@@ -228,7 +255,7 @@ class CadQueryBuilder:
 
         def get_piece(self, data, name="Piece", save_files=False, export_files=True):
             try:
-                project_name = f"{data['name']}_piece".replace(" ", "_").replace("-", "_").replace("/", "_").replace(".", "__")
+                project_name = f"{data['name']}_piece".translate(_NAME_TABLE)
 
                 data["dimensions"] = flatten_dimensions(data)
 
@@ -1803,12 +1830,7 @@ class CadQueryBuilder:
 
 if __name__ == '__main__':  # pragma: no cover
 
-    with open(f'{os.path.dirname(os.path.abspath(__file__))}/../../MAS/data/core_shapes.ndjson', 'r') as f:
-        for ndjson_line in f.readlines():
-            data = json.loads(ndjson_line)
-            if data["name"] == "PQ 40/40":
-                # if data["family"] in ['pm']:
-                # if data["family"] not in ['ui']:
-                core = CadQueryBuilder().factory(data)
-                core.get_core(data, None)
-                # break
+    # the shape to build can be given by name, e.g. "E 42/21/15"
+    data = utils.load_core_shape(sys.argv[1] if len(sys.argv) > 1 else "PQ 40/40")
+    core = CadQueryBuilder().factory(data)
+    core.get_piece(data)
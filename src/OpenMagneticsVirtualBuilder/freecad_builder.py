@@ -2,11 +2,11 @@ import contextlib
 import sys
 import math
 import os
-import json
 from abc import ABCMeta, abstractmethod
-import copy
+import functools
 import pathlib
 import platform
+import numpy
 sys.path.append(os.path.dirname(__file__))
 import utils
 
@@ -14,8 +14,127 @@ file_dir = os.path.dirname(__file__)
 sys.path.append(file_dir)
 
 
+def add_freecad_to_path():
+    if platform.system() == "Windows":
+        freecad_path = None
+        if os.path.exists(f"{os.getenv('LOCALAPPDATA')}\\Programs\\FreeCAD 1.0"):
+            freecad_path = f"{os.getenv('LOCALAPPDATA')}\\Programs\\FreeCAD 1.0"
+        elif os.path.exists(f"{os.environ['ProgramFiles']}\\FreeCAD 1.0"):
+            freecad_path = f"{os.environ['ProgramFiles']}\\FreeCAD 1.0"
+        elif os.path.exists(f"{os.getenv('LOCALAPPDATA')}\\Programs\\FreeCAD 0.21"):
+            freecad_path = f"{os.getenv('LOCALAPPDATA')}\\Programs\\FreeCAD 0.21"
+        elif os.path.exists(f"{os.environ['ProgramFiles']}\\FreeCAD 0.21"):
+            freecad_path = f"{os.environ['ProgramFiles']}\\FreeCAD 0.21"
+
+        if freecad_path is None:
+            return
+
+        sys.path.insert(0, f"{freecad_path}\\bin\\Lib\\site-packages")
+        sys.path.append(f"{freecad_path}\\bin")
+        sys.path.append(f"{freecad_path}\\Ext")
+        sys.path.append(f"{freecad_path}\\Mod")
+        sys.path.append(f"{freecad_path}\\Mod\\Draft")
+        sys.path.append(f"{freecad_path}\\Mod\\Part")
+        sys.path.append(f"{freecad_path}\\Mod\\PartDesign")
+        sys.path.append(f"{freecad_path}\\Mod\\Sketcher")
+        sys.path.append(f"{freecad_path}\\Mod\\Arch")
+    else:
+        freecad_name = None
+        if os.path.exists("/usr/lib/freecad-daily"):
+            freecad_name = "freecad-daily"
+        elif os.path.exists("/usr/lib/freecad"):
+            freecad_name = "freecad"
+        
+        sys.path.insert(0, "/usr/lib/python3/dist-packages")
+
+        if freecad_name is not None:
+            sys.path.append(f"/usr/lib/{freecad_name}/lib")
+            sys.path.append(f"/usr/share/{freecad_name}/Ext")
+            sys.path.append(f"/usr/share/{freecad_name}/Mod")
+            sys.path.append(f"/usr/share/{freecad_name}/Mod/Part")
+            sys.path.append(f"/usr/share/{freecad_name}/Mod/Draft")
+            sys.path.append(f"/usr/share/{freecad_name}/Mod/Draft/draftobjects")
+            # Comment line 31 from /usr/share/freecad-daily/Mod/Draft/draftutils/params.py if it crashes at import
+        else:
+            sys.path.append("/usr/local/lib")
+            sys.path.append("/usr/local/Ext")
+            sys.path.append("/usr/local/Mod")
+            sys.path.append("/usr/local/Mod/Part")
+            sys.path.append("/usr/local/Mod/Draft")
+            sys.path.append("/usr/local/Mod/Draft/draftobjects")
+
+            # Comment line 31 from /usr/local/Mod/Draft/draftutils/params.py if it crashes at import
+            # import Arch_rc
+
+
+add_freecad_to_path()
+
+try:
+    import FreeCAD
+    import TechDraw
+except ImportError:
+    FreeCAD = TechDraw = None
+    _ORIGIN = _Z_AXIS = _Y_AXIS = _NEGATIVE_X_AXIS = _NEGATIVE_Y_AXIS = _IDENTITY_ROT = _QUARTER_TURN_ROT = None
+else:
+    # Orientation constants shared by every sketch and placement; FreeCAD copies them on assignment
+    _ORIGIN = FreeCAD.Vector(0, 0, 0)
+    _Z_AXIS = FreeCAD.Vector(0, 0, 1)
+    # Directions the technical drawing views look along
+    _Y_AXIS = FreeCAD.Vector(0, 1, 0)
+    _NEGATIVE_X_AXIS = FreeCAD.Vector(-1, 0, 0)
+    _NEGATIVE_Y_AXIS = FreeCAD.Vector(0, -1, 0)
+    _IDENTITY_ROT = FreeCAD.Rotation()
+    # Turns about the Z axis (yaw), used to orient the cylinders and tubes
+    _QUARTER_TURN_ROT = FreeCAD.Rotation(90, 0, 0)
+
+# Part.makeBox lists its edges in a fixed order, Edge1, Edge3, Edge5 and Edge7 being the ones parallel to Z
+_BOX_VERTICAL_EDGES = (0, 2, 4, 6)
+
+
+_DIMENSION_PATH = "M%s,%s L%s,%s M%s,%s L%s,%s M%s,%s L%s,%s"
+_DIMENSION_ARROW_PATH = "M0,0 L%s,%s L%s,%s L0,0"
+_DIMENSION_LABEL_Y_SVG = (
+    '   <g font-size="29.1042" font-style="normal" stroke-opacity="1" fill="none" font-family="MS Shell Dlg 2" stroke="%(color)s" stroke-width="1" font-weight="400" transform="matrix(1,0,0,1,%(label_x)s,%(label_y)s)" stroke-linecap="square" stroke-linejoin="bevel">\n'
+    '     <text x="0" y="0" text-anchor="middle" fill-opacity="1" font-size="%(font_size)s" font-style="normal" fill="%(color)s" font-family="osifont" stroke="none" xml:space="preserve" font-weight="400" transform="rotate(-90)">%(label)s</text>\n'
+    '    </g>\n'
+)
+_DIMENSION_LABEL_X_SVG = (
+    '   <g font-size="29.1042" font-style="normal" stroke-opacity="1" fill="none" font-family="MS Shell Dlg 2" stroke="%(color)s" stroke-width="1" font-weight="400" transform="matrix(1,0,0,1,%(label_x)s,%(label_y)s)" stroke-linecap="square" stroke-linejoin="bevel">\n'
+    '     <text x="0" y="%(text_y)s" text-anchor="middle" fill-opacity="1" font-size="%(font_size)s" font-style="normal" fill="%(color)s" font-family="osifont" stroke="none" xml:space="preserve" font-weight="400">%(label)s</text>\n'
+    '    </g>\n'
+)
+_DIMENSION_LINES_SVG = (
+    '   <g font-size="29.1042" font-style="normal" stroke-opacity="1" fill="none" font-family="MS Shell Dlg 2" stroke="%(color)s" stroke-width="%(line_thickness)s" font-weight="400" transform="matrix(1,0,0,1,%(view_x)s,%(view_y)s)" stroke-linecap="round" stroke-linejoin="bevel">\n'
+    '     <path fill-rule="evenodd" vector-effect="none" d="%(path)s"/>\n'
+    '   </g>\n'
+)
+_DIMENSION_ARROWS_SVG = (
+    '   <g font-size="29.1042" font-style="normal" stroke-opacity="1" fill="none" font-family="MS Shell Dlg 2" stroke="%(color)s" stroke-width="%(line_thickness)s" font-weight="400" transform="matrix(1,0,0,1,%(view_x)s,%(view_y)s)" stroke-linecap="round" stroke-linejoin="bevel">\n'
+    '    <g fill-opacity="1" font-size="29.1042" font-style="normal" stroke-opacity="1" fill="%(color)s" font-family="MS Shell Dlg 2" stroke="%(color)s" stroke-width="1" font-weight="400" transform="matrix(1,0,0,1,%(ending_arrow_x)s,%(ending_arrow_y)s)" stroke-linecap="round" stroke-linejoin="bevel">\n'
+    '     <path fill-rule="evenodd" vector-effect="none" d="%(ending_arrow)s"/>\n'
+    '    </g>\n'
+    '    <g fill-opacity="1" font-size="29.1042" font-style="normal" stroke-opacity="1" fill="%(color)s" font-family="MS Shell Dlg 2" stroke="%(color)s" stroke-width="1" font-weight="400" transform="matrix(1,0,0,1,%(starting_arrow_x)s,%(starting_arrow_y)s)" stroke-linecap="round" stroke-linejoin="bevel">\n'
+    '     <path fill-rule="evenodd" vector-effect="none" d="%(starting_arrow)s"/>\n'
+    '    </g>\n'
+    '   </g>\n'
+)
+
+
+def new_document(name):
+    # Hidden documents get no view providers if FreeCADGui happens to be loaded, and with undo
+    # disabled property changes are not recorded as transactions; nobody looks at or undoes these
+    document = FreeCAD.newDocument(name, hidden=True)
+    document.UndoMode = 0
+    return document
+
+
+# Characters that cannot appear in project names, replaced in a single pass
+_NAME_TABLE = str.maketrans({" ": "_", "-": "_", "/": "_", ".": "__"})
+
+
 def flatten_dimensions(data):
     dimensions = data["dimensions"]
+    flat_dimensions = {}
     for k, v in dimensions.items():
         if isinstance(v, dict):
             if "nominal" not in v or v["nominal"] is None:
@@ -26,8 +145,18 @@ def flatten_dimensions(data):
                 else:
                     v["nominal"] = round((v["maximum"] + v["minimum"]) / 2, 6)
         else:
-            dimensions[k] = {"nominal": v}
-    return {k: v["nominal"] * 1000 for k, v in dimensions.items() if k != 'alpha'}
+            v = {"nominal": v}
+            dimensions[k] = v
+        if k != 'alpha':
+            flat_dimensions[k] = v["nominal"] * 1000
+    return flat_dimensions
+
+
+def copy_shape_data(data):
+    # flatten_dimensions only rewrites the dimensions entries, so those are the only ones that need their own copy
+    shape_data = data.copy()
+    shape_data["dimensions"] = {k: (v.copy() if isinstance(v, dict) else v) for k, v in data["dimensions"].items()}
+    return shape_data
 
 
 class FreeCADBuilder:
@@ -37,90 +166,55 @@ class FreeCADBuilder:
     """
 
     def __init__(self):
-        self.shapers = {
-            utils.ShapeFamily.ETD: self.Etd(),
-            utils.ShapeFamily.ER: self.Er(),
-            utils.ShapeFamily.EP: self.Ep(),
-            utils.ShapeFamily.EPX: self.Epx(),
-            utils.ShapeFamily.PQ: self.Pq(),
-            utils.ShapeFamily.E: self.E(),
-            utils.ShapeFamily.PM: self.Pm(),
-            utils.ShapeFamily.P: self.P(),
-            utils.ShapeFamily.RM: self.Rm(),
-            utils.ShapeFamily.EQ: self.Eq(),
-            utils.ShapeFamily.LP: self.Lp(),
-            utils.ShapeFamily.PLANAR_ER: self.Er(),
-            utils.ShapeFamily.PLANAR_E: self.E(),
-            utils.ShapeFamily.PLANAR_EL: self.El(),
-            utils.ShapeFamily.EC: self.Ec(),
-            utils.ShapeFamily.EFD: self.Efd(),
-            utils.ShapeFamily.U: self.U(),
-            utils.ShapeFamily.UR: self.Ur(),
-            utils.ShapeFamily.UT: self.Ut(),
-            utils.ShapeFamily.T: self.T()
-        }
-
-        if platform.system() == "Windows":
-            if os.path.exists(f"{os.getenv('LOCALAPPDATA')}\\Programs\\FreeCAD 1.0"):
-                freecad_path = f"{os.getenv('LOCALAPPDATA')}\\Programs\\FreeCAD 1.0"
-            elif os.path.exists(f"{os.environ['ProgramFiles']}\\FreeCAD 1.0"):
-                freecad_path = f"{os.environ['ProgramFiles']}\\FreeCAD 1.0"
-            elif os.path.exists(f"{os.getenv('LOCALAPPDATA')}\\Programs\\FreeCAD 0.21"):
-                freecad_path = f"{os.getenv('LOCALAPPDATA')}\\Programs\\FreeCAD 0.21"
-            elif os.path.exists(f"{os.environ['ProgramFiles']}\\FreeCAD 0.21"):
-                freecad_path = f"{os.environ['ProgramFiles']}\\FreeCAD 0.21"
-
-            sys.path.insert(0, f"{freecad_path}\\bin\\Lib\\site-packages")
-            sys.path.append(f"{freecad_path}\\bin")
-            sys.path.append(f"{freecad_path}\\Ext")
-            sys.path.append(f"{freecad_path}\\Mod")
-            sys.path.append(f"{freecad_path}\\Mod\\Draft")
-            sys.path.append(f"{freecad_path}\\Mod\\Part")
-            sys.path.append(f"{freecad_path}\\Mod\\PartDesign")
-            sys.path.append(f"{freecad_path}\\Mod\\Sketcher")
-            sys.path.append(f"{freecad_path}\\Mod\\Arch")
-        else:
-            freecad_name = None
-            if os.path.exists("/usr/lib/freecad-daily"):
-                freecad_name = "freecad-daily"
-            elif os.path.exists("/usr/lib/freecad"):
-                freecad_name = "freecad"
-            
-            sys.path.insert(0, "/usr/lib/python3/dist-packages")
-
-            if freecad_name is not None:
-                sys.path.append(f"/usr/lib/{freecad_name}/lib")
-                sys.path.append(f"/usr/share/{freecad_name}/Ext")
-                sys.path.append(f"/usr/share/{freecad_name}/Mod")
-                sys.path.append(f"/usr/share/{freecad_name}/Mod/Part")
-                sys.path.append(f"/usr/share/{freecad_name}/Mod/Draft")
-                sys.path.append(f"/usr/share/{freecad_name}/Mod/Draft/draftobjects")
-                # Comment line 31 from /usr/share/freecad-daily/Mod/Draft/draftutils/params.py if it crashes at import
-            else:
-                sys.path.append("/usr/local/lib")
-                sys.path.append("/usr/local/Ext")
-                sys.path.append("/usr/local/Mod")
-                sys.path.append("/usr/local/Mod/Part")
-                sys.path.append("/usr/local/Mod/Draft")
-                sys.path.append("/usr/local/Mod/Draft/draftobjects")
-
-                # Comment line 31 from /usr/local/Mod/Draft/draftutils/params.py if it crashes at import
-                # import Arch_rc
+        if FreeCAD is None:
+            raise ImportError("FreeCAD could not be imported, check that it is installed")
+        self._shapers = None
+        self._families = None
+
+    @property
+    def shapers(self):
+        # Built on first use, so creating a builder stays cheap until a piece is actually needed
+        if self._shapers is None:
+            self._shapers = {
+                utils.ShapeFamily.ETD: self.Etd(),
+                utils.ShapeFamily.ER: self.Er(),
+                utils.ShapeFamily.EP: self.Ep(),
+                utils.ShapeFamily.EPX: self.Epx(),
+                utils.ShapeFamily.PQ: self.Pq(),
+                utils.ShapeFamily.E: self.E(),
+                utils.ShapeFamily.PM: self.Pm(),
+                utils.ShapeFamily.P: self.P(),
+                utils.ShapeFamily.RM: self.Rm(),
+                utils.ShapeFamily.EQ: self.Eq(),
+                utils.ShapeFamily.LP: self.Lp(),
+                utils.ShapeFamily.PLANAR_ER: self.Er(),
+                utils.ShapeFamily.PLANAR_E: self.E(),
+                utils.ShapeFamily.PLANAR_EL: self.El(),
+                utils.ShapeFamily.EC: self.Ec(),
+                utils.ShapeFamily.EFD: self.Efd(),
+                utils.ShapeFamily.U: self.U(),
+                utils.ShapeFamily.UR: self.Ur(),
+                utils.ShapeFamily.UT: self.Ut(),
+                utils.ShapeFamily.T: self.T()
+            }
+        return self._shapers
 
     def factory(self, data):
-        family = utils.ShapeFamily[data['family'].upper().replace(" ", "_")]
-        return self.shapers[family]
+        return self.shapers[utils.get_shape_family(data['family'])]
 
     def get_families(self):
+        # The families and their dimensions never change, so they are gathered once and every caller gets its own copy
+        if self._families is None:
+            self._families = {
+                family.name.lower().replace("_", " "): shaper.get_dimensions_and_subtypes()
+                for family, shaper in self.shapers.items()
+            }
         return {
-            shaper.name.lower()
-            .replace("_", " "): self.factory({'family': shaper.name})
-            .get_dimensions_and_subtypes()
-            for shaper in self.shapers
+            family: {subtype: list(dimensions) for subtype, dimensions in subtypes.items()}
+            for family, subtypes in self._families.items()
         }
 
     def get_spacer(self, geometrical_data):
-        import FreeCAD
         document = FreeCAD.ActiveDocument
         document.recompute()
 
@@ -131,7 +225,7 @@ class FreeCADBuilder:
         spacer.Placement = FreeCAD.Placement(FreeCAD.Vector((geometrical_data["coordinates"][2] - geometrical_data["dimensions"][2] / 2) * 1000,
                                                             (geometrical_data["coordinates"][0] - geometrical_data["dimensions"][0] / 2) * 1000,
                                                             (geometrical_data["coordinates"][1] - geometrical_data["dimensions"][1] / 2) * 1000),
-                                             FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
+                                             _IDENTITY_ROT)
 
         document.recompute()
         m = spacer.Placement.Matrix
@@ -142,18 +236,17 @@ class FreeCADBuilder:
         document.recompute()
         return spacer
 
-    def get_core(self, project_name, geometrical_description, output_path=f'{os.path.dirname(os.path.abspath(__file__))}/../../output/', save_files=True, export_files=True):
-        import FreeCAD
+    def get_core(self, project_name, geometrical_description, output_path=utils.default_output_path, save_files=True, export_files=True):
         try:
             pieces_to_export = []
-            project_name = f"{project_name}_core".replace(" ", "_").replace("-", "_").replace("/", "_").replace(".", "__")
+            project_name = f"{project_name}_core".translate(_NAME_TABLE)
 
             os.makedirs(output_path, exist_ok=True)
 
             close_file_after_finishing = False
             if FreeCAD.ActiveDocument is None:
                 close_file_after_finishing = True
-                FreeCAD.newDocument(project_name)
+                new_document(project_name)
 
             document = FreeCAD.ActiveDocument
 
@@ -163,9 +256,11 @@ class FreeCADBuilder:
                     pieces_to_export.append(spacer)
                 elif geometrical_part['type'] in ['half set', 'toroidal']:
                     shape_data = geometrical_part['shape']
-                    part_builder = FreeCADBuilder().factory(shape_data)
+                    # The shapers are shared by every call, so the output path left by a previous one is reset
+                    part_builder = self.factory(shape_data)
+                    part_builder.set_output_path(output_path)
 
-                    piece = part_builder.get_piece(data=copy.deepcopy(shape_data),
+                    piece = part_builder.get_piece(data=copy_shape_data(shape_data),
                                                    name=f"Piece_{index}",
                                                    save_files=False,
                                                    export_files=False)
@@ -175,14 +270,13 @@ class FreeCADBuilder:
                     m.rotateY(geometrical_part['rotation'][0])
                     m.rotateZ(geometrical_part['rotation'][1])
                     piece.Placement.Matrix = m
-                    document.recompute()
 
                     if 'machining' in geometrical_part and geometrical_part['machining'] is not None:
+                        dimensions = flatten_dimensions(shape_data)
                         for machining in geometrical_part['machining']:
                             piece = part_builder.apply_machining(piece=piece,
                                                                  machining=machining,
-                                                                 dimensions=flatten_dimensions(shape_data))
-                        document.recompute()
+                                                                 dimensions=dimensions)
 
                     piece.Placement.move(FreeCAD.Vector(geometrical_part['coordinates'][2] * 1000,
                                                         geometrical_part['coordinates'][0] * 1000,
@@ -196,10 +290,10 @@ class FreeCADBuilder:
                         else:
                             piece.Placement.move(FreeCAD.Vector(0, 0, -residual_gap / 2 * 1000))
 
-                    document.recompute()
-
                     pieces_to_export.append(piece)
 
+            document.recompute()
+
             if export_files:
                 for index, piece in enumerate(pieces_to_export):
                     piece.Label = f"core_part_{index}"
@@ -227,8 +321,7 @@ class FreeCADBuilder:
                 FreeCAD.closeDocument(project_name)
             return None, None
 
-    def get_core_gapping_technical_drawing(self, project_name, core_data, colors=None, output_path=f'{os.path.dirname(os.path.abspath(__file__))}/../../output/', save_files=True, export_files=True):
-        import FreeCAD
+    def get_core_gapping_technical_drawing(self, project_name, core_data, colors=None, output_path=utils.default_output_path, save_files=True, export_files=True):
 
         def calculate_total_dimensions(margin):
             base_width = 0
@@ -249,13 +342,13 @@ class FreeCADBuilder:
             return base_width, base_height
 
         try:
-            project_name = f"{project_name}_core_gaps_FrontView".replace(" ", "_").replace("-", "_").replace("/", "_").replace(".", "__")
+            project_name = f"{project_name}_core_gaps_FrontView".translate(_NAME_TABLE)
             geometrical_description = core_data['geometricalDescription']
 
             close_file_after_finishing = False
             if FreeCAD.ActiveDocument is None:
                 close_file_after_finishing = True
-                FreeCAD.newDocument(project_name)
+                new_document(project_name)
 
             document = FreeCAD.ActiveDocument
 
@@ -293,9 +386,9 @@ class FreeCADBuilder:
                     "dimension_color": "#000000"
                 }
 
-            core = FreeCAD.ActiveDocument.addObject("Part::MultiFuse", "Core")
+            core = document.addObject("Part::MultiFuse", "Core")
             core.Shapes = pieces
-            FreeCAD.ActiveDocument.recompute()
+            document.recompute()
 
             core = self.cut_piece_in_half(core)
 
@@ -314,7 +407,6 @@ class FreeCADBuilder:
             return {"top_view": None, "front_view": None}
 
     def cut_piece_in_half(self, piece):
-        import FreeCAD
         document = FreeCAD.ActiveDocument
 
         half_volume = document.addObject("Part::Box", "half_volume")
@@ -323,7 +415,7 @@ class FreeCADBuilder:
         half_volume.Length = size
         half_volume.Width = size
         half_volume.Height = size
-        half_volume.Placement = FreeCAD.Placement(FreeCAD.Vector(-size, -size / 2, -size / 2), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
+        half_volume.Placement = FreeCAD.Placement(FreeCAD.Vector(-size, -size / 2, -size / 2), _IDENTITY_ROT)
 
         piece_cut = document.addObject("Part::Cut", "Core")
         piece_cut.Base = piece
@@ -333,58 +425,55 @@ class FreeCADBuilder:
         return piece_cut
 
     def add_dimensions_and_export_view(self, core_data, scale, base_height, base_width, view, project_name, margin, colors, save_files, core):
-        import FreeCAD
         import Draft
-        import TechDraw
 
         def create_dimension(starting_coordinates, ending_coordinates, dimension_type, dimension_label, label_offset=0, label_alignment=0):
-            dimension_svg = ""
+            dimension_svg = []
+            starting_x, starting_y = starting_coordinates
+            ending_x, ending_y = ending_coordinates
+            fields = {
+                'color': colors['dimension_color'],
+                'font_size': dimension_font_size,
+                'line_thickness': dimension_line_thickness,
+                'view_x': view.X.Value,
+                'view_y': 1000 - view.Y.Value,
+                'label': dimension_label,
+            }
 
             if dimension_type == "DistanceY":
-                main_line_start = [starting_coordinates[0] + label_offset, starting_coordinates[1]]
-                main_line_end = [ending_coordinates[0] + label_offset, ending_coordinates[1]]
-                left_aux_line_start = [starting_coordinates[0], starting_coordinates[1]]
-                left_aux_line_end = [starting_coordinates[0] + label_offset, starting_coordinates[1]]
-                right_aux_line_start = [ending_coordinates[0], ending_coordinates[1]]
-                right_aux_line_end = [ending_coordinates[0] + label_offset, ending_coordinates[1]]
-
-                dimension_svg += f"""   <g font-size="29.1042" font-style="normal" stroke-opacity="1" fill="none" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="1" font-weight="400" transform="matrix(1,0,0,1,{view.X.Value + ending_coordinates[0] + label_offset - dimension_font_size / 4},{1000 - view.Y.Value + label_alignment})" stroke-linecap="square" stroke-linejoin="bevel">
-                                         <text x="0" y="0" text-anchor="middle" fill-opacity="1" font-size="{dimension_font_size}" font-style="normal" fill="{colors['dimension_color']}" font-family="osifont" stroke="none" xml:space="preserve" font-weight="400" transform="rotate(-90)">{dimension_label}</text>
-                                        </g>\n""".replace("                                    ", "")
-                dimension_svg += f"""   <g font-size="29.1042" font-style="normal" stroke-opacity="1" fill="none" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="{dimension_line_thickness}" font-weight="400" transform="matrix(1,0,0,1,{view.X.Value},{1000 - view.Y.Value})" stroke-linecap="round" stroke-linejoin="bevel">
-                                          <path fill-rule="evenodd" vector-effect="none" d="M{main_line_start[0]},{main_line_start[1]} L{main_line_end[0]},{main_line_end[1]} M{left_aux_line_start[0]},{left_aux_line_start[1]} L{left_aux_line_end[0]},{left_aux_line_end[1]} M{right_aux_line_start[0]},{right_aux_line_start[1]} L{right_aux_line_end[0]},{right_aux_line_end[1]}"/>
-                                        </g>\n""".replace("                                     ", "")
-                dimension_svg += f"""   <g font-size="29.1042" font-style="normal" stroke-opacity="1" fill="none" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="{dimension_line_thickness}" font-weight="400" transform="matrix(1,0,0,1,{view.X.Value},{1000 - view.Y.Value})" stroke-linecap="round" stroke-linejoin="bevel">
-                                         <g fill-opacity="1" font-size="29.1042" font-style="normal" stroke-opacity="1" fill="{colors['dimension_color']}" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="1" font-weight="400" transform="matrix(1,0,0,1,{ending_coordinates[0] + label_offset},{ending_coordinates[1]})" stroke-linecap="round" stroke-linejoin="bevel">
-                                          <path fill-rule="evenodd" vector-effect="none" d="M0,0 L3,-10 L-3,-10 L0,0"/>
-                                         </g>
-                                         <g fill-opacity="1" font-size="29.1042" font-style="normal" stroke-opacity="1" fill="{colors['dimension_color']}" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="1" font-weight="400" transform="matrix(1,0,0,1,{starting_coordinates[0] + label_offset},{starting_coordinates[1]})" stroke-linecap="round" stroke-linejoin="bevel">
-                                          <path fill-rule="evenodd" vector-effect="none" d="M0,0 L-3,10 L3,10 L0,0"/>
-                                         </g>
-                                        </g>\n""".replace("                                     ", "")
+                offset_starting_x = starting_x + label_offset
+                offset_ending_x = ending_x + label_offset
+                fields['label_x'] = view.X.Value + offset_ending_x - dimension_font_size / 4
+                fields['label_y'] = 1000 - view.Y.Value + label_alignment
+                fields['path'] = _DIMENSION_PATH % (offset_starting_x, starting_y, offset_ending_x, ending_y, starting_x, starting_y, offset_starting_x, starting_y, ending_x, ending_y, offset_ending_x, ending_y)
+                fields['ending_arrow_x'] = offset_ending_x
+                fields['ending_arrow_y'] = ending_y
+                fields['ending_arrow'] = _DIMENSION_ARROW_PATH % (3, -10, -3, -10)
+                fields['starting_arrow_x'] = offset_starting_x
+                fields['starting_arrow_y'] = starting_y
+                fields['starting_arrow'] = _DIMENSION_ARROW_PATH % (-3, 10, 3, 10)
+
+                dimension_svg.append(_DIMENSION_LABEL_Y_SVG % fields)
+                dimension_svg.append(_DIMENSION_LINES_SVG % fields)
+                dimension_svg.append(_DIMENSION_ARROWS_SVG % fields)
             elif dimension_type == "DistanceX":
-                main_line_start = [starting_coordinates[0], starting_coordinates[1] + label_offset]
-                main_line_end = [ending_coordinates[0], ending_coordinates[1] + label_offset]
-                left_aux_line_start = [starting_coordinates[0], starting_coordinates[1]]
-                left_aux_line_end = [starting_coordinates[0], starting_coordinates[1] + label_offset]
-                right_aux_line_start = [ending_coordinates[0], ending_coordinates[1]]
-                right_aux_line_end = [ending_coordinates[0], ending_coordinates[1] + label_offset]
-
-                dimension_svg += f"""   <g font-size="29.1042" font-style="normal" stroke-opacity="1" fill="none" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="1" font-weight="400" transform="matrix(1,0,0,1,{view.X.Value},{1000 - view.Y.Value})" stroke-linecap="square" stroke-linejoin="bevel">
-                                         <text x="0" y="{ending_coordinates[1] + label_offset - dimension_font_size / 4}" text-anchor="middle" fill-opacity="1" font-size="{dimension_font_size}" font-style="normal" fill="{colors['dimension_color']}" font-family="osifont" stroke="none" xml:space="preserve" font-weight="400">{dimension_label}</text>
-                                        </g>\n""".replace("                                    ", "")
-                dimension_svg += f"""   <g font-size="29.1042" font-style="normal" stroke-opacity="1" fill="none" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="{dimension_line_thickness}" font-weight="400" transform="matrix(1,0,0,1,{view.X.Value},{1000 - view.Y.Value})" stroke-linecap="round" stroke-linejoin="bevel">
-                                          <path fill-rule="evenodd" vector-effect="none" d="M{main_line_start[0]},{main_line_start[1]} L{main_line_end[0]},{main_line_end[1]} M{left_aux_line_start[0]},{left_aux_line_start[1]} L{left_aux_line_end[0]},{left_aux_line_end[1]} M{right_aux_line_start[0]},{right_aux_line_start[1]} L{right_aux_line_end[0]},{right_aux_line_end[1]}"/>
-                                        </g>\n""".replace("                                     ", "")
-                dimension_svg += f"""   <g font-size="29.1042" font-style="normal" stroke-opacity="1" fill="none" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="{dimension_line_thickness}" font-weight="400" transform="matrix(1,0,0,1,{view.X.Value},{1000 - view.Y.Value})" stroke-linecap="round" stroke-linejoin="bevel">
-                                         <g fill-opacity="1" font-size="29.1042" font-style="normal" stroke-opacity="1" fill="{colors['dimension_color']}" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="1" font-weight="400" transform="matrix(1,0,0,1,{ending_coordinates[0]},{ending_coordinates[1] + label_offset})" stroke-linecap="round" stroke-linejoin="bevel">
-                                          <path fill-rule="evenodd" vector-effect="none" d="M0,0 L-10,-3 L-10,3 L0,0"/>
-                                         </g>
-                                         <g fill-opacity="1" font-size="29.1042" font-style="normal" stroke-opacity="1" fill="{colors['dimension_color']}" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="1" font-weight="400" transform="matrix(1,0,0,1,{starting_coordinates[0]},{starting_coordinates[1] + label_offset})" stroke-linecap="round" stroke-linejoin="bevel">
-                                          <path fill-rule="evenodd" vector-effect="none" d="M0,0 L10,3 L10,-3 L0,0"/>
-                                         </g>
-                                        </g>\n""".replace("                                     ", "")
-            return dimension_svg
+                offset_starting_y = starting_y + label_offset
+                offset_ending_y = ending_y + label_offset
+                fields['label_x'] = view.X.Value
+                fields['label_y'] = 1000 - view.Y.Value
+                fields['text_y'] = offset_ending_y - dimension_font_size / 4
+                fields['path'] = _DIMENSION_PATH % (starting_x, offset_starting_y, ending_x, offset_ending_y, starting_x, starting_y, starting_x, offset_starting_y, ending_x, ending_y, ending_x, offset_ending_y)
+                fields['ending_arrow_x'] = ending_x
+                fields['ending_arrow_y'] = offset_ending_y
+                fields['ending_arrow'] = _DIMENSION_ARROW_PATH % (-10, -3, -10, 3)
+                fields['starting_arrow_x'] = starting_x
+                fields['starting_arrow_y'] = offset_starting_y
+                fields['starting_arrow'] = _DIMENSION_ARROW_PATH % (10, 3, 10, -3)
+
+                dimension_svg.append(_DIMENSION_LABEL_X_SVG % fields)
+                dimension_svg.append(_DIMENSION_LINES_SVG % fields)
+                dimension_svg.append(_DIMENSION_ARROWS_SVG % fields)
+            return "".join(dimension_svg)
 
         projection_line_thickness = 4
         dimension_line_thickness = 1
@@ -407,9 +496,7 @@ class FreeCADBuilder:
                  </g>
                 </svg>
                 """.replace("                ", "")
-        svgFile_data = ""
-        svgFile_data += head
-        svgFile_data += projetion_head
+        svg_parts = [head, projetion_head]
 
         piece = Draft.scale(core, FreeCAD.Vector(scale, scale, scale))
 
@@ -423,9 +510,9 @@ class FreeCADBuilder:
         m.rotateY(math.radians(90))
         piece.Placement.Matrix = m
 
-        svgFile_data += TechDraw.projectToSVG(piece.Shape, FreeCAD.Vector(0., 1., 0.)).replace("><", ">\n<").replace("<", "    <").replace("stroke-width=\"0.7\"", f"stroke-width=\"{projection_line_thickness}\"").replace("#000000", colors['projection_color']).replace("rgb(0, 0, 0)", colors['projection_color'])
+        svg_parts.append(TechDraw.projectToSVG(piece.Shape, _Y_AXIS).replace("><", ">\n<").replace("<", "    <").replace("stroke-width=\"0.7\"", f"stroke-width=\"{projection_line_thickness}\"").replace("#000000", colors['projection_color']).replace("rgb(0, 0, 0)", colors['projection_color']))
 
-        svgFile_data += projetion_tail
+        svg_parts.append(projetion_tail)
         geometrical_description = core_data['geometricalDescription']
 
         center_offset = 0
@@ -474,11 +561,11 @@ class FreeCADBuilder:
                         dimension_label = f"{round(gap['length'] * 1000000, 2)} μm"
                     else:
                         dimension_label = f"{round(gap['length'] * 1000, 2)} mm"
-                    svgFile_data += create_dimension(starting_coordinates=[(gap['coordinates'][0] * 1000 + center_offset) * scale, -gap['length'] * scale * 1000 / 2],
-                                                     ending_coordinates=[(gap['coordinates'][0] * 1000 + center_offset) * scale, gap['length'] * scale * 1000 / 2],
-                                                     dimension_type="DistanceY",
-                                                     dimension_label=dimension_label,
-                                                     label_offset=min(base_width / 2, gap['sectionDimensions'][0] / 2 * scale * 1000 + horizontal_offset_gaps))
+                    svg_parts.append(create_dimension(starting_coordinates=[(gap['coordinates'][0] * 1000 + center_offset) * scale, -gap['length'] * scale * 1000 / 2],
+                                                      ending_coordinates=[(gap['coordinates'][0] * 1000 + center_offset) * scale, gap['length'] * scale * 1000 / 2],
+                                                      dimension_type="DistanceY",
+                                                      dimension_label=dimension_label,
+                                                      label_offset=min(base_width / 2, gap['sectionDimensions'][0] / 2 * scale * 1000 + horizontal_offset_gaps)))
 
                 if gap['sectionDimensions'] is None:
                     continue
@@ -488,24 +575,24 @@ class FreeCADBuilder:
                         dimension_label = f"{round(gap['length'] * 1000000, 2)} μm"
                     else:
                         dimension_label = f"{round(gap['length'] * 1000, 2)} mm"
-                    svgFile_data += create_dimension(starting_coordinates=[(gap['coordinates'][0] * 1000 + center_offset) * scale, (-gap['length'] / 2 - gap['coordinates'][1]) * scale * 1000],
-                                                     ending_coordinates=[(gap['coordinates'][0] * 1000 + center_offset) * scale, (gap['length'] / 2 - gap['coordinates'][1]) * scale * 1000],
-                                                     dimension_type="DistanceY",
-                                                     dimension_label=dimension_label,
-                                                     label_offset=min(base_width / 2, gap['sectionDimensions'][0] / 2 * scale * 1000 + horizontal_offset_gaps),
-                                                     label_alignment=-gap['coordinates'][1] * scale * 1000)
+                    svg_parts.append(create_dimension(starting_coordinates=[(gap['coordinates'][0] * 1000 + center_offset) * scale, (-gap['length'] / 2 - gap['coordinates'][1]) * scale * 1000],
+                                                      ending_coordinates=[(gap['coordinates'][0] * 1000 + center_offset) * scale, (gap['length'] / 2 - gap['coordinates'][1]) * scale * 1000],
+                                                      dimension_type="DistanceY",
+                                                      dimension_label=dimension_label,
+                                                      label_offset=min(base_width / 2, gap['sectionDimensions'][0] / 2 * scale * 1000 + horizontal_offset_gaps),
+                                                      label_alignment=-gap['coordinates'][1] * scale * 1000))
                     if len(gaps_per_column) > 1 and gap_index < len(gaps_per_column) - 1:
                         next_gap = gaps_per_column[gap_index + 1]
                         chunk_size = (-gap['length'] / 2 - gap['coordinates'][1]) - (next_gap['length'] / 2 - next_gap['coordinates'][1])
                         dimension_label = f"{round(chunk_size * 1000, 2)}"
                         if chunk_size * 1000 * scale > 70:
                             dimension_label += " mm"
-                        svgFile_data += create_dimension(ending_coordinates=[((gap['coordinates'][0] + gap['sectionDimensions'][0] / 2) * 1000 + center_offset) * scale, (-gap['length'] / 2 - gap['coordinates'][1]) * scale * 1000],
-                                                         starting_coordinates=[((gap['coordinates'][0] + gap['sectionDimensions'][0] / 2) * 1000 + center_offset) * scale, (next_gap['length'] / 2 - next_gap['coordinates'][1]) * scale * 1000],
-                                                         dimension_type="DistanceY",
-                                                         dimension_label=dimension_label,
-                                                         label_offset=min(base_width / 2, horizontal_offset),
-                                                         label_alignment=(-gap['coordinates'][1] - gap['length'] / 2 - chunk_size / 2) * scale * 1000)
+                        svg_parts.append(create_dimension(ending_coordinates=[((gap['coordinates'][0] + gap['sectionDimensions'][0] / 2) * 1000 + center_offset) * scale, (-gap['length'] / 2 - gap['coordinates'][1]) * scale * 1000],
+                                                          starting_coordinates=[((gap['coordinates'][0] + gap['sectionDimensions'][0] / 2) * 1000 + center_offset) * scale, (next_gap['length'] / 2 - next_gap['coordinates'][1]) * scale * 1000],
+                                                          dimension_type="DistanceY",
+                                                          dimension_label=dimension_label,
+                                                          label_offset=min(base_width / 2, horizontal_offset),
+                                                          label_alignment=(-gap['coordinates'][1] - gap['length'] / 2 - chunk_size / 2) * scale * 1000))
 
                     if len(gaps_per_column) > 1 and gap_index < len(gaps_per_column) - 1:
                         next_gap = gaps_per_column[gap_index + 1]
@@ -513,43 +600,43 @@ class FreeCADBuilder:
                         dimension_label = f"{round(chunk_size * 1000, 2)}"
                         if chunk_size * 1000 * scale > 70:
                             dimension_label += " mm"
-                        svgFile_data += create_dimension(ending_coordinates=[((gap['coordinates'][0] + gap['sectionDimensions'][0] / 2) * 1000 + center_offset) * scale, (-gap['length'] / 2 - gap['coordinates'][1]) * scale * 1000],
-                                                         starting_coordinates=[((gap['coordinates'][0] + gap['sectionDimensions'][0] / 2) * 1000 + center_offset) * scale, (next_gap['length'] / 2 - next_gap['coordinates'][1]) * scale * 1000],
-                                                         dimension_type="DistanceY",
-                                                         dimension_label=dimension_label,
-                                                         label_offset=min(base_width / 2, horizontal_offset),
-                                                         label_alignment=(-gap['coordinates'][1] - gap['length'] / 2 - chunk_size / 2) * scale * 1000)
+                        svg_parts.append(create_dimension(ending_coordinates=[((gap['coordinates'][0] + gap['sectionDimensions'][0] / 2) * 1000 + center_offset) * scale, (-gap['length'] / 2 - gap['coordinates'][1]) * scale * 1000],
+                                                          starting_coordinates=[((gap['coordinates'][0] + gap['sectionDimensions'][0] / 2) * 1000 + center_offset) * scale, (next_gap['length'] / 2 - next_gap['coordinates'][1]) * scale * 1000],
+                                                          dimension_type="DistanceY",
+                                                          dimension_label=dimension_label,
+                                                          label_offset=min(base_width / 2, horizontal_offset),
+                                                          label_alignment=(-gap['coordinates'][1] - gap['length'] / 2 - chunk_size / 2) * scale * 1000))
 
                     if len(gaps_per_column) > 1 and gap_index == 0:
                         chunk_size = column_semi_height - (gap['length'] / 2 - gap['coordinates'][1])
                         dimension_label = f"{round(chunk_size * 1000, 2)}"
                         if chunk_size * 1000 * scale > 70:
                             dimension_label += " mm"
-                        svgFile_data += create_dimension(starting_coordinates=[((gap['coordinates'][0] + gap['sectionDimensions'][0] / 2) * 1000 + center_offset) * scale, (gap['length'] / 2 - gap['coordinates'][1]) * scale * 1000],
-                                                         ending_coordinates=[((gap['coordinates'][0] + gap['sectionDimensions'][0] / 2) * 1000 + center_offset) * scale, column_semi_height * scale * 1000],
-                                                         dimension_type="DistanceY",
-                                                         dimension_label=dimension_label,
-                                                         label_offset=min(base_width / 2, horizontal_offset),
-                                                         label_alignment=(column_semi_height - chunk_size / 2) * scale * 1000)
+                        svg_parts.append(create_dimension(starting_coordinates=[((gap['coordinates'][0] + gap['sectionDimensions'][0] / 2) * 1000 + center_offset) * scale, (gap['length'] / 2 - gap['coordinates'][1]) * scale * 1000],
+                                                          ending_coordinates=[((gap['coordinates'][0] + gap['sectionDimensions'][0] / 2) * 1000 + center_offset) * scale, column_semi_height * scale * 1000],
+                                                          dimension_type="DistanceY",
+                                                          dimension_label=dimension_label,
+                                                          label_offset=min(base_width / 2, horizontal_offset),
+                                                          label_alignment=(column_semi_height - chunk_size / 2) * scale * 1000))
 
                     if len(gaps_per_column) > 1 and gap_index == len(gaps_per_column) - 1:
                         chunk_size = (-gap['length'] / 2 - gap['coordinates'][1]) + column_semi_height
                         dimension_label = f"{round(chunk_size * 1000, 2)}"
                         if chunk_size * 1000 * scale > 70:
                             dimension_label += " mm"
-                        svgFile_data += create_dimension(ending_coordinates=[((gap['coordinates'][0] + gap['sectionDimensions'][0] / 2) * 1000 + center_offset) * scale, (-gap['length'] / 2 - gap['coordinates'][1]) * scale * 1000],
-                                                         starting_coordinates=[((gap['coordinates'][0] + gap['sectionDimensions'][0] / 2) * 1000 + center_offset) * scale, -column_semi_height * scale * 1000],
-                                                         dimension_type="DistanceY",
-                                                         dimension_label=dimension_label,
-                                                         label_offset=min(base_width / 2, horizontal_offset),
-                                                         label_alignment=(-column_semi_height + chunk_size / 2) * scale * 1000)
+                        svg_parts.append(create_dimension(ending_coordinates=[((gap['coordinates'][0] + gap['sectionDimensions'][0] / 2) * 1000 + center_offset) * scale, (-gap['length'] / 2 - gap['coordinates'][1]) * scale * 1000],
+                                                          starting_coordinates=[((gap['coordinates'][0] + gap['sectionDimensions'][0] / 2) * 1000 + center_offset) * scale, -column_semi_height * scale * 1000],
+                                                          dimension_type="DistanceY",
+                                                          dimension_label=dimension_label,
+                                                          label_offset=min(base_width / 2, horizontal_offset),
+                                                          label_alignment=(-column_semi_height + chunk_size / 2) * scale * 1000))
 
-        svgFile_data += tail
+        svg_parts.append(tail)
+        svgFile_data = "".join(svg_parts)
 
         return svgFile_data
 
     def get_front_projection(self, pieces, margin, scale, base_height, base_width, projection_depth, projection_rotation):
-        import FreeCAD
         import Draft
 
         document = FreeCAD.ActiveDocument
@@ -569,16 +656,15 @@ class FreeCADBuilder:
 
         cloned_piece = Draft.scale(aux, FreeCAD.Vector(scale, scale, scale))
         # cloned_piece.Scale = FreeCAD.Vector(scale, scale, scale)
-        FreeCAD.ActiveDocument.recompute()
+        document.recompute()
 
         top_view = document.addObject('TechDraw::DrawViewPart', 'TopView')
         page.addView(top_view)
         top_view.Source = [cloned_piece]
         top_view.Rotation = 180
-        top_view.Direction = FreeCAD.Vector(0.00, 0.00, 1.00)
-        top_view.XDirection = FreeCAD.Vector(0.00, -1.00, 0.00)
+        top_view.Direction = _Z_AXIS
+        top_view.XDirection = _NEGATIVE_Y_AXIS
 
-        document = FreeCAD.ActiveDocument
         page = document.addObject('TechDraw::DrawPage', 'Front Page')
         template = document.addObject('TechDraw::DrawSVGTemplate', 'Template')
         page.Template = template
@@ -593,7 +679,7 @@ class FreeCADBuilder:
         if projection_rotation == 0:
             section_front_view.SectionNormal = FreeCAD.Vector(1.000, 0.000, 0.000)
         else:
-            section_front_view.SectionNormal = FreeCAD.Vector(-1.000, 0.000, 0.000)
+            section_front_view.SectionNormal = _NEGATIVE_X_AXIS
         section_front_view.SectionOrigin = FreeCAD.Vector(projection_depth, 0.000, 0)
         section_front_view.SectionSymbol = ''
         section_front_view.Label = 'Section  - '
@@ -603,7 +689,7 @@ class FreeCADBuilder:
         if projection_rotation == 0:
             section_front_view.Direction = FreeCAD.Vector(1.00, 0.00, 0.00)
         else:
-            section_front_view.Direction = FreeCAD.Vector(-1.00, 0.00, 0.00)
+            section_front_view.Direction = _NEGATIVE_X_AXIS
         section_front_view.XDirection = FreeCAD.Vector(0.00, 1.00, 0.00)
         section_front_view.X = margin + base_width * scale / 2
         section_front_view.Y = 1000 - base_height * scale / 2 - margin
@@ -612,25 +698,36 @@ class FreeCADBuilder:
 
     class IPiece(metaclass=ABCMeta):
         def __init__(self):
-            self.output_path = f'{os.path.dirname(os.path.abspath(__file__))}/../../output/'
+            self.output_path = utils.default_output_path
 
         def set_output_path(self, output_path):
             self.output_path = output_path
 
         @staticmethod
-        def edges_in_boundbox(part, xmin, ymin, zmin, xmax, ymax, zmax):
-            import FreeCAD
-            bb = FreeCAD.BoundBox(xmin, ymin, zmin, xmax, ymax, zmax)
+        def get_edges_bounds(shape):
+            return numpy.array([
+                (bb.XMin, bb.YMin, bb.ZMin, bb.XMax, bb.YMax, bb.ZMax)
+                for bb in (edge.BoundBox for edge in shape.Edges)
+            ], dtype=float).reshape(-1, 6)
+
+        @classmethod
+        def edges_in_boundboxes(cls, shape, boundboxes, edges_bounds=None):
+            if edges_bounds is None:
+                edges_bounds = cls.get_edges_bounds(shape)
+            boundboxes = numpy.array(boundboxes, dtype=float).reshape(-1, 6)
+
+            inside = numpy.logical_and(
+                (edges_bounds[:, None, :3] >= boundboxes[None, :, :3]).all(axis=2),
+                (edges_bounds[:, None, 3:] <= boundboxes[None, :, 3:]).all(axis=2)
+            )
+            return [numpy.flatnonzero(edges_inside).tolist() for edges_inside in inside.T]
 
-            return [
-                i
-                for i, edge in enumerate(part.Shape.Edges)
-                if bb.isInside(edge.BoundBox)
-            ]
+        @classmethod
+        def edges_in_boundbox(cls, shape, xmin, ymin, zmin, xmax, ymax, zmax, edges_bounds=None):
+            return cls.edges_in_boundboxes(shape, [(xmin, ymin, zmin, xmax, ymax, zmax)], edges_bounds)[0]
 
         @staticmethod
         def create_sketch():
-            import FreeCAD
             document = FreeCAD.ActiveDocument
 
             document.addObject('PartDesign::Body', 'Body')
@@ -642,14 +739,55 @@ class FreeCADBuilder:
             document.recompute()
             return sketch
 
+        @staticmethod
+        def add_centered_rectangle(sketch, c, a):
+            # rectangle of half length c and half width a centered on the origin, added and constrained in one go
+            import Part
+            import Sketcher
+            top_line, right_line, bottom_line, left_line = sketch.addGeometry([
+                Part.LineSegment(FreeCAD.Vector(-c, a, 0), FreeCAD.Vector(c, a, 0)),
+                Part.LineSegment(FreeCAD.Vector(c, a, 0), FreeCAD.Vector(c, -a, 0)),
+                Part.LineSegment(FreeCAD.Vector(c, -a, 0), FreeCAD.Vector(-c, -a, 0)),
+                Part.LineSegment(FreeCAD.Vector(-c, -a, 0), FreeCAD.Vector(-c, a, 0)),
+            ], False)
+            sketch.addConstraint([
+                Sketcher.Constraint('Coincident', top_line, 2, right_line, 1),
+                Sketcher.Constraint('Coincident', right_line, 2, bottom_line, 1),
+                Sketcher.Constraint('Coincident', bottom_line, 2, left_line, 1),
+                Sketcher.Constraint('Coincident', left_line, 2, top_line, 1),
+                Sketcher.Constraint('DistanceY', bottom_line, 1, -1, 1, a),
+                Sketcher.Constraint('DistanceY', top_line, 1, -1, 1, -a),
+                Sketcher.Constraint('DistanceX', left_line, 1, -1, 1, c),
+                Sketcher.Constraint('DistanceX', right_line, 1, -1, 1, -c),
+                Sketcher.Constraint('Vertical', right_line),
+                Sketcher.Constraint('Vertical', left_line),
+                Sketcher.Constraint('Horizontal', top_line),
+                Sketcher.Constraint('Horizontal', bottom_line),
+            ])
+            return top_line, right_line, bottom_line, left_line
+
+        @staticmethod
+        def make_half_cylinder(radius, height, base, yaw):
+            # half cylinder standing on base, spanning from yaw to yaw + 180 degrees around Z, like a
+            # Part::Cylinder with Angle 180 placed with Rotation(yaw, 0, 0)
+            import Part
+            half_cylinder = Part.makeCylinder(radius, height, base, _Z_AXIS, 180)
+            if yaw:
+                half_cylinder.rotate(base, _Z_AXIS, yaw)
+            return half_cylinder
+
+        @staticmethod
+        def get_dimensions_key(dimensions, names):
+            # hashable, rounded dimension values to memoize shapes on, with missing dimensions as 0
+            return tuple(round(dimensions.get(name, 0), 9) for name in names)
+
         @staticmethod
         def extrude_sketch(sketch, part_name, height):
-            import FreeCAD
             document = FreeCAD.ActiveDocument
             part = document.addObject('Part::Extrusion', part_name)
             part.Base = sketch
             part.DirMode = "Custom"
-            part.Dir = FreeCAD.Vector(0., 0., 1.)
+            part.Dir = _Z_AXIS
             part.DirLink = None
             part.LengthFwd = height
             part.LengthRev = 0.
@@ -665,11 +803,15 @@ class FreeCADBuilder:
         def get_shape_extras(self, data, piece):
             return piece
 
+        def shape_extras_need_refine(self, data):
+            # get_piece wraps the extras in a Part::Refine and recomputes the document afterwards, so extras need neither;
+            # pieces whose extras add no boolean of their own let the winding window cut refine itself instead
+            return True
+
         def get_dimensions_and_subtypes(self):
             return {1: ["A", "B", "C", "D", "E", "F"]}
 
         def get_top_projection(self, data, piece, margin):
-            import FreeCAD
 
             dimensions = data["dimensions"]
 
@@ -682,8 +824,8 @@ class FreeCADBuilder:
             top_view = document.addObject('TechDraw::DrawViewPart', 'TopView')
             page.addView(top_view)
             top_view.Source = [piece]
-            top_view.Direction = FreeCAD.Vector(0.00, 0.00, 1.00)
-            top_view.XDirection = FreeCAD.Vector(0.00, -1.00, 0.00)
+            top_view.Direction = _Z_AXIS
+            top_view.XDirection = _NEGATIVE_Y_AXIS
             top_view.X = margin + dimensions['A'] / 2
 
             if data['family'] in ['p', 'rm']:
@@ -700,7 +842,6 @@ class FreeCADBuilder:
             return top_view
 
         def get_front_projection(self, data, piece, margin):
-            import FreeCAD
 
             dimensions = data["dimensions"]
 
@@ -723,15 +864,15 @@ class FreeCADBuilder:
             section_front_view.Source = document.getObject('TopView').Source
             section_front_view.ScaleType = 0
             section_front_view.SectionDirection = 'Down'
-            section_front_view.SectionNormal = FreeCAD.Vector(-1.000, 0.000, 0.000)
+            section_front_view.SectionNormal = _NEGATIVE_X_AXIS
             section_front_view.SectionOrigin = FreeCAD.Vector(semi_depth, 0.000, 0)
             section_front_view.SectionSymbol = ''
             section_front_view.Label = 'Section  - '
             section_front_view.Scale = 1.000000
             section_front_view.ScaleType = 0
             section_front_view.Rotation = 0
-            section_front_view.Direction = FreeCAD.Vector(-1.00, 0.00, 0.00)
-            section_front_view.XDirection = FreeCAD.Vector(0.00, -1.00, 0.00)
+            section_front_view.Direction = _NEGATIVE_X_AXIS
+            section_front_view.XDirection = _NEGATIVE_Y_AXIS
             section_front_view.X = margin + dimensions['A'] / 2
             section_front_view.Y = 1000 - margin - dimensions['B'] / 2
             document.recompute()
@@ -739,15 +880,14 @@ class FreeCADBuilder:
             return section_front_view
 
         def get_plate(self, data, save_files=False, export_files=True):
-            import FreeCAD
             try:
-                project_name = f"{data['name']}_plate".replace(" ", "_").replace("-", "_").replace("/", "_").replace(".", "__")
+                project_name = f"{data['name']}_plate".translate(_NAME_TABLE)
                 data["dimensions"] = flatten_dimensions(data)
 
                 close_file_after_finishing = False
                 if FreeCAD.ActiveDocument is None:
                     close_file_after_finishing = True
-                    FreeCAD.newDocument(project_name)
+                    new_document(project_name)
                 document = FreeCAD.ActiveDocument
 
                 sketch = self.create_sketch()
@@ -784,23 +924,20 @@ class FreeCADBuilder:
                 return None, None
 
         def get_piece(self, data, name="Piece", save_files=False, export_files=True):
-            import FreeCAD
             close_file_after_finishing = FreeCAD.ActiveDocument is None
             try:
-                project_name = f"{data['name']}_piece".replace(" ", "_").replace("-", "_").replace("/", "_").replace(".", "__")
+                project_name = f"{data['name']}_piece".translate(_NAME_TABLE)
 
                 data["dimensions"] = flatten_dimensions(data)
 
-                if FreeCAD.ActiveDocument is None:
-                    FreeCAD.newDocument(project_name)
-                document = FreeCAD.ActiveDocument
+                if close_file_after_finishing:
+                    document = new_document(project_name)
+                else:
+                    document = FreeCAD.ActiveDocument
 
                 sketch = self.create_sketch()
                 self.get_shape_base(data, sketch)
 
-                document = FreeCAD.ActiveDocument
-                document.recompute()
-
                 part_name = "piece"
 
                 base = self.extrude_sketch(
@@ -809,8 +946,6 @@ class FreeCADBuilder:
                     height=data["dimensions"]["B"] if data["family"] != 't' else data["dimensions"]["C"]
                 )
 
-                document.recompute()
-
                 negative_winding_window = self.get_negative_winding_window(data["dimensions"])
 
                 if negative_winding_window is None:
@@ -819,14 +954,20 @@ class FreeCADBuilder:
                     piece_cut = document.addObject("Part::Cut", "Cut")
                     piece_cut.Base = base
                     piece_cut.Tool = negative_winding_window
-                    document.recompute()
+                    refine_in_cut = not self.shape_extras_need_refine(data)
+                    piece_cut.Refine = refine_in_cut
 
-                piece_with_extra = self.get_shape_extras(data, piece_cut)
+                # The extras inspect the edges of the cut piece, so this is the only recompute needed before the final one
+                document.recompute()
 
-                piece = document.addObject('Part::Refine', name)
-                piece.Source = piece_with_extra
+                piece_with_extra = self.get_shape_extras(data, piece_cut)
 
-                document.recompute()
+                if negative_winding_window is not None and refine_in_cut:
+                    piece = piece_with_extra
+                    piece.Label = name
+                else:
+                    piece = document.addObject('Part::Refine', name)
+                    piece.Source = piece_with_extra
 
                 if data["family"] != 't':
                     piece.Placement.move(FreeCAD.Vector(0, 0, -data["dimensions"]["B"]))
@@ -858,20 +999,18 @@ class FreeCADBuilder:
                 return (None, None) if close_file_after_finishing else None
 
         def get_piece_technical_drawing(self, data, colors=None, save_files=False):
-            import FreeCAD
             try:
                 return self.try_get_piece_technical_drawing(
                     data, colors, save_files
                 )
             except Exception as e:  # noqa: E722
                 print(e)
-                project_name = f"{data['name']}_piece_scaled".replace(" ", "_").replace("-", "_").replace("/", "_").replace(".", "__")
+                project_name = f"{data['name']}_piece_scaled".translate(_NAME_TABLE)
                 FreeCAD.closeDocument(project_name)
                 return {"top_view": None, "front_view": None}
 
         def try_get_piece_technical_drawing(self, data, colors, save_files):
-            import FreeCAD
-            project_name = f"{data['name']}_piece_scaled".replace(" ", "_").replace("-", "_").replace("/", "_").replace(".", "__")
+            project_name = f"{data['name']}_piece_scaled".translate(_NAME_TABLE)
             if colors is None:
                 colors = {
                     "projection_color": "#000000",
@@ -885,7 +1024,7 @@ class FreeCADBuilder:
                 data["dimensions"][k] = v * scale
 
             if FreeCAD.ActiveDocument is None:
-                FreeCAD.newDocument(project_name)
+                new_document(project_name)
             document = FreeCAD.getDocument(project_name)
 
             sketch = self.create_sketch()
@@ -922,7 +1061,7 @@ class FreeCADBuilder:
             document.recompute()
 
             error_in_piece = False
-            for obj in FreeCAD.ActiveDocument.Objects:
+            for obj in document.Objects:
                 if not obj.isValid():
                     error_in_piece = True
                     print(f"Error in part: {obj.Name}")
@@ -950,9 +1089,6 @@ class FreeCADBuilder:
             )
 
         def add_dimensions_and_export_view(self, data, original_dimensions, view, project_name, margin, colors, save_files, piece):
-            import FreeCAD
-            import TechDraw
-
             def calculate_total_dimensions():
                 base_width = data['dimensions']['A'] + margin
                 base_width += horizontal_offset
@@ -1014,54 +1150,52 @@ class FreeCADBuilder:
                 return base_width, base_height
 
             def create_dimension(starting_coordinates, ending_coordinates, dimension_type, dimension_label, label_offset=0, label_alignment=0):
-
-                dimension_svg = ""
+                dimension_svg = []
+                starting_x, starting_y = starting_coordinates
+                ending_x, ending_y = ending_coordinates
+                fields = {
+                    'color': colors['dimension_color'],
+                    'font_size': dimension_font_size,
+                    'line_thickness': dimension_line_thickness,
+                    'view_x': view.X.Value,
+                    'view_y': 1000 - view.Y.Value,
+                    'label': dimension_label,
+                }
 
                 if dimension_type == "DistanceY":
-                    main_line_start = [starting_coordinates[0] + label_offset, starting_coordinates[1]]
-                    main_line_end = [ending_coordinates[0] + label_offset, ending_coordinates[1]]
-                    left_aux_line_start = [starting_coordinates[0], starting_coordinates[1]]
-                    left_aux_line_end = [starting_coordinates[0] + label_offset, starting_coordinates[1]]
-                    right_aux_line_start = [ending_coordinates[0], ending_coordinates[1]]
-                    right_aux_line_end = [ending_coordinates[0] + label_offset, ending_coordinates[1]]
-
-                    dimension_svg += f"""   <g font-size="29.1042" font-style="normal" stroke-opacity="1" fill="none" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="1" font-weight="400" transform="matrix(1,0,0,1,{view.X.Value + ending_coordinates[0] + label_offset - dimension_font_size / 4},{1000 - view.Y.Value + label_alignment})" stroke-linecap="square" stroke-linejoin="bevel">
-                                             <text x="0" y="0" text-anchor="middle" fill-opacity="1" font-size="{dimension_font_size}" font-style="normal" fill="{colors['dimension_color']}" font-family="osifont" stroke="none" xml:space="preserve" font-weight="400" transform="rotate(-90)">{dimension_label}</text>
-                                            </g>\n""".replace("                                    ", "")
-                    dimension_svg += f"""   <g font-size="29.1042" font-style="normal" stroke-opacity="1" fill="none" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="{dimension_line_thickness}" font-weight="400" transform="matrix(1,0,0,1,{view.X.Value},{1000 - view.Y.Value})" stroke-linecap="round" stroke-linejoin="bevel">
-                                              <path fill-rule="evenodd" vector-effect="none" d="M{main_line_start[0]},{main_line_start[1]} L{main_line_end[0]},{main_line_end[1]} M{left_aux_line_start[0]},{left_aux_line_start[1]} L{left_aux_line_end[0]},{left_aux_line_end[1]} M{right_aux_line_start[0]},{right_aux_line_start[1]} L{right_aux_line_end[0]},{right_aux_line_end[1]}"/>
-                                            </g>\n""".replace("                                     ", "")
-                    dimension_svg += f"""   <g font-size="29.1042" font-style="normal" stroke-opacity="1" fill="none" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="{dimension_line_thickness}" font-weight="400" transform="matrix(1,0,0,1,{view.X.Value},{1000 - view.Y.Value})" stroke-linecap="round" stroke-linejoin="bevel">
-                                             <g fill-opacity="1" font-size="29.1042" font-style="normal" stroke-opacity="1" fill="{colors['dimension_color']}" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="1" font-weight="400" transform="matrix(1,0,0,1,{ending_coordinates[0] + label_offset},{ending_coordinates[1]})" stroke-linecap="round" stroke-linejoin="bevel">
-                                              <path fill-rule="evenodd" vector-effect="none" d="M0,0 L6,-15 L-6,-15 L0,0"/>
-                                             </g>
-                                             <g fill-opacity="1" font-size="29.1042" font-style="normal" stroke-opacity="1" fill="{colors['dimension_color']}" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="1" font-weight="400" transform="matrix(1,0,0,1,{starting_coordinates[0] + label_offset},{starting_coordinates[1]})" stroke-linecap="round" stroke-linejoin="bevel">
-                                              <path fill-rule="evenodd" vector-effect="none" d="M0,0 L-6,15 L6,15 L0,0"/>
-                                             </g>
-                                            </g>\n""".replace("                                     ", "")
+                    offset_starting_x = starting_x + label_offset
+                    offset_ending_x = ending_x + label_offset
+                    fields['label_x'] = view.X.Value + offset_ending_x - dimension_font_size / 4
+                    fields['label_y'] = 1000 - view.Y.Value + label_alignment
+                    fields['path'] = _DIMENSION_PATH % (offset_starting_x, starting_y, offset_ending_x, ending_y, starting_x, starting_y, offset_starting_x, starting_y, ending_x, ending_y, offset_ending_x, ending_y)
+                    fields['ending_arrow_x'] = offset_ending_x
+                    fields['ending_arrow_y'] = ending_y
+                    fields['ending_arrow'] = _DIMENSION_ARROW_PATH % (6, -15, -6, -15)
+                    fields['starting_arrow_x'] = offset_starting_x
+                    fields['starting_arrow_y'] = starting_y
+                    fields['starting_arrow'] = _DIMENSION_ARROW_PATH % (-6, 15, 6, 15)
+
+                    dimension_svg.append(_DIMENSION_LABEL_Y_SVG % fields)
+                    dimension_svg.append(_DIMENSION_LINES_SVG % fields)
+                    dimension_svg.append(_DIMENSION_ARROWS_SVG % fields)
                 elif dimension_type == "DistanceX":
-                    main_line_start = [starting_coordinates[0], starting_coordinates[1] + label_offset]
-                    main_line_end = [ending_coordinates[0], ending_coordinates[1] + label_offset]
-                    left_aux_line_start = [starting_coordinates[0], starting_coordinates[1]]
-                    left_aux_line_end = [starting_coordinates[0], starting_coordinates[1] + label_offset]
-                    right_aux_line_start = [ending_coordinates[0], ending_coordinates[1]]
-                    right_aux_line_end = [ending_coordinates[0], ending_coordinates[1] + label_offset]
-
-                    dimension_svg += f"""   <g font-size="29.1042" font-style="normal" stroke-opacity="1" fill="none" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="1" font-weight="400" transform="matrix(1,0,0,1,{view.X.Value},{1000 - view.Y.Value})" stroke-linecap="square" stroke-linejoin="bevel">
-                                             <text x="0" y="{ending_coordinates[1] + label_offset - dimension_font_size / 4}" text-anchor="middle" fill-opacity="1" font-size="{dimension_font_size}" font-style="normal" fill="{colors['dimension_color']}" font-family="osifont" stroke="none" xml:space="preserve" font-weight="400">{dimension_label}</text>
-                                            </g>\n""".replace("                                    ", "")
-                    dimension_svg += f"""   <g font-size="29.1042" font-style="normal" stroke-opacity="1" fill="none" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="{dimension_line_thickness}" font-weight="400" transform="matrix(1,0,0,1,{view.X.Value},{1000 - view.Y.Value})" stroke-linecap="round" stroke-linejoin="bevel">
-                                              <path fill-rule="evenodd" vector-effect="none" d="M{main_line_start[0]},{main_line_start[1]} L{main_line_end[0]},{main_line_end[1]} M{left_aux_line_start[0]},{left_aux_line_start[1]} L{left_aux_line_end[0]},{left_aux_line_end[1]} M{right_aux_line_start[0]},{right_aux_line_start[1]} L{right_aux_line_end[0]},{right_aux_line_end[1]}"/>
-                                            </g>\n""".replace("                                     ", "")
-                    dimension_svg += f"""   <g font-size="29.1042" font-style="normal" stroke-opacity="1" fill="none" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="{dimension_line_thickness}" font-weight="400" transform="matrix(1,0,0,1,{view.X.Value},{1000 - view.Y.Value})" stroke-linecap="round" stroke-linejoin="bevel">
-                                             <g fill-opacity="1" font-size="29.1042" font-style="normal" stroke-opacity="1" fill="{colors['dimension_color']}" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="1" font-weight="400" transform="matrix(1,0,0,1,{ending_coordinates[0]},{ending_coordinates[1] + label_offset})" stroke-linecap="round" stroke-linejoin="bevel">
-                                              <path fill-rule="evenodd" vector-effect="none" d="M0,0 L-15,-6 L-15,6 L0,0"/>
-                                             </g>
-                                             <g fill-opacity="1" font-size="29.1042" font-style="normal" stroke-opacity="1" fill="{colors['dimension_color']}" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="1" font-weight="400" transform="matrix(1,0,0,1,{starting_coordinates[0]},{starting_coordinates[1] + label_offset})" stroke-linecap="round" stroke-linejoin="bevel">
-                                              <path fill-rule="evenodd" vector-effect="none" d="M0,0 L15,6 L15,-6 L0,0"/>
-                                             </g>
-                                            </g>\n""".replace("                                     ", "")
-                return dimension_svg
+                    offset_starting_y = starting_y + label_offset
+                    offset_ending_y = ending_y + label_offset
+                    fields['label_x'] = view.X.Value
+                    fields['label_y'] = 1000 - view.Y.Value
+                    fields['text_y'] = offset_ending_y - dimension_font_size / 4
+                    fields['path'] = _DIMENSION_PATH % (starting_x, offset_starting_y, ending_x, offset_ending_y, starting_x, starting_y, starting_x, offset_starting_y, ending_x, ending_y, ending_x, offset_ending_y)
+                    fields['ending_arrow_x'] = ending_x
+                    fields['ending_arrow_y'] = offset_ending_y
+                    fields['ending_arrow'] = _DIMENSION_ARROW_PATH % (-15, -6, -15, 6)
+                    fields['starting_arrow_x'] = starting_x
+                    fields['starting_arrow_y'] = offset_starting_y
+                    fields['starting_arrow'] = _DIMENSION_ARROW_PATH % (15, 6, 15, -6)
+
+                    dimension_svg.append(_DIMENSION_LABEL_X_SVG % fields)
+                    dimension_svg.append(_DIMENSION_LINES_SVG % fields)
+                    dimension_svg.append(_DIMENSION_ARROWS_SVG % fields)
+                return "".join(dimension_svg)
 
             projection_line_thickness = 4
             dimension_line_thickness = 1
@@ -1089,30 +1223,28 @@ class FreeCADBuilder:
                      </g>
                     </svg>
                     """.replace("                ", "")
-            svgFile_data = ""
-            svgFile_data += head
-            svgFile_data += projetion_head
+            svg_parts = [head, projetion_head]
 
             if view.Name == "TopView":
                 m = piece.Placement.Matrix
                 m.rotateZ(math.radians(90))
                 piece.Placement.Matrix = m
-                svgFile_data += TechDraw.projectToSVG(piece.Shape, FreeCAD.Vector(0., 0., 1.)).replace("><", ">\n<").replace("<", "    <").replace("stroke-width=\"0.7\"", f"stroke-width=\"{projection_line_thickness}\"").replace("#000000", colors['projection_color']).replace("rgb(0, 0, 0)", colors['projection_color'])
+                svg_parts.append(TechDraw.projectToSVG(piece.Shape, _Z_AXIS).replace("><", ">\n<").replace("<", "    <").replace("stroke-width=\"0.7\"", f"stroke-width=\"{projection_line_thickness}\"").replace("#000000", colors['projection_color']).replace("rgb(0, 0, 0)", colors['projection_color']))
             else:
                 m = piece.Placement.Matrix
                 m.rotateY(math.radians(90))
                 piece.Placement.Matrix = m
                 piece.Placement.move(FreeCAD.Vector(-dimensions["B"] / 2, 0, 0))
-                svgFile_data += TechDraw.projectToSVG(piece.Shape, FreeCAD.Vector(0., 1., 0.)).replace("><", ">\n<").replace("<", "    <").replace("stroke-width=\"0.7\"", f"stroke-width=\"{projection_line_thickness}\"").replace("#000000", colors['projection_color']).replace("rgb(0, 0, 0)", colors['projection_color'])
+                svg_parts.append(TechDraw.projectToSVG(piece.Shape, _Y_AXIS).replace("><", ">\n<").replace("<", "    <").replace("stroke-width=\"0.7\"", f"stroke-width=\"{projection_line_thickness}\"").replace("#000000", colors['projection_color']).replace("rgb(0, 0, 0)", colors['projection_color']))
 
-            svgFile_data += projetion_tail
+            svg_parts.append(projetion_tail)
             if view.Name == "TopView":
                 if "L" in dimensions and dimensions["L"] > 0:
-                    svgFile_data += create_dimension(starting_coordinates=[dimensions['J'] / 2, -dimensions['L'] / 2],
-                                                     ending_coordinates=[dimensions['J'] / 2, dimensions['L'] / 2],
-                                                     dimension_type="DistanceY",
-                                                     dimension_label=f"L: {round(dimensions['L'] / scale, 2)} mm",
-                                                     label_offset=horizontal_offset + dimensions['A'] / 2 - dimensions['J'] / 2)
+                    svg_parts.append(create_dimension(starting_coordinates=[dimensions['J'] / 2, -dimensions['L'] / 2],
+                                                      ending_coordinates=[dimensions['J'] / 2, dimensions['L'] / 2],
+                                                      dimension_type="DistanceY",
+                                                      dimension_label=f"L: {round(dimensions['L'] / scale, 2)} mm",
+                                                      label_offset=horizontal_offset + dimensions['A'] / 2 - dimensions['J'] / 2))
                     horizontal_offset += increment
                 k = 0
                 if "K" in dimensions and dimensions["K"] > 0:
@@ -1126,48 +1258,48 @@ class FreeCADBuilder:
                         correction = dimensions['K'] / 2
                     else:
                         correction = 0
-                    svgFile_data += create_dimension(starting_coordinates=[dimensions['F'] / 2, height_of_dimension + correction],
-                                                     ending_coordinates=[dimensions['F'] / 2, height_of_dimension + k + correction],
-                                                     dimension_type="DistanceY",
-                                                     dimension_label=f"K: {round(original_dimensions['K'], 2)} mm",
-                                                     label_offset=horizontal_offset + (dimensions['A'] / 2 - dimensions['F'] / 2),
-                                                     label_alignment=height_of_dimension + k / 2 + correction)
+                    svg_parts.append(create_dimension(starting_coordinates=[dimensions['F'] / 2, height_of_dimension + correction],
+                                                      ending_coordinates=[dimensions['F'] / 2, height_of_dimension + k + correction],
+                                                      dimension_type="DistanceY",
+                                                      dimension_label=f"K: {round(original_dimensions['K'], 2)} mm",
+                                                      label_offset=horizontal_offset + (dimensions['A'] / 2 - dimensions['F'] / 2),
+                                                      label_alignment=height_of_dimension + k / 2 + correction))
                     horizontal_offset += increment
                 if "F2" in dimensions and dimensions["F2"] > 0:
                     if data['family'] in ['efd']:
-                        svgFile_data += create_dimension(starting_coordinates=[0, dimensions['C'] / 2 + correction - dimensions['K'] - dimensions['F2']],
-                                                         ending_coordinates=[0, dimensions['C'] / 2 + correction - dimensions['K']],
-                                                         dimension_type="DistanceY",
-                                                         dimension_label=f"F2: {round(original_dimensions['F2'], 2)} mm",
-                                                         label_offset=horizontal_offset + dimensions['A'] / 2,
-                                                         label_alignment=dimensions['F2'] / 2 + k / 2 + correction)
+                        svg_parts.append(create_dimension(starting_coordinates=[0, dimensions['C'] / 2 + correction - dimensions['K'] - dimensions['F2']],
+                                                          ending_coordinates=[0, dimensions['C'] / 2 + correction - dimensions['K']],
+                                                          dimension_type="DistanceY",
+                                                          dimension_label=f"F2: {round(original_dimensions['F2'], 2)} mm",
+                                                          label_offset=horizontal_offset + dimensions['A'] / 2,
+                                                          label_alignment=dimensions['F2'] / 2 + k / 2 + correction))
                     else:
-                        svgFile_data += create_dimension(starting_coordinates=[0, -dimensions['F2'] / 2],
-                                                         ending_coordinates=[0, dimensions['F2'] / 2],
-                                                         dimension_type="DistanceY",
-                                                         dimension_label=f"F2: {round(original_dimensions['F2'], 2)} mm",
-                                                         label_offset=horizontal_offset + dimensions['A'] / 2)
+                        svg_parts.append(create_dimension(starting_coordinates=[0, -dimensions['F2'] / 2],
+                                                          ending_coordinates=[0, dimensions['F2'] / 2],
+                                                          dimension_type="DistanceY",
+                                                          dimension_label=f"F2: {round(original_dimensions['F2'], 2)} mm",
+                                                          label_offset=horizontal_offset + dimensions['A'] / 2))
                     horizontal_offset += increment
                 if "C" in dimensions and dimensions['C'] > 0:
-                    svgFile_data += create_dimension(starting_coordinates=[dimensions['A'] / 2, -dimensions['C'] / 2 + correction],
-                                                     ending_coordinates=[dimensions['A'] / 2, dimensions['C'] / 2 + correction],
-                                                     dimension_type="DistanceY",
-                                                     dimension_label=f"C: {round(original_dimensions['C'], 2)} mm",
-                                                     label_offset=horizontal_offset)
+                    svg_parts.append(create_dimension(starting_coordinates=[dimensions['A'] / 2, -dimensions['C'] / 2 + correction],
+                                                      ending_coordinates=[dimensions['A'] / 2, dimensions['C'] / 2 + correction],
+                                                      dimension_type="DistanceY",
+                                                      dimension_label=f"C: {round(original_dimensions['C'], 2)} mm",
+                                                      label_offset=horizontal_offset))
                     horizontal_offset += increment
                 if "H" in dimensions and dimensions['H'] > 0:
-                    svgFile_data += create_dimension(starting_coordinates=[-dimensions['H'] / 2, 0],
-                                                     ending_coordinates=[dimensions['H'] / 2, 0],
-                                                     dimension_type="DistanceX",
-                                                     dimension_label=f"H: {round(original_dimensions['H'], 2)} mm",
-                                                     label_offset=vertical_offset + shape_semi_height)
+                    svg_parts.append(create_dimension(starting_coordinates=[-dimensions['H'] / 2, 0],
+                                                      ending_coordinates=[dimensions['H'] / 2, 0],
+                                                      dimension_type="DistanceX",
+                                                      dimension_label=f"H: {round(original_dimensions['H'], 2)} mm",
+                                                      label_offset=vertical_offset + shape_semi_height))
                     vertical_offset += increment
                 if "J" in dimensions and data['family'] == 'pq':
-                    svgFile_data += create_dimension(starting_coordinates=[-dimensions['J'] / 2, dimensions['L'] / 2],
-                                                     ending_coordinates=[dimensions['J'] / 2, dimensions['L'] / 2],
-                                                     dimension_type="DistanceX",
-                                                     dimension_label=f"J: {round(dimensions['J'] / scale, 2)} mm",
-                                                     label_offset=vertical_offset + shape_semi_height - dimensions['L'] / 2)
+                    svg_parts.append(create_dimension(starting_coordinates=[-dimensions['J'] / 2, dimensions['L'] / 2],
+                                                      ending_coordinates=[dimensions['J'] / 2, dimensions['L'] / 2],
+                                                      dimension_type="DistanceX",
+                                                      dimension_label=f"J: {round(dimensions['J'] / scale, 2)} mm",
+                                                      label_offset=vertical_offset + shape_semi_height - dimensions['L'] / 2))
                     vertical_offset += increment
                 if data['family'] in ['ep', 'epx']:
                     k = dimensions['C'] / 2 - dimensions['K']
@@ -1179,68 +1311,68 @@ class FreeCADBuilder:
 
                 if data['family'] not in ['p']:
                     if "F" in dimensions and dimensions["F"] > 0:
-                        svgFile_data += create_dimension(starting_coordinates=[-dimensions['F'] / 2, -k],
-                                                         ending_coordinates=[dimensions['F'] / 2, -k],
-                                                         dimension_type="DistanceX",
-                                                         dimension_label=f"F: {round(original_dimensions['F'], 2)} mm",
-                                                         label_offset=vertical_offset + k + shape_semi_height)
+                        svg_parts.append(create_dimension(starting_coordinates=[-dimensions['F'] / 2, -k],
+                                                          ending_coordinates=[dimensions['F'] / 2, -k],
+                                                          dimension_type="DistanceX",
+                                                          dimension_label=f"F: {round(original_dimensions['F'], 2)} mm",
+                                                          label_offset=vertical_offset + k + shape_semi_height))
                         vertical_offset += increment
                     if "G" in dimensions and dimensions['G'] > 0:
-                        svgFile_data += create_dimension(starting_coordinates=[-dimensions['G'] / 2, shape_semi_height],
-                                                         ending_coordinates=[dimensions['G'] / 2, shape_semi_height],
-                                                         dimension_type="DistanceX",
-                                                         dimension_label=f"G: {round(original_dimensions['G'], 2)} mm",
-                                                         label_offset=vertical_offset)
+                        svg_parts.append(create_dimension(starting_coordinates=[-dimensions['G'] / 2, shape_semi_height],
+                                                          ending_coordinates=[dimensions['G'] / 2, shape_semi_height],
+                                                          dimension_type="DistanceX",
+                                                          dimension_label=f"G: {round(original_dimensions['G'], 2)} mm",
+                                                          label_offset=vertical_offset))
                         vertical_offset += increment
                 else:   
                     if "G" in dimensions and dimensions['G'] > 0:
-                        svgFile_data += create_dimension(starting_coordinates=[-dimensions['G'] / 2, dimensions['E'] / 2],
-                                                         ending_coordinates=[dimensions['G'] / 2, dimensions['E'] / 2],
-                                                         dimension_type="DistanceX",
-                                                         dimension_label=f"G: {round(original_dimensions['G'], 2)} mm",
-                                                         label_offset=vertical_offset + dimensions['A'] / 2 - dimensions['E'] / 2)
+                        svg_parts.append(create_dimension(starting_coordinates=[-dimensions['G'] / 2, dimensions['E'] / 2],
+                                                          ending_coordinates=[dimensions['G'] / 2, dimensions['E'] / 2],
+                                                          dimension_type="DistanceX",
+                                                          dimension_label=f"G: {round(original_dimensions['G'], 2)} mm",
+                                                          label_offset=vertical_offset + dimensions['A'] / 2 - dimensions['E'] / 2))
                         vertical_offset += increment
                     if "F" in dimensions and dimensions["F"] > 0:
-                        svgFile_data += create_dimension(starting_coordinates=[-dimensions['F'] / 2, -k],
-                                                         ending_coordinates=[dimensions['F'] / 2, -k],
-                                                         dimension_type="DistanceX",
-                                                         dimension_label=f"F: {round(original_dimensions['F'], 2)} mm",
-                                                         label_offset=vertical_offset + k + shape_semi_height)
+                        svg_parts.append(create_dimension(starting_coordinates=[-dimensions['F'] / 2, -k],
+                                                          ending_coordinates=[dimensions['F'] / 2, -k],
+                                                          dimension_type="DistanceX",
+                                                          dimension_label=f"F: {round(original_dimensions['F'], 2)} mm",
+                                                          label_offset=vertical_offset + k + shape_semi_height))
                         vertical_offset += increment
 
-                svgFile_data += create_dimension(starting_coordinates=[-dimensions['E'] / 2, -k],
-                                                 ending_coordinates=[dimensions['E'] / 2, -k],
-                                                 dimension_type="DistanceX",
-                                                 dimension_label=f"E: {round(original_dimensions['E'], 2)} mm",
-                                                 label_offset=vertical_offset + k + shape_semi_height)
+                svg_parts.append(create_dimension(starting_coordinates=[-dimensions['E'] / 2, -k],
+                                                  ending_coordinates=[dimensions['E'] / 2, -k],
+                                                  dimension_type="DistanceX",
+                                                  dimension_label=f"E: {round(original_dimensions['E'], 2)} mm",
+                                                  label_offset=vertical_offset + k + shape_semi_height))
                 vertical_offset += increment
-                svgFile_data += create_dimension(starting_coordinates=[-dimensions['A'] / 2, 0],
-                                                 ending_coordinates=[dimensions['A'] / 2, 0],
-                                                 dimension_type="DistanceX",
-                                                 dimension_label=f"A: {round(original_dimensions['A'], 2)} mm",
-                                                 label_offset=vertical_offset + shape_semi_height)
+                svg_parts.append(create_dimension(starting_coordinates=[-dimensions['A'] / 2, 0],
+                                                  ending_coordinates=[dimensions['A'] / 2, 0],
+                                                  dimension_type="DistanceX",
+                                                  dimension_label=f"A: {round(original_dimensions['A'], 2)} mm",
+                                                  label_offset=vertical_offset + shape_semi_height))
                 vertical_offset += increment
             else:
                 starting_point_for_d = dimensions['E'] / 2
-                svgFile_data += create_dimension(starting_coordinates=[starting_point_for_d, -dimensions['B'] / 2],
-                                                 ending_coordinates=[starting_point_for_d, -dimensions['B'] / 2 + dimensions['D']],
-                                                 dimension_type="DistanceY",
-                                                 dimension_label=f"D: {round(original_dimensions['D'], 2)} mm",
-                                                 label_offset=horizontal_offset + (dimensions['A'] / 2 - starting_point_for_d),
-                                                 label_alignment=-dimensions['B'] / 2 + dimensions['D'] / 2)
+                svg_parts.append(create_dimension(starting_coordinates=[starting_point_for_d, -dimensions['B'] / 2],
+                                                  ending_coordinates=[starting_point_for_d, -dimensions['B'] / 2 + dimensions['D']],
+                                                  dimension_type="DistanceY",
+                                                  dimension_label=f"D: {round(original_dimensions['D'], 2)} mm",
+                                                  label_offset=horizontal_offset + (dimensions['A'] / 2 - starting_point_for_d),
+                                                  label_alignment=-dimensions['B'] / 2 + dimensions['D'] / 2))
                 horizontal_offset += increment
-                svgFile_data += create_dimension(starting_coordinates=[dimensions['A'] / 2, -dimensions['B'] / 2],
-                                                 ending_coordinates=[dimensions['A'] / 2, dimensions['B'] / 2],
-                                                 dimension_type="DistanceY",
-                                                 dimension_label=f"B: {round(original_dimensions['B'], 2)} mm",
-                                                 label_offset=horizontal_offset)
+                svg_parts.append(create_dimension(starting_coordinates=[dimensions['A'] / 2, -dimensions['B'] / 2],
+                                                  ending_coordinates=[dimensions['A'] / 2, dimensions['B'] / 2],
+                                                  dimension_type="DistanceY",
+                                                  dimension_label=f"B: {round(original_dimensions['B'], 2)} mm",
+                                                  label_offset=horizontal_offset))
 
-            svgFile_data += tail
+            svg_parts.append(tail)
+            svgFile_data = "".join(svg_parts)
 
             if save_files:
-                svgFile = open(f"{self.output_path}/{project_name}_{view.Name}.svg", "w")
-                svgFile.write(svgFile_data) 
-                svgFile.close() 
+                with open(f"{self.output_path}/{project_name}_{view.Name}.svg", "w", encoding="utf-8") as svgFile:
+                    svgFile.write(svgFile_data)
             return svgFile_data
 
         @abstractmethod
@@ -1252,7 +1384,6 @@ class FreeCADBuilder:
             raise NotImplementedError
 
         def apply_machining(self, piece, machining, dimensions):
-            import FreeCAD
             document = FreeCAD.ActiveDocument
 
             original_tool = document.addObject("Part::Box", "tool")
@@ -1271,7 +1402,7 @@ class FreeCADBuilder:
                     y_coordinate = -dimensions["A"] / 2
 
             original_tool.Height = machining['length'] * 1000
-            original_tool.Placement = FreeCAD.Placement(FreeCAD.Vector(x_coordinate, y_coordinate, (machining['coordinates'][1] - machining['length'] / 2) * 1000), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
+            original_tool.Placement = FreeCAD.Placement(FreeCAD.Vector(x_coordinate, y_coordinate, (machining['coordinates'][1] - machining['length'] / 2) * 1000), _IDENTITY_ROT)
 
             if machining['coordinates'][0] == 0:
                 tool = original_tool
@@ -1281,7 +1412,7 @@ class FreeCADBuilder:
                 central_column_tool.Length = central_column_width
                 central_column_tool.Width = central_column_width
                 central_column_tool.Height = machining['length'] * 1000
-                central_column_tool.Placement = FreeCAD.Placement(FreeCAD.Vector(-central_column_width / 2, -central_column_width / 2, (machining['coordinates'][1] - machining['length'] / 2) * 1000), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
+                central_column_tool.Placement = FreeCAD.Placement(FreeCAD.Vector(-central_column_width / 2, -central_column_width / 2, (machining['coordinates'][1] - machining['length'] / 2) * 1000), _IDENTITY_ROT)
 
                 tool = document.addObject("Part::Cut", "machined_piece")
                 tool.Base = original_tool
@@ -1306,195 +1437,180 @@ class FreeCADBuilder:
             }
 
         def get_shape_extras(self, data, piece):
-            import FreeCAD
             # rotation in order to avoid cut in projection
             m = piece.Base.Placement.Matrix
             m.rotateZ(math.radians(180))
             piece.Base.Placement.Matrix = m
 
+            return self._extras_per_subtype[data["familySubtype"]](self, data, piece)
+
+        def _extras_none(self, data, piece):
+            return piece
+
+        def _extras_subtype_1(self, data, piece):
             dimensions = data["dimensions"]
-            familySubtype = data["familySubtype"]
+            piece = self.cut_lateral_slots(dimensions, piece)
+
+            e = dimensions["E"]
+            winding_window_zmin = dimensions["B"] - dimensions["D"]
+            slot_cosine = self.get_slot_cosine(dimensions)
+            internal_xmin = dimensions["F"] / 2 + e / 8
+
+            boundboxes = self.get_slot_boundboxes(dimensions, winding_window_zmin, internal_xmin)
+            edges_per_boundbox = self.edges_in_boundboxes(piece.Shape, boundboxes)
+
+            external_top_right_vertex, external_bottom_right_vertex, external_top_left_vertex, external_bottom_left_vertex = [edges[0] for edges in edges_per_boundbox[0:4]]
+            external_vertexes = [external_top_left_vertex, external_bottom_left_vertex, external_top_right_vertex, external_bottom_right_vertex]
+            internal_vertexes = [edges[0] for edges in edges_per_boundbox[4:8] if len(edges) > 0]
+
+            lateral_quarter = utils.decimal_floor((dimensions['A'] - e) / 4, 2)
+            slot_depth = e - e * slot_cosine
+            fillet_external_radius = 0.95 * lateral_quarter
+            fillet_internal_radius = 0.95 * min(lateral_quarter, slot_depth)
+            __fillets__ = [(i + 1, fillet_external_radius, fillet_external_radius) for i in external_vertexes] + \
+                [(i + 1, fillet_internal_radius, fillet_internal_radius) for i in internal_vertexes]
+            return self.fillet_edges(piece, __fillets__)
+
+        def _extras_subtype_2(self, data, piece):
+            dimensions = data["dimensions"]
+            piece = self.cut_lateral_slots(dimensions, piece)
+
+            a = dimensions["A"]
+            c = dimensions["C"] if "C" in dimensions else None
+            e = dimensions["E"]
+            g = dimensions["G"]
+            semi_e = e / 2
+            semi_f = dimensions["F"] / 2
+            quarter_g = g / 4
+            three_quarters_g = 3 * g / 4
+            winding_window_zmin = dimensions["B"] - dimensions["D"]
+            slot_cosine = self.get_slot_cosine(dimensions)
+            if c is not None and c > 0:
+                internal_xmin = c / 2 + (e - c) / 4
+            else:
+                aux_c = e * slot_cosine * 0.9
+                internal_xmin = aux_c / 2 + (e - aux_c) / 4
+            if c is None:
+                internal_xmax = semi_e + (a - e) / 4
+            else:
+                internal_xmax = internal_xmin
+
+            boundboxes = self.get_slot_boundboxes(dimensions, 0, internal_xmin) + [
+                (semi_f, -three_quarters_g, 0, internal_xmax, -quarter_g, winding_window_zmin),  # base cut bottom right
+                (semi_f, quarter_g, 0, internal_xmax, three_quarters_g, winding_window_zmin),  # base cut top right
+                (-internal_xmax, -three_quarters_g, 0, -semi_f, -quarter_g, winding_window_zmin),  # base cut bottom left
+                (-internal_xmax, quarter_g, 0, -semi_f, three_quarters_g, winding_window_zmin),  # base cut top left
+            ]
+            edges_per_boundbox = self.edges_in_boundboxes(piece.Shape, boundboxes)
+
+            external_top_right_vertex, external_bottom_right_vertex, external_top_left_vertex, external_bottom_left_vertex = [edges[0] for edges in edges_per_boundbox[0:4]]
+            external_vertexes = [external_top_left_vertex, external_bottom_left_vertex, external_top_right_vertex, external_bottom_right_vertex]
+            internal_vertexes = [edges[0] for edges in edges_per_boundbox[4:8] if len(edges) > 0]
+            base_vertexes = [edges[0] for edges in edges_per_boundbox[8:12]]
+
+            lateral_quarter = utils.decimal_floor((a - e) / 4, 2)
+            slot_depth = e - e * slot_cosine
+            fillet_external_radius = 0.95 * lateral_quarter
+            fillet_internal_radius = 0.95 * min(lateral_quarter, slot_depth)
+            fillet_base_radius = 0.95 * min(0.1 * g, slot_depth / 4)
+            __fillets__ = [(i + 1, fillet_external_radius, fillet_external_radius) for i in external_vertexes] + \
+                [(i + 1, fillet_internal_radius, fillet_internal_radius) for i in internal_vertexes] + \
+                [(i + 1, fillet_base_radius, fillet_base_radius) for i in base_vertexes]
+            return self.fillet_edges(piece, __fillets__)
+
+        _extras_per_subtype = {
+            '1': _extras_subtype_1,
+            '2': _extras_subtype_2,
+            '3': _extras_none,
+            '4': _extras_none,
+        }
+
+        @staticmethod
+        def get_slot_cosine(dimensions):
+            # cos(asin(G / E)), the cosine of the half angle the slot opens in the winding window
+            return math.sqrt(1 - (dimensions["G"] / dimensions["E"]) ** 2)
+
+        @staticmethod
+        def get_slot_boundboxes(dimensions, zmin, internal_xmin):
+            # (xmin, ymin, zmin, xmax, ymax, zmax) of the external and internal slot edges to fillet
+            semi_a = dimensions["A"] / 2
+            semi_e = dimensions["E"] / 2
+            g = dimensions["G"]
+            quarter_g = g / 4
+            three_quarters_g = 3 * g / 4
+            height = dimensions["B"]
+            winding_window_zmin = height - dimensions["D"]
+            return [
+                (semi_e, quarter_g, zmin, semi_a, three_quarters_g, height),  # external top right
+                (semi_e, -three_quarters_g, zmin, semi_a, -quarter_g, height),  # external bottom right
+                (-semi_a, quarter_g, zmin, -semi_e, three_quarters_g, height),  # external top left
+                (-semi_a, -three_quarters_g, zmin, -semi_e, -quarter_g, height),  # external bottom left
+                (internal_xmin, quarter_g, winding_window_zmin, semi_e, three_quarters_g, height),  # internal top right
+                (internal_xmin, -three_quarters_g, winding_window_zmin, semi_e, -quarter_g, height),  # internal bottom right
+                (-semi_e, quarter_g, winding_window_zmin, -internal_xmin, three_quarters_g, height),  # internal top left
+                (-semi_e, -three_quarters_g, winding_window_zmin, -internal_xmin, -quarter_g, height),  # internal bottom left
+            ]
+
+        @staticmethod
+        def cut_lateral_slots(dimensions, piece):
+            import Part
+            Vector = FreeCAD.Vector
             document = FreeCAD.ActiveDocument
-            if familySubtype == '3' or familySubtype == '4':
-                return piece
-            elif familySubtype == '1' or familySubtype == '2':
-                lateral_right_cut_box = document.addObject("Part::Box", "lateral_right_cut_box")
-                document.recompute()
-                lateral_right_cut_box.Length = (dimensions["A"] - dimensions["F"]) / 2
-                lateral_right_cut_box.Width = dimensions["G"]
-                lateral_right_cut_box.Height = dimensions["D"]
-                lateral_right_cut_box.Placement = FreeCAD.Placement(FreeCAD.Vector(dimensions["F"] / 2, -dimensions["G"] / 2, dimensions["B"] - dimensions["D"]), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
 
-                lateral_left_cut_box = document.addObject("Part::Box", "lateral_left_cut_box")
-                document.recompute()
-                lateral_left_cut_box.Length = (dimensions["A"] - dimensions["F"]) / 2
-                lateral_left_cut_box.Width = dimensions["G"]
-                lateral_left_cut_box.Height = dimensions["D"]
-                lateral_left_cut_box.Placement = FreeCAD.Placement(FreeCAD.Vector(-dimensions["F"] / 2 - (dimensions["A"] - dimensions["F"]) / 2, -dimensions["G"] / 2, dimensions["B"] - dimensions["D"]), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
-
-                piece_cut_only_right = document.addObject("Part::Cut", "lateral_right_cut")
-                piece_cut_only_right.Base = piece
-                piece_cut_only_right.Tool = lateral_right_cut_box
-                document.recompute()
+            f = dimensions["F"]
+            g = dimensions["G"]
+            height = dimensions["D"]
+            lateral_length = (dimensions["A"] - f) / 2
+            zmin = dimensions["B"] - height
+            half_g = g / 2
+            lateral_right_cut_box = Part.makeBox(lateral_length, g, height, Vector(f / 2, -half_g, zmin))
+            lateral_left_cut_box = Part.makeBox(lateral_length, g, height, Vector(-f / 2 - lateral_length, -half_g, zmin))
 
-                piece_cut = document.addObject("Part::Cut", "lateral_right_cut")
-                piece_cut.Base = piece_cut_only_right
-                piece_cut.Tool = lateral_left_cut_box
-                document.recompute()
+            lateral_cut_boxes = document.addObject("Part::Feature", "lateral_cut_boxes")
+            lateral_cut_boxes.Shape = lateral_right_cut_box.fuse(lateral_left_cut_box)
 
-                piece = document.addObject('Part::Refine', 'Cut')
-                piece.Source = piece_cut
+            piece_cut = document.addObject("Part::Cut", "lateral_cut")
+            piece_cut.Base = piece
+            piece_cut.Tool = lateral_cut_boxes
+            piece_cut.Refine = True
 
-                document.recompute()
-                if familySubtype == '1':
-                    zmin = dimensions["B"] - dimensions["D"]
-                    internal_xmin = dimensions["F"] / 2 + dimensions["E"] / 8
-                elif familySubtype == '2':
-                    zmin = 0
-                    if "C" in dimensions and dimensions['C'] > 0:
-                        internal_xmin = dimensions["C"] / 2 + (dimensions["E"] - dimensions["C"]) / 4
-                    else:
-                        aux_c = dimensions["E"] * math.cos(math.asin(dimensions["G"] / dimensions["E"])) * 0.9
-                        internal_xmin = aux_c / 2 + (dimensions["E"] - aux_c) / 4
-
-                external_top_right_vertex = self.edges_in_boundbox(part=piece,
-                                                                   xmin=dimensions["E"] / 2,
-                                                                   xmax=dimensions["A"] / 2,
-                                                                   ymin=dimensions["G"] / 4,
-                                                                   ymax=3 * dimensions["G"] / 4,
-                                                                   zmin=zmin,
-                                                                   zmax=dimensions["B"])[0]
-                external_bottom_right_vertex = self.edges_in_boundbox(part=piece,
-                                                                      xmin=dimensions["E"] / 2,
-                                                                      xmax=dimensions["A"] / 2,
-                                                                      ymax=-dimensions["G"] / 4,
-                                                                      ymin=-3 * dimensions["G"] / 4,
-                                                                      zmin=zmin,
-                                                                      zmax=dimensions["B"])[0]
-                external_top_left_vertex = self.edges_in_boundbox(part=piece,
-                                                                  xmin=-dimensions["A"] / 2,
-                                                                  xmax=-dimensions["E"] / 2,
-                                                                  ymin=dimensions["G"] / 4,
-                                                                  ymax=3 * dimensions["G"] / 4,
-                                                                  zmin=zmin,
-                                                                  zmax=dimensions["B"])[0]
-                external_bottom_left_vertex = self.edges_in_boundbox(part=piece,
-                                                                     xmin=-dimensions["A"] / 2,
-                                                                     xmax=-dimensions["E"] / 2,
-                                                                     ymax=-dimensions["G"] / 4,
-                                                                     ymin=-3 * dimensions["G"] / 4,
-                                                                     zmin=zmin,
-                                                                     zmax=dimensions["B"])[0]
-
-                external_vertexes = [external_top_left_vertex, external_bottom_left_vertex, external_top_right_vertex, external_bottom_right_vertex]
-
-                internal_vertexes = []
-                internal_top_right_vertex = self.edges_in_boundbox(part=piece,
-                                                                   xmin=internal_xmin,
-                                                                   xmax=dimensions["E"] / 2,
-                                                                   ymin=dimensions["G"] / 4,
-                                                                   ymax=3 * dimensions["G"] / 4,
-                                                                   zmin=dimensions["B"] - dimensions["D"],
-                                                                   zmax=dimensions["B"])
-                if len(internal_top_right_vertex) > 0:
-                    internal_vertexes.append(internal_top_right_vertex[0])
-                internal_bottom_right_vertex = self.edges_in_boundbox(part=piece,
-                                                                      xmin=internal_xmin,
-                                                                      xmax=dimensions["E"] / 2,
-                                                                      ymax=-dimensions["G"] / 4,
-                                                                      ymin=-3 * dimensions["G"] / 4,
-                                                                      zmin=dimensions["B"] - dimensions["D"],
-                                                                      zmax=dimensions["B"])
-                if len(internal_bottom_right_vertex) > 0:
-                    internal_vertexes.append(internal_bottom_right_vertex[0])
-                internal_top_left_vertex = self.edges_in_boundbox(part=piece,
-                                                                  xmin=-dimensions["E"] / 2,
-                                                                  xmax=-internal_xmin,
-                                                                  ymin=dimensions["G"] / 4,
-                                                                  ymax=3 * dimensions["G"] / 4,
-                                                                  zmin=dimensions["B"] - dimensions["D"],
-                                                                  zmax=dimensions["B"])
-                if len(internal_top_left_vertex) > 0:
-                    internal_vertexes.append(internal_top_left_vertex[0])
-                internal_bottom_left_vertex = self.edges_in_boundbox(part=piece,
-                                                                     xmin=-dimensions["E"] / 2,
-                                                                     xmax=-internal_xmin,
-                                                                     ymax=-dimensions["G"] / 4,
-                                                                     ymin=-3 * dimensions["G"] / 4,
-                                                                     zmin=dimensions["B"] - dimensions["D"],
-                                                                     zmax=dimensions["B"])
-                if len(internal_bottom_left_vertex) > 0:
-                    internal_vertexes.append(internal_bottom_left_vertex[0])
-
-                if familySubtype == '2':
-                    if "C" not in dimensions:
-                        internal_xmax = dimensions["E"] / 2 + (dimensions["A"] - dimensions["E"]) / 4
-                    else:
-                        internal_xmax = internal_xmin
-                    base_cut_bottom_right_vertex = self.edges_in_boundbox(part=piece,
-                                                                          xmin=dimensions["F"] / 2,
-                                                                          xmax=internal_xmax,
-                                                                          ymin=-3 * dimensions["G"] / 4,
-                                                                          ymax=-dimensions["G"] / 4,
-                                                                          zmin=0,
-                                                                          zmax=dimensions["B"] - dimensions["D"])[0]
-                    base_cut_top_right_vertex = self.edges_in_boundbox(part=piece,
-                                                                       xmin=dimensions["F"] / 2,
-                                                                       xmax=internal_xmax,
-                                                                       ymin=dimensions["G"] / 4,
-                                                                       ymax=3 * dimensions["G"] / 4,
-                                                                       zmin=0,
-                                                                       zmax=dimensions["B"] - dimensions["D"])[0]
-                    base_cut_bottom_left_vertex = self.edges_in_boundbox(part=piece,
-                                                                         xmin=-internal_xmax,
-                                                                         xmax=-dimensions["F"] / 2,
-                                                                         ymin=-3 * dimensions["G"] / 4,
-                                                                         ymax=-dimensions["G"] / 4,
-                                                                         zmin=0,
-                                                                         zmax=dimensions["B"] - dimensions["D"])[0]
-                    base_cut_top_left_vertex = self.edges_in_boundbox(part=piece,
-                                                                      xmin=-internal_xmax,
-                                                                      xmax=-dimensions["F"] / 2,
-                                                                      ymin=dimensions["G"] / 4,
-                                                                      ymax=3 * dimensions["G"] / 4,
-                                                                      zmin=0,
-                                                                      zmax=dimensions["B"] - dimensions["D"])[0]
-                    base_vertexes = [base_cut_bottom_right_vertex,
-                                     base_cut_top_right_vertex,
-                                     base_cut_bottom_left_vertex,
-                                     base_cut_top_left_vertex]
-
-                fillet_external_radius = 0.95 * utils.decimal_floor((dimensions['A'] - dimensions["E"]) / 4, 2)
-                fillet_internal_radius = 0.95 * min(utils.decimal_floor((dimensions['A'] - dimensions["E"]) / 4, 2), (dimensions["E"] - dimensions["E"] * math.cos(math.asin(dimensions["G"] / dimensions["E"]))))
-                fillet_base_radius = 0.95 * min(0.1 * dimensions["G"], (dimensions["E"] - dimensions["E"] * math.cos(math.asin(dimensions["G"] / dimensions["E"]))) / 4)
-                fillet = document.addObject("Part::Fillet", "Fillet")
-                fillet.Base = piece
-                __fillets__ = []
-                for i in external_vertexes:  
-                    __fillets__.append((i + 1, fillet_external_radius, fillet_external_radius))
-                for i in internal_vertexes:  
-                    __fillets__.append((i + 1, fillet_internal_radius, fillet_internal_radius))
-                if familySubtype == '2':
-                    for i in base_vertexes:  
-                        __fillets__.append((i + 1, fillet_base_radius, fillet_base_radius))
-                fillet.Edges = __fillets__
-                document.recompute()
-                return fillet
+            document.recompute()
+            return piece_cut
+
+        @staticmethod
+        def fillet_edges(piece, fillets):
+            document = FreeCAD.ActiveDocument
+            fillet = document.addObject("Part::Fillet", "Fillet")
+            fillet.Base = piece
+            fillet.Edges = fillets
+            document.recompute()
+            return fillet
+
+        def shape_extras_need_refine(self, data):
+            return data["familySubtype"] in ['1', '2']
 
         def get_shape_base(self, data, sketch):
-            import FreeCAD
             import Part
             import Sketcher
+            Vector = FreeCAD.Vector
+            LineSegment = Part.LineSegment
+            ArcOfCircle = Part.ArcOfCircle
+            Circle = Part.Circle
+            Constraint = Sketcher.Constraint
             dimensions = data["dimensions"]
             familySubtype = data["familySubtype"]
 
-            external_circle = sketch.addGeometry(Part.Circle(FreeCAD.Vector(0, 0, 0), FreeCAD.Vector(0, 0, 1), dimensions["A"] / 2), False)
-            sketch.addConstraint(Sketcher.Constraint('Coincident', external_circle, 3, -1, 1))
-            sketch.addConstraint(Sketcher.Constraint('Diameter', external_circle, dimensions["A"]))
+            # external circle first, then the central hole if there is one
+            diameters = [dimensions["A"]]
             if "H" in dimensions and dimensions["H"] > 0:
-                internal_circle = sketch.addGeometry(Part.Circle(FreeCAD.Vector(0, 0, 0), FreeCAD.Vector(0, 0, 1), dimensions["H"] / 2), False)
-                sketch.addConstraint(Sketcher.Constraint('Coincident', internal_circle, 3, -1, 1))
-                sketch.addConstraint(Sketcher.Constraint('Diameter', internal_circle, dimensions["H"]))
+                diameters.append(dimensions["H"])
+            circles = sketch.addGeometry([Circle(_ORIGIN, _Z_AXIS, diameter / 2) for diameter in diameters], False)
+            external_circle = circles[0]
+            constraints = []
+            for circle, diameter in zip(circles, diameters):
+                constraints.append(Constraint('Coincident', circle, 3, -1, 1))
+                constraints.append(Constraint('Diameter', circle, diameter))
+            sketch.addConstraint(constraints)
 
             if familySubtype == '1':
                 pass    
@@ -1503,52 +1619,59 @@ class FreeCADBuilder:
                 if "C" in dimensions and dimensions["C"] > 0:
                     c = dimensions["C"] / 2
                 else:
-                    c = utils.decimal_floor(dimensions["E"] * math.cos(math.asin(dimensions["G"] / dimensions["E"])) / 2, 2) * 0.95
+                    c = utils.decimal_floor(dimensions["E"] * math.sqrt(1 - (dimensions["G"] / dimensions["E"]) ** 2) / 2, 2) * 0.95
                 g = dimensions["G"] / 2
-                right_dent_top = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(a, g, 0), FreeCAD.Vector(c, g, 0)), False)
-                sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(c, g, 0), FreeCAD.Vector(c, -g, 0)), False)
-                right_dent_bottom = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(c, -g, 0), FreeCAD.Vector(a, -g, 0)), False)
-                sketch.trim(right_dent_top, FreeCAD.Vector(a, g, 0))
-                sketch.trim(right_dent_bottom, FreeCAD.Vector(a, -g, 0))
-
-                left_dent_top = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(-a, g, 0), FreeCAD.Vector(-c, g, 0)), False)
-                sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(-c, g, 0), FreeCAD.Vector(-c, -g, 0)), False)
-                left_dent_bottom = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(-c, -g, 0), FreeCAD.Vector(-a, -g, 0)), False)
-                sketch.trim(left_dent_top, FreeCAD.Vector(-a, g, 0))
-                sketch.trim(left_dent_bottom, FreeCAD.Vector(-a, -g, 0))
+                right_dent_top, _, right_dent_bottom = sketch.addGeometry([
+                    LineSegment(Vector(a, g, 0), Vector(c, g, 0)),
+                    LineSegment(Vector(c, g, 0), Vector(c, -g, 0)),
+                    LineSegment(Vector(c, -g, 0), Vector(a, -g, 0)),
+                ], False)
+                sketch.trim(right_dent_top, Vector(a, g, 0))
+                sketch.trim(right_dent_bottom, Vector(a, -g, 0))
+
+                left_dent_top, _, left_dent_bottom = sketch.addGeometry([
+                    LineSegment(Vector(-a, g, 0), Vector(-c, g, 0)),
+                    LineSegment(Vector(-c, g, 0), Vector(-c, -g, 0)),
+                    LineSegment(Vector(-c, -g, 0), Vector(-a, -g, 0)),
+                ], False)
+                sketch.trim(left_dent_top, Vector(-a, g, 0))
+                sketch.trim(left_dent_bottom, Vector(-a, -g, 0))
                 
-                sketch.addConstraint(Sketcher.Constraint('DistanceX', left_dent_top, 2, right_dent_top, 2, c * 2))
-                sketch.addConstraint(Sketcher.Constraint('DistanceX', left_dent_bottom, 1, right_dent_bottom, 1, c * 2))
+                sketch.addConstraint([
+                    Constraint('DistanceX', left_dent_top, 2, right_dent_top, 2, c * 2),
+                    Constraint('DistanceX', left_dent_bottom, 1, right_dent_bottom, 1, c * 2),
+                ])
 
-                sketch.trim(external_circle, FreeCAD.Vector(-dimensions["A"] / 2, 0, 0))
-                sketch.trim(external_circle, FreeCAD.Vector(dimensions["A"] / 2, 0, 0))
+                sketch.trim(external_circle, Vector(-dimensions["A"] / 2, 0, 0))
+                sketch.trim(external_circle, Vector(dimensions["A"] / 2, 0, 0))
 
             elif familySubtype == '3':
                 e = dimensions["E"] / 2
                 f = dimensions["F"] / 2 * 1.01  # to avoid bug in three.js
                 g = dimensions["G"] / 2
-                sketch.addGeometry(Part.ArcOfCircle(Part.Circle(FreeCAD.Vector(e - g, 0, 0), FreeCAD.Vector(0, 0, 1), g), -math.pi / 2, math.pi / 2))
-                sketch.addGeometry(Part.ArcOfCircle(Part.Circle(FreeCAD.Vector(f + g, 0, 0), FreeCAD.Vector(0, 0, 1), g), math.pi / 2, -math.pi / 2))
-                sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(f + g, g, 0), FreeCAD.Vector(e - g, g, 0)), False)
-                sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(f + g, -g, 0), FreeCAD.Vector(e - g, -g, 0)), False)
-                sketch.addGeometry(Part.ArcOfCircle(Part.Circle(FreeCAD.Vector(-(e - g), 0, 0), FreeCAD.Vector(0, 0, 1), g), math.pi / 2, -math.pi / 2))
-                sketch.addGeometry(Part.ArcOfCircle(Part.Circle(FreeCAD.Vector(-(f + g), 0, 0), FreeCAD.Vector(0, 0, 1), g), -math.pi / 2, math.pi / 2))
-                sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(-(f + g), g, 0), FreeCAD.Vector(-(e - g), g, 0)), False)
-                sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(-(f + g), -g, 0), FreeCAD.Vector(-(e - g), -g, 0)), False)
+                sketch.addGeometry([
+                    ArcOfCircle(Circle(Vector(e - g, 0, 0), _Z_AXIS, g), -math.pi / 2, math.pi / 2),
+                    ArcOfCircle(Circle(Vector(f + g, 0, 0), _Z_AXIS, g), math.pi / 2, -math.pi / 2),
+                    LineSegment(Vector(f + g, g, 0), Vector(e - g, g, 0)),
+                    LineSegment(Vector(f + g, -g, 0), Vector(e - g, -g, 0)),
+                    ArcOfCircle(Circle(Vector(-(e - g), 0, 0), _Z_AXIS, g), math.pi / 2, -math.pi / 2),
+                    ArcOfCircle(Circle(Vector(-(f + g), 0, 0), _Z_AXIS, g), -math.pi / 2, math.pi / 2),
+                    LineSegment(Vector(-(f + g), g, 0), Vector(-(e - g), g, 0)),
+                    LineSegment(Vector(-(f + g), -g, 0), Vector(-(e - g), -g, 0)),
+                ], False)
             elif familySubtype == '4':
                 g = dimensions["G"] / 2
                 c = dimensions["C"]
-                sketch.addGeometry(Part.Circle(FreeCAD.Vector(c, 0, 0), FreeCAD.Vector(0, 0, 1), g))
+                sketch.addGeometry(Circle(Vector(c, 0, 0), _Z_AXIS, g))
 
         def get_negative_winding_window(self, dimensions):
-            import FreeCAD
             from BasicShapes import Shapes
             document = FreeCAD.ActiveDocument
-            tube = Shapes.addTube(FreeCAD.ActiveDocument, "winding_window")
+            tube = Shapes.addTube(document, "winding_window")
             tube.Height = dimensions["D"]
             tube.InnerRadius = dimensions["F"] / 2
             tube.OuterRadius = dimensions["E"] / 2
-            tube.Placement = FreeCAD.Placement(FreeCAD.Vector(0, 0, dimensions["B"] - dimensions["D"]), FreeCAD.Rotation(90, 0, 0))
+            tube.Placement = FreeCAD.Placement(FreeCAD.Vector(0, 0, dimensions["B"] - dimensions["D"]), _QUARTER_TURN_ROT)
             document.recompute()
 
             return tube
@@ -1558,9 +1681,12 @@ class FreeCADBuilder:
             return {1: ["A", "B", "C", "D", "E", "F", "G"]} 
 
         def get_shape_base(self, data, sketch):
-            import FreeCAD
             import Part
             import Sketcher
+            Vector = FreeCAD.Vector
+            LineSegment = Part.LineSegment
+            Circle = Part.Circle
+            Constraint = Sketcher.Constraint
             dimensions = data["dimensions"]
 
             if "L" not in dimensions:
@@ -1573,110 +1699,108 @@ class FreeCADBuilder:
                 g_angle = math.asin(dimensions["G"] / dimensions["E"])
             else:
                 g_angle = math.asin((dimensions["E"] - ((dimensions["E"] - dimensions["F"]) / 2)) / dimensions["E"])
-
-            top_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(-dimensions["C"] / 2, dimensions["A"] / 2, 0), FreeCAD.Vector(dimensions["C"] / 2, dimensions["A"] / 2, 0)), False)
-
-            sketch.addConstraint(Sketcher.Constraint('DistanceY', top_line, 1, dimensions["A"] / 2))
-            sketch.addConstraint(Sketcher.Constraint('Block', top_line))
-
-            bottom_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(-dimensions["C"] / 2, -dimensions["A"] / 2, 0), FreeCAD.Vector(dimensions["C"] / 2, -dimensions["A"] / 2, 0)), False)
-            sketch.addConstraint(Sketcher.Constraint('Horizontal', bottom_line))
-            sketch.addConstraint(Sketcher.Constraint('DistanceY', bottom_line, 1, -dimensions["A"] / 2))
-            sketch.addConstraint(Sketcher.Constraint('Block', bottom_line))
-
-            long_top_right_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(dimensions["E"] / 2 * math.cos(g_angle), dimensions["E"] / 2 * math.sin(g_angle), 0), FreeCAD.Vector(dimensions["L"] / 2, dimensions["J"] / 2, 0)), False)
-            long_top_left_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(-dimensions["E"] / 2 * math.cos(g_angle), dimensions["E"] / 2 * math.sin(g_angle), 0), FreeCAD.Vector(-dimensions["L"] / 2, dimensions["J"] / 2, 0)), False)
-
-            side_top_right_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(dimensions["C"] / 2, dimensions["A"] / 2, 0), FreeCAD.Vector(dimensions["C"] / 2, dimensions["E"] / 2 * math.sin(g_angle), 0)), False)
-            side_corner_top_right_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(dimensions["C"] / 2, dimensions["E"] / 2 * math.sin(g_angle), 0), FreeCAD.Vector(dimensions["E"] / 2 * math.cos(g_angle), dimensions["E"] / 2 * math.sin(g_angle), 0)), False)
-            sketch.addConstraint(Sketcher.Constraint('Coincident', side_top_right_line, 2, side_corner_top_right_line, 1))
-            sketch.addConstraint(Sketcher.Constraint('Coincident', side_corner_top_right_line, 2, long_top_right_line, 1))
-            sketch.addConstraint(Sketcher.Constraint('Vertical', side_top_right_line))
-            sketch.addConstraint(Sketcher.Constraint('Horizontal', side_corner_top_right_line))
-
-            side_top_left_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(-dimensions["C"] / 2, dimensions["A"] / 2, 0), FreeCAD.Vector(-dimensions["C"] / 2, dimensions["E"] / 2 * math.sin(g_angle), 0)), False)
-            side_corner_top_left_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(-dimensions["C"] / 2, dimensions["E"] / 2 * math.sin(g_angle), 0), FreeCAD.Vector(-dimensions["E"] / 2 * math.cos(g_angle), dimensions["E"] / 2 * math.sin(g_angle), 0)), False)
-            sketch.addConstraint(Sketcher.Constraint('Coincident', side_top_left_line, 2, side_corner_top_left_line, 1))
-            sketch.addConstraint(Sketcher.Constraint('Coincident', side_corner_top_left_line, 2, long_top_left_line, 1))
-            sketch.addConstraint(Sketcher.Constraint('Vertical', side_top_left_line))
-            sketch.addConstraint(Sketcher.Constraint('Horizontal', side_corner_top_left_line))
-
-            long_bottom_right_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(dimensions["E"] / 2 * math.cos(g_angle), -dimensions["E"] / 2 * math.sin(g_angle), 0), FreeCAD.Vector(dimensions["L"] / 2, -dimensions["J"] / 2, 0)), False)
-            long_bottom_left_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(-dimensions["E"] / 2 * math.cos(g_angle), -dimensions["E"] / 2 * math.sin(g_angle), 0), FreeCAD.Vector(-dimensions["L"] / 2, -dimensions["J"] / 2, 0)), False)
-
-            side_bottom_right_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(dimensions["C"] / 2, -dimensions["A"] / 2, 0), FreeCAD.Vector(dimensions["C"] / 2, -dimensions["E"] / 2 * math.sin(g_angle), 0)), False)
-            side_corner_bottom_right_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(dimensions["C"] / 2, -dimensions["E"] / 2 * math.sin(g_angle), 0), FreeCAD.Vector(dimensions["E"] / 2 * math.cos(g_angle), -dimensions["E"] / 2 * math.sin(g_angle), 0)), False)
-            sketch.addConstraint(Sketcher.Constraint('Coincident', side_bottom_right_line, 2, side_corner_bottom_right_line, 1))
-            sketch.addConstraint(Sketcher.Constraint('Coincident', side_corner_bottom_right_line, 2, long_bottom_right_line, 1))
-            sketch.addConstraint(Sketcher.Constraint('Vertical', side_bottom_right_line))
-            sketch.addConstraint(Sketcher.Constraint('Horizontal', side_corner_bottom_right_line))
-
-            sketch.addConstraint(Sketcher.Constraint('Horizontal', long_bottom_right_line, 2, long_bottom_left_line, 2))
-
-            side_bottom_left_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(-dimensions["C"] / 2, -dimensions["A"] / 2, 0), FreeCAD.Vector(-dimensions["C"] / 2, -dimensions["E"] / 2 * math.sin(g_angle), 0)), False)
-            side_corner_bottom_left_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(-dimensions["C"] / 2, -dimensions["E"] / 2 * math.sin(g_angle), 0), FreeCAD.Vector(-dimensions["E"] / 2 * math.cos(g_angle), -dimensions["E"] / 2 * math.sin(g_angle), 0)), False)
-            sketch.addConstraint(Sketcher.Constraint('Coincident', side_bottom_left_line, 2, side_corner_bottom_left_line, 1))
-            sketch.addConstraint(Sketcher.Constraint('Coincident', side_corner_bottom_left_line, 2, long_bottom_left_line, 1))
-            sketch.addConstraint(Sketcher.Constraint('Vertical', side_bottom_left_line))
-            sketch.addConstraint(Sketcher.Constraint('Horizontal', side_corner_bottom_left_line))
-
-            sketch.addConstraint(Sketcher.Constraint('Horizontal', side_bottom_left_line, 2, side_bottom_right_line, 2))
-
-            sketch.addConstraint(Sketcher.Constraint('Coincident', side_top_right_line, 1, top_line, 2))
-            sketch.addConstraint(Sketcher.Constraint('Coincident', side_top_left_line, 1, top_line, 1))
-            sketch.addConstraint(Sketcher.Constraint('Coincident', side_bottom_right_line, 1, bottom_line, 2))
-            sketch.addConstraint(Sketcher.Constraint('Coincident', side_bottom_left_line, 1, bottom_line, 1))
-            fillet_radius = 0.9 * (dimensions["C"] / 2 - dimensions["E"] / 2 * math.cos(g_angle))
-            sketch.fillet(side_corner_top_right_line, side_top_right_line, FreeCAD.Vector(dimensions["C"] / 2 - fillet_radius, dimensions["E"] / 2 * math.sin(g_angle), 0), FreeCAD.Vector(dimensions["C"] / 2, dimensions["E"] / 2 * math.sin(g_angle) + fillet_radius, 0), fillet_radius, True, False)
-            sketch.fillet(side_corner_top_left_line, side_top_left_line, FreeCAD.Vector(-dimensions["C"] / 2 + fillet_radius, dimensions["E"] / 2 * math.sin(g_angle), 0), FreeCAD.Vector(-dimensions["C"] / 2, dimensions["E"] / 2 * math.sin(g_angle) + fillet_radius, 0), fillet_radius, True, False)
-
-            sketch.fillet(side_corner_bottom_right_line, side_bottom_right_line, FreeCAD.Vector(dimensions["C"] / 2 - fillet_radius, -dimensions["E"] / 2 * math.sin(g_angle), 0), FreeCAD.Vector(dimensions["C"] / 2, -dimensions["E"] / 2 * math.sin(g_angle) - fillet_radius, 0), fillet_radius, True, False)
-            sketch.fillet(side_corner_bottom_left_line, side_bottom_left_line, FreeCAD.Vector(-dimensions["C"] / 2 + fillet_radius, -dimensions["E"] / 2 * math.sin(g_angle), 0), FreeCAD.Vector(-dimensions["C"] / 2, -dimensions["E"] / 2 * math.sin(g_angle) - fillet_radius, 0), fillet_radius, True, False)
-            sketch.addConstraint(Sketcher.Constraint('Block', long_top_right_line))
-            sketch.addConstraint(Sketcher.Constraint('Block', long_top_left_line))
-            sketch.addConstraint(Sketcher.Constraint('Block', long_bottom_right_line))
-            sketch.addConstraint(Sketcher.Constraint('Block', long_bottom_left_line))
-
-            central_circle = sketch.addGeometry(Part.Circle(FreeCAD.Vector(0, 0, 0), FreeCAD.Vector(0, 0, 1), dimensions["F"] / 2), False)
-            sketch.addConstraint(Sketcher.Constraint('Block', central_circle))
-            short_top_right_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(dimensions["L"] / 2, dimensions["J"] / 2, 0), FreeCAD.Vector(dimensions["L"] / 4, dimensions["J"] / 2, 0)), False)
-            short_bottom_right_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(dimensions["L"] / 2, -dimensions["J"] / 2, 0), FreeCAD.Vector(dimensions["L"] / 4, -dimensions["J"] / 2, 0)), False)
-            sketch.addConstraint(Sketcher.Constraint('PointOnObject', short_top_right_line, 2, central_circle))
-            sketch.addConstraint(Sketcher.Constraint('PointOnObject', short_bottom_right_line, 2, central_circle))
-            sketch.addConstraint(Sketcher.Constraint('Coincident', short_top_right_line, 1, long_top_right_line, 2))
-            sketch.addConstraint(Sketcher.Constraint('Coincident', short_bottom_right_line, 1, long_bottom_right_line, 2))
-            sketch.addConstraint(Sketcher.Constraint('Perpendicular', central_circle, short_top_right_line)) 
-            sketch.addConstraint(Sketcher.Constraint('Perpendicular', central_circle, short_bottom_right_line)) 
-
-            short_top_left_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(-dimensions["L"] / 2, dimensions["J"] / 2, 0), FreeCAD.Vector(-dimensions["L"] / 4, dimensions["J"] / 2, 0)), False)
-            short_bottom_left_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(-dimensions["L"] / 2, -dimensions["J"] / 2, 0), FreeCAD.Vector(-dimensions["L"] / 4, -dimensions["J"] / 2, 0)), False)
-            sketch.addConstraint(Sketcher.Constraint('PointOnObject', short_top_left_line, 2, central_circle))
-            sketch.addConstraint(Sketcher.Constraint('PointOnObject', short_bottom_left_line, 2, central_circle))
-            sketch.addConstraint(Sketcher.Constraint('Coincident', short_top_left_line, 1, long_top_left_line, 2))
-            sketch.addConstraint(Sketcher.Constraint('Coincident', short_bottom_left_line, 1, long_bottom_left_line, 2))
-            sketch.addConstraint(Sketcher.Constraint('Perpendicular', central_circle, short_top_left_line)) 
-            sketch.addConstraint(Sketcher.Constraint('Perpendicular', central_circle, short_bottom_left_line)) 
-
-            sketch.addConstraint(Sketcher.Constraint('Distance', short_bottom_left_line, 2, short_top_right_line, 2, dimensions["F"]))
-
-            sketch.trim(central_circle, FreeCAD.Vector(0, dimensions["F"] / 2, 0))
-            sketch.trim(central_circle, FreeCAD.Vector(0, -dimensions["F"] / 2, 0))
-
-            # internal_circle = sketch.addGeometry(Part.Circle(FreeCAD.Vector(0, 0, 0), FreeCAD.Vector(0, 0, 1), dimensions["E"] / 2), False)
-            # sketch.addConstraint(Sketcher.Constraint('Diameter', internal_circle, dimensions["E"]))
-            # sketch.addConstraint(Sketcher.Constraint('Coincident', internal_circle, 1, -1, 1))
-            # sketch.addConstraint(Sketcher.Constraint('PointOnObject', long_bottom_left_line, 1, internal_circle))
-            # sketch.addConstraint(Sketcher.Constraint('PointOnObject', long_bottom_right_line, 1, internal_circle))
-            # sketch.addConstraint(Sketcher.Constraint('PointOnObject', long_top_left_line, 1, internal_circle))
-            # sketch.addConstraint(Sketcher.Constraint('PointOnObject', long_top_right_line, 1, internal_circle))
-
-            for index, constraint in enumerate(sketch.Constraints):
-                if constraint.Type == "Equal":
-                    sketch.delConstraint(index)
+            half_c = dimensions["C"] / 2
+            half_e_cos = dimensions["E"] / 2 * math.cos(g_angle)
+            half_e_sin = dimensions["E"] / 2 * math.sin(g_angle)
+
+            # Geometries and constraints are handed to the sketch in lists, so the solver runs once per batch instead of once per call
+            top_line, bottom_line, long_top_right_line, long_top_left_line, side_top_right_line, side_corner_top_right_line, side_top_left_line, side_corner_top_left_line, long_bottom_right_line, long_bottom_left_line, side_bottom_right_line, side_corner_bottom_right_line, side_bottom_left_line, side_corner_bottom_left_line = sketch.addGeometry([
+                LineSegment(Vector(-half_c, dimensions["A"] / 2, 0), Vector(half_c, dimensions["A"] / 2, 0)),
+                LineSegment(Vector(-half_c, -dimensions["A"] / 2, 0), Vector(half_c, -dimensions["A"] / 2, 0)),
+                LineSegment(Vector(half_e_cos, half_e_sin, 0), Vector(dimensions["L"] / 2, dimensions["J"] / 2, 0)),
+                LineSegment(Vector(-half_e_cos, half_e_sin, 0), Vector(-dimensions["L"] / 2, dimensions["J"] / 2, 0)),
+                LineSegment(Vector(half_c, dimensions["A"] / 2, 0), Vector(half_c, half_e_sin, 0)),
+                LineSegment(Vector(half_c, half_e_sin, 0), Vector(half_e_cos, half_e_sin, 0)),
+                LineSegment(Vector(-half_c, dimensions["A"] / 2, 0), Vector(-half_c, half_e_sin, 0)),
+                LineSegment(Vector(-half_c, half_e_sin, 0), Vector(-half_e_cos, half_e_sin, 0)),
+                LineSegment(Vector(half_e_cos, -half_e_sin, 0), Vector(dimensions["L"] / 2, -dimensions["J"] / 2, 0)),
+                LineSegment(Vector(-half_e_cos, -half_e_sin, 0), Vector(-dimensions["L"] / 2, -dimensions["J"] / 2, 0)),
+                LineSegment(Vector(half_c, -dimensions["A"] / 2, 0), Vector(half_c, -half_e_sin, 0)),
+                LineSegment(Vector(half_c, -half_e_sin, 0), Vector(half_e_cos, -half_e_sin, 0)),
+                LineSegment(Vector(-half_c, -dimensions["A"] / 2, 0), Vector(-half_c, -half_e_sin, 0)),
+                LineSegment(Vector(-half_c, -half_e_sin, 0), Vector(-half_e_cos, -half_e_sin, 0)),
+            ], False)
+
+            sketch.addConstraint([
+                Constraint('DistanceY', top_line, 1, dimensions["A"] / 2),
+                Constraint('Block', top_line),
+                Constraint('Horizontal', bottom_line),
+                Constraint('DistanceY', bottom_line, 1, -dimensions["A"] / 2),
+                Constraint('Block', bottom_line),
+                Constraint('Coincident', side_top_right_line, 2, side_corner_top_right_line, 1),
+                Constraint('Coincident', side_corner_top_right_line, 2, long_top_right_line, 1),
+                Constraint('Vertical', side_top_right_line),
+                Constraint('Horizontal', side_corner_top_right_line),
+                Constraint('Coincident', side_top_left_line, 2, side_corner_top_left_line, 1),
+                Constraint('Coincident', side_corner_top_left_line, 2, long_top_left_line, 1),
+                Constraint('Vertical', side_top_left_line),
+                Constraint('Horizontal', side_corner_top_left_line),
+                Constraint('Coincident', side_bottom_right_line, 2, side_corner_bottom_right_line, 1),
+                Constraint('Coincident', side_corner_bottom_right_line, 2, long_bottom_right_line, 1),
+                Constraint('Vertical', side_bottom_right_line),
+                Constraint('Horizontal', side_corner_bottom_right_line),
+                Constraint('Horizontal', long_bottom_right_line, 2, long_bottom_left_line, 2),
+                Constraint('Coincident', side_bottom_left_line, 2, side_corner_bottom_left_line, 1),
+                Constraint('Coincident', side_corner_bottom_left_line, 2, long_bottom_left_line, 1),
+                Constraint('Vertical', side_bottom_left_line),
+                Constraint('Horizontal', side_corner_bottom_left_line),
+                Constraint('Horizontal', side_bottom_left_line, 2, side_bottom_right_line, 2),
+                Constraint('Coincident', side_top_right_line, 1, top_line, 2),
+                Constraint('Coincident', side_top_left_line, 1, top_line, 1),
+                Constraint('Coincident', side_bottom_right_line, 1, bottom_line, 2),
+                Constraint('Coincident', side_bottom_left_line, 1, bottom_line, 1),
+            ])
+
+            fillet_radius = 0.9 * (half_c - half_e_cos)
+            for sign_x, sign_y, corner_line, side_line in [(1, 1, side_corner_top_right_line, side_top_right_line),
+                                                           (-1, 1, side_corner_top_left_line, side_top_left_line),
+                                                           (1, -1, side_corner_bottom_right_line, side_bottom_right_line),
+                                                           (-1, -1, side_corner_bottom_left_line, side_bottom_left_line)]:
+                sketch.fillet(corner_line, side_line, Vector(sign_x * (half_c - fillet_radius), sign_y * half_e_sin, 0), Vector(sign_x * half_c, sign_y * (half_e_sin + fillet_radius), 0), fillet_radius, True, False)
+
+            central_circle, short_top_right_line, short_bottom_right_line, short_top_left_line, short_bottom_left_line = sketch.addGeometry([
+                Circle(_ORIGIN, _Z_AXIS, dimensions["F"] / 2),
+                LineSegment(Vector(dimensions["L"] / 2, dimensions["J"] / 2, 0), Vector(dimensions["L"] / 4, dimensions["J"] / 2, 0)),
+                LineSegment(Vector(dimensions["L"] / 2, -dimensions["J"] / 2, 0), Vector(dimensions["L"] / 4, -dimensions["J"] / 2, 0)),
+                LineSegment(Vector(-dimensions["L"] / 2, dimensions["J"] / 2, 0), Vector(-dimensions["L"] / 4, dimensions["J"] / 2, 0)),
+                LineSegment(Vector(-dimensions["L"] / 2, -dimensions["J"] / 2, 0), Vector(-dimensions["L"] / 4, -dimensions["J"] / 2, 0)),
+            ], False)
+
+            sketch.addConstraint([
+                Constraint('Block', long_top_right_line),
+                Constraint('Block', long_top_left_line),
+                Constraint('Block', long_bottom_right_line),
+                Constraint('Block', long_bottom_left_line),
+                Constraint('Block', central_circle),
+                Constraint('PointOnObject', short_top_right_line, 2, central_circle),
+                Constraint('PointOnObject', short_bottom_right_line, 2, central_circle),
+                Constraint('Coincident', short_top_right_line, 1, long_top_right_line, 2),
+                Constraint('Coincident', short_bottom_right_line, 1, long_bottom_right_line, 2),
+                Constraint('Perpendicular', central_circle, short_top_right_line),
+                Constraint('Perpendicular', central_circle, short_bottom_right_line),
+                Constraint('PointOnObject', short_top_left_line, 2, central_circle),
+                Constraint('PointOnObject', short_bottom_left_line, 2, central_circle),
+                Constraint('Coincident', short_top_left_line, 1, long_top_left_line, 2),
+                Constraint('Coincident', short_bottom_left_line, 1, long_bottom_left_line, 2),
+                Constraint('Perpendicular', central_circle, short_top_left_line),
+                Constraint('Perpendicular', central_circle, short_bottom_left_line),
+                Constraint('Distance', short_bottom_left_line, 2, short_top_right_line, 2, dimensions["F"]),
+            ])
+
+            sketch.trim(central_circle, Vector(0, dimensions["F"] / 2, 0))
+            sketch.trim(central_circle, Vector(0, -dimensions["F"] / 2, 0))
+
+            # deleted from the back so the remaining indexes stay valid
+            equal_constraints = [index for index, constraint in enumerate(sketch.Constraints) if constraint.Type == "Equal"]
+            for index in reversed(equal_constraints):
+                sketch.delConstraint(index)
 
         def get_shape_extras(self, data, piece):
             return piece
 
+        def shape_extras_need_refine(self, data):
+            return False
+
     class Rm(P):
         def get_dimensions_and_subtypes(self):
             return {
@@ -1686,8 +1810,35 @@ class FreeCADBuilder:
                 4: ["A", "B", "C", "D", "E", "F", "G", "H", "J"]
             }
 
+        def _column_subtype_1(z, c, f, g):
+            return 0, (z - c) / g
+
+        def _column_subtype_2(z, c, f, g):
+            return math.sqrt(f * f - c * c), (z - c) / g
+
+        def _column_subtype_3(z, c, f, g):
+            return c - z + g, (z - c) / g
+
+        def _column_subtype_4(z, c, f, g):
+            return 0, 1
+
+        _column_per_subtype = {
+            '1': _column_subtype_1,
+            '2': _column_subtype_2,
+            '3': _column_subtype_3,
+            '4': _column_subtype_4,
+        }
+
+        @classmethod
+        def get_outline_parameters(cls, familySubtype, p, z, a, c, f, g):
+            # t is the half height where the slanted lines meet the central column, (s, r) the corner
+            # where they meet the 45 degree lines, with n the slope of the slanted lines
+            t, n = cls._column_per_subtype[familySubtype](z, c, f, g)
+            r = (a + p / 2 - c + n * t) / (n + 1)
+            s = n * r + c
+            return t, r, s
+
         def get_shape_base(self, data, sketch):
-            import FreeCAD
             import Part
             import Sketcher
             dimensions = data["dimensions"]
@@ -1699,98 +1850,88 @@ class FreeCADBuilder:
             c = dimensions["C"] / 2
             g = dimensions["G"] / 2
             a = dimensions["A"] / 2
-            e = dimensions["E"] / 2
             f = dimensions["F"] / 2
 
-            if familySubtype == '1':
-                t = 0
-                n = (z - c) / g
-                r = (a + p / 2 - c + n * t) / (n + 1)
-                s = n * r + c
-            elif familySubtype == '2':
-                t = f * math.sin(math.acos(c / f))
-                n = (z - c) / g
-                r = (a + p / 2 - c + n * t) / (n + 1)
-                s = n * r + c
-            elif familySubtype == '3':
-                t = c - e * math.cos(math.asin(g / e)) + g
-                n = (z - c) / g
-                r = (a + p / 2 - c + n * t) / (n + 1)
-                s = n * r + c
-            elif familySubtype == '4':
-                t = 0
-                n = 1
-                r = (a + p / 2 - c + n * t) / (n + 1)
-                s = n * r + c
-
-            top_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(-p / 2, dimensions["A"] / 2, 0), FreeCAD.Vector(p / 2, dimensions["A"] / 2, 0)), False)
-            top_right_line_45_degrees = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(p / 2, a, 0), FreeCAD.Vector(s, r, 0)), False)
-            bottom_right_line_45_degrees = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(p / 2, -a, 0), FreeCAD.Vector(s, -r, 0)), False)
-            top_left_line_45_degrees = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(-p / 2, a, 0), FreeCAD.Vector(-s, r, 0)), False)
-            bottom_left_line_45_degrees = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(-p / 2, -a, 0), FreeCAD.Vector(-s, -r, 0)), False)
-
-            top_right_line_x_degrees = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(s, r, 0), FreeCAD.Vector(c, t, 0)), False)
-            bottom_right_line_x_degrees = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(s, -r, 0), FreeCAD.Vector(c, -t, 0)), False)
-            top_left_line_x_degrees = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(-s, r, 0), FreeCAD.Vector(-c, t, 0)), False)
-            bottom_left_line_x_degrees = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(-s, -r, 0), FreeCAD.Vector(-c, -t, 0)), False)
-            sketch.addConstraint(Sketcher.Constraint('Coincident', top_right_line_45_degrees, 2, top_right_line_x_degrees, 1))
-            sketch.addConstraint(Sketcher.Constraint('Coincident', bottom_right_line_45_degrees, 2, bottom_right_line_x_degrees, 1))
-            sketch.addConstraint(Sketcher.Constraint('Coincident', top_left_line_45_degrees, 2, top_left_line_x_degrees, 1))
-            sketch.addConstraint(Sketcher.Constraint('Coincident', bottom_left_line_45_degrees, 2, bottom_left_line_x_degrees, 1))
+            t, r, s = self.get_outline_parameters(familySubtype, p, z, a, c, f, g)
+
+            def vector(point):
+                return FreeCAD.Vector(float(point[0]), float(point[1]), 0)
+
+            # Outline of the top right quadrant, from the top line to the central column; the other
+            # three quadrants are its reflections, in the order top right, bottom right, top left, bottom left
+            quadrant = numpy.array([[p / 2, a], [s, r], [c, t]])
+            reflections = numpy.array([[1, 1], [1, -1], [-1, 1], [-1, -1]])
+            corners = quadrant[numpy.newaxis, :, :] * reflections[:, numpy.newaxis, :]
+
+            lines = [Part.LineSegment(vector([-p / 2, a]), vector([p / 2, a]))]
+            lines += [Part.LineSegment(vector(corner[0]), vector(corner[1])) for corner in corners]
+            lines += [Part.LineSegment(vector(corner[1]), vector(corner[2])) for corner in corners]
+            (top_line,
+             top_right_line_45_degrees, bottom_right_line_45_degrees, top_left_line_45_degrees, bottom_left_line_45_degrees,
+             top_right_line_x_degrees, bottom_right_line_x_degrees, top_left_line_x_degrees, bottom_left_line_x_degrees) = sketch.addGeometry(lines, False)
+
+            constraints = []
+            constraints.append(Sketcher.Constraint('Coincident', top_right_line_45_degrees, 2, top_right_line_x_degrees, 1))
+            constraints.append(Sketcher.Constraint('Coincident', bottom_right_line_45_degrees, 2, bottom_right_line_x_degrees, 1))
+            constraints.append(Sketcher.Constraint('Coincident', top_left_line_45_degrees, 2, top_left_line_x_degrees, 1))
+            constraints.append(Sketcher.Constraint('Coincident', bottom_left_line_45_degrees, 2, bottom_left_line_x_degrees, 1))
             if c < f:
-                central_circle = sketch.addGeometry(Part.Circle(FreeCAD.Vector(0, 0, 0), FreeCAD.Vector(0, 0, 1), dimensions["F"] / 2), False)
+                central_circle = sketch.addGeometry(Part.Circle(_ORIGIN, _Z_AXIS, dimensions["F"] / 2), False)
+                # blocked right away, the trims below replace the circle
                 sketch.addConstraint(Sketcher.Constraint('Block', central_circle))
 
                 sketch.trim(central_circle, FreeCAD.Vector(0, dimensions["F"] / 2, 0))
                 sketch.trim(central_circle, FreeCAD.Vector(0, -dimensions["F"] / 2, 0))
 
             if 'H' in dimensions and dimensions['H'] > 0:
-                hole_circle = sketch.addGeometry(Part.Circle(FreeCAD.Vector(0, 0, 0), FreeCAD.Vector(0, 0, 1), dimensions["H"] / 2), False)
-                sketch.addConstraint(Sketcher.Constraint('Block', hole_circle))
+                hole_circle = sketch.addGeometry(Part.Circle(_ORIGIN, _Z_AXIS, dimensions["H"] / 2), False)
+                constraints.append(Sketcher.Constraint('Block', hole_circle))
 
-            sketch.addConstraint(Sketcher.Constraint('DistanceY', top_line, 1, dimensions["A"] / 2))
-            sketch.addConstraint(Sketcher.Constraint('Block', top_line))
+            constraints.append(Sketcher.Constraint('DistanceY', top_line, 1, a))
+            constraints.append(Sketcher.Constraint('Block', top_line))
 
-            bottom_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(-p / 2, -dimensions["A"] / 2, 0), FreeCAD.Vector(p / 2, -dimensions["A"] / 2, 0)), False)
-            sketch.addConstraint(Sketcher.Constraint('Horizontal', bottom_line))
-            sketch.addConstraint(Sketcher.Constraint('DistanceY', bottom_line, 1, -dimensions["A"] / 2))
-            sketch.addConstraint(Sketcher.Constraint('Block', bottom_line))
+            bottom_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(-p / 2, -a, 0), FreeCAD.Vector(p / 2, -a, 0)), False)
+            constraints.append(Sketcher.Constraint('Horizontal', bottom_line))
+            constraints.append(Sketcher.Constraint('DistanceY', bottom_line, 1, -a))
+            constraints.append(Sketcher.Constraint('Block', bottom_line))
 
             if familySubtype == '3':
                 right_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(c, t, 0), FreeCAD.Vector(c, -t, 0)), False)
                 left_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(-c, t, 0), FreeCAD.Vector(-c, -t, 0)), False)
-                sketch.addConstraint(Sketcher.Constraint('Equal', right_line, left_line)) 
-                sketch.addConstraint(Sketcher.Constraint('Coincident', top_right_line_x_degrees, 2, right_line, 1))
-                sketch.addConstraint(Sketcher.Constraint('Coincident', bottom_right_line_x_degrees, 2, right_line, 2))
-                sketch.addConstraint(Sketcher.Constraint('DistanceX', right_line, 2, dimensions["C"] / 2))
-                sketch.addConstraint(Sketcher.Constraint('Block', right_line))
+                constraints.append(Sketcher.Constraint('Equal', right_line, left_line))
+                constraints.append(Sketcher.Constraint('Coincident', top_right_line_x_degrees, 2, right_line, 1))
+                constraints.append(Sketcher.Constraint('Coincident', bottom_right_line_x_degrees, 2, right_line, 2))
+                constraints.append(Sketcher.Constraint('DistanceX', right_line, 2, dimensions["C"] / 2))
+                constraints.append(Sketcher.Constraint('Block', right_line))
                 if 'H' in dimensions and dimensions['H'] > 0:
-                    sketch.addConstraint(Sketcher.Constraint('Symmetric', left_line, 1, right_line, 2, hole_circle, 3)) 
-                sketch.addConstraint(Sketcher.Constraint('Coincident', top_left_line_x_degrees, 2, left_line, 1))
-                sketch.addConstraint(Sketcher.Constraint('Coincident', bottom_left_line_x_degrees, 2, left_line, 2))
-                sketch.addConstraint(Sketcher.Constraint('Block', left_line))
+                    constraints.append(Sketcher.Constraint('Symmetric', left_line, 1, right_line, 2, hole_circle, 3))
+                constraints.append(Sketcher.Constraint('Coincident', top_left_line_x_degrees, 2, left_line, 1))
+                constraints.append(Sketcher.Constraint('Coincident', bottom_left_line_x_degrees, 2, left_line, 2))
+                constraints.append(Sketcher.Constraint('Block', left_line))
             if familySubtype == '4':
-                sketch.addConstraint(Sketcher.Constraint('Coincident', top_left_line_x_degrees, 2, bottom_left_line_x_degrees, 2))
-                sketch.addConstraint(Sketcher.Constraint('Coincident', top_right_line_x_degrees, 2, bottom_right_line_x_degrees, 2))
-                sketch.addConstraint(Sketcher.Constraint('DistanceX', top_right_line_x_degrees, 2, c))
+                constraints.append(Sketcher.Constraint('Coincident', top_left_line_x_degrees, 2, bottom_left_line_x_degrees, 2))
+                constraints.append(Sketcher.Constraint('Coincident', top_right_line_x_degrees, 2, bottom_right_line_x_degrees, 2))
+                constraints.append(Sketcher.Constraint('DistanceX', top_right_line_x_degrees, 2, c))
 
             if familySubtype == '3' or familySubtype == '4':
-                sketch.addConstraint(Sketcher.Constraint('Coincident', top_right_line_45_degrees, 1, top_line, 2))
-                sketch.addConstraint(Sketcher.Constraint('Coincident', top_left_line_45_degrees, 1, top_line, 1))
-                sketch.addConstraint(Sketcher.Constraint('Coincident', bottom_right_line_45_degrees, 1, bottom_line, 2))
-                sketch.addConstraint(Sketcher.Constraint('Coincident', bottom_left_line_45_degrees, 1, bottom_line, 1))
-                sketch.addConstraint(Sketcher.Constraint('Angle', top_right_line_45_degrees, 2, top_right_line_x_degrees, 1, math.pi / 2)) 
-                sketch.addConstraint(Sketcher.Constraint('Angle', bottom_right_line_45_degrees, 2, bottom_right_line_x_degrees, 1, -math.pi / 2)) 
-                sketch.addConstraint(Sketcher.Constraint('Angle', top_left_line_45_degrees, 2, top_left_line_x_degrees, 1, -math.pi / 2)) 
-                sketch.addConstraint(Sketcher.Constraint('Angle', bottom_left_line_45_degrees, 2, bottom_left_line_x_degrees, 1, math.pi / 2)) 
-                sketch.addConstraint(Sketcher.Constraint('DistanceX', top_right_line_x_degrees, 2, top_left_line_x_degrees, 2, -2 * c))
-                sketch.addConstraint(Sketcher.Constraint('DistanceX', bottom_right_line_x_degrees, 2, bottom_left_line_x_degrees, 2, -2 * c))
-                sketch.addConstraint(Sketcher.Constraint('Angle', top_right_line_45_degrees, 1, top_line, 2, -3 * math.pi / 4)) 
-                sketch.addConstraint(Sketcher.Constraint('Angle', top_left_line_45_degrees, 1, top_line, 1, 3 * math.pi / 4)) 
-                sketch.addConstraint(Sketcher.Constraint('Angle', bottom_right_line_45_degrees, 1, bottom_line, 2, 3 * math.pi / 4)) 
-                sketch.addConstraint(Sketcher.Constraint('Angle', bottom_left_line_45_degrees, 1, bottom_line, 1, -3 * math.pi / 4)) 
-                sketch.addConstraint(Sketcher.Constraint('Vertical', top_right_line_x_degrees, 2, bottom_right_line_x_degrees, 2))
-                sketch.addConstraint(Sketcher.Constraint('Horizontal', top_right_line_x_degrees, 2, top_left_line_x_degrees, 2))
+                constraints.append(Sketcher.Constraint('Coincident', top_right_line_45_degrees, 1, top_line, 2))
+                constraints.append(Sketcher.Constraint('Coincident', top_left_line_45_degrees, 1, top_line, 1))
+                constraints.append(Sketcher.Constraint('Coincident', bottom_right_line_45_degrees, 1, bottom_line, 2))
+                constraints.append(Sketcher.Constraint('Coincident', bottom_left_line_45_degrees, 1, bottom_line, 1))
+                constraints.append(Sketcher.Constraint('Angle', top_right_line_45_degrees, 2, top_right_line_x_degrees, 1, math.pi / 2))
+                constraints.append(Sketcher.Constraint('Angle', bottom_right_line_45_degrees, 2, bottom_right_line_x_degrees, 1, -math.pi / 2))
+                constraints.append(Sketcher.Constraint('Angle', top_left_line_45_degrees, 2, top_left_line_x_degrees, 1, -math.pi / 2))
+                constraints.append(Sketcher.Constraint('Angle', bottom_left_line_45_degrees, 2, bottom_left_line_x_degrees, 1, math.pi / 2))
+                constraints.append(Sketcher.Constraint('DistanceX', top_right_line_x_degrees, 2, top_left_line_x_degrees, 2, -2 * c))
+                constraints.append(Sketcher.Constraint('DistanceX', bottom_right_line_x_degrees, 2, bottom_left_line_x_degrees, 2, -2 * c))
+                constraints.append(Sketcher.Constraint('Angle', top_right_line_45_degrees, 1, top_line, 2, -3 * math.pi / 4))
+                constraints.append(Sketcher.Constraint('Angle', top_left_line_45_degrees, 1, top_line, 1, 3 * math.pi / 4))
+                constraints.append(Sketcher.Constraint('Angle', bottom_right_line_45_degrees, 1, bottom_line, 2, 3 * math.pi / 4))
+                constraints.append(Sketcher.Constraint('Angle', bottom_left_line_45_degrees, 1, bottom_line, 1, -3 * math.pi / 4))
+                constraints.append(Sketcher.Constraint('Vertical', top_right_line_x_degrees, 2, bottom_right_line_x_degrees, 2))
+                constraints.append(Sketcher.Constraint('Horizontal', top_right_line_x_degrees, 2, top_left_line_x_degrees, 2))
+
+            sketch.addConstraint(constraints)
 
         def get_shape_extras(self, data, piece):
             # rotation in order to avoid cut in projection
@@ -1799,6 +1940,9 @@ class FreeCADBuilder:
             piece.Base.Placement.Matrix = m
             return piece
 
+        def shape_extras_need_refine(self, data):
+            return False
+
     class Pm(P):
         def get_dimensions_and_subtypes(self):
             return {
@@ -1807,13 +1951,11 @@ class FreeCADBuilder:
             }
 
         def get_shape_base(self, data, sketch):
-            import FreeCAD
             import Part
             import Sketcher
             dimensions = data["dimensions"]
             familySubtype = data["familySubtype"]
 
-            c = dimensions["C"] / 2
             g = dimensions["G"] / 2
             a = dimensions["A"] / 2
             e = dimensions["E"] / 2
@@ -1830,78 +1972,48 @@ class FreeCADBuilder:
             alpha = dimensions["alpha"] / 180 * math.pi
 
             beta = math.asin(g / e)
+            e_cos = e * math.cos(beta)
+            e_sin = e * math.sin(beta)
             xc = f
-            z = c - e * math.cos(beta) + e * math.sin(beta)
-
-            internal_circle = sketch.addGeometry(Part.Circle(FreeCAD.Vector(0, 0, 0), FreeCAD.Vector(0, 0, 1), dimensions["H"] / 2), False)
-            central_circle = sketch.addGeometry(Part.Circle(FreeCAD.Vector(0, 0, 0), FreeCAD.Vector(0, 0, 1), dimensions["F"] / 2), False)
-            external_circle = sketch.addGeometry(Part.Circle(FreeCAD.Vector(0, 0, 0), FreeCAD.Vector(0, 0, 1), dimensions["A"] / 2), False)
-            winding_circle = sketch.addGeometry(Part.Circle(FreeCAD.Vector(0, 0, 0), FreeCAD.Vector(0, 0, 1), dimensions["E"] / 2), False)
-            sketch.addConstraint(Sketcher.Constraint('Coincident', central_circle, 3, -1, 1))
-            sketch.addConstraint(Sketcher.Constraint('Coincident', external_circle, 3, -1, 1))
-            sketch.addConstraint(Sketcher.Constraint('Coincident', internal_circle, 3, -1, 1))
-            sketch.addConstraint(Sketcher.Constraint('Coincident', winding_circle, 3, -1, 1))
-            sketch.addConstraint(Sketcher.Constraint('Diameter', central_circle, dimensions["F"]))
-            sketch.addConstraint(Sketcher.Constraint('Diameter', external_circle, dimensions["A"]))
-            sketch.addConstraint(Sketcher.Constraint('Diameter', internal_circle, dimensions["H"]))
-            sketch.addConstraint(Sketcher.Constraint('Diameter', winding_circle, dimensions["E"]))
-
-            side_top_right_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(e * math.cos(beta), e * math.sin(beta), 0), FreeCAD.Vector(xc, 0, 0)), False)
-            side_bottom_right_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(e * math.cos(beta), -e * math.sin(beta), 0), FreeCAD.Vector(xc, 0, 0)), False)
-            side_top_left_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(-e * math.cos(beta), e * math.sin(beta), 0), FreeCAD.Vector(-xc, 0, 0)), False)
-            side_bottom_left_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(-e * math.cos(beta), -e * math.sin(beta), 0), FreeCAD.Vector(-xc, 0, 0)), False)
-
-            sketch.addConstraint(Sketcher.Constraint('PointOnObject', side_top_right_line, 1, external_circle))
-            sketch.addConstraint(Sketcher.Constraint('PointOnObject', side_bottom_right_line, 1, external_circle))
-            sketch.addConstraint(Sketcher.Constraint('PointOnObject', side_top_left_line, 1, external_circle))
-            sketch.addConstraint(Sketcher.Constraint('PointOnObject', side_bottom_left_line, 1, external_circle))
-            sketch.addConstraint(Sketcher.Constraint('Vertical', side_top_right_line, 1, side_bottom_right_line, 1))
-            sketch.addConstraint(Sketcher.Constraint('Vertical', side_top_left_line, 1, side_bottom_left_line, 1))
-            sketch.addConstraint(Sketcher.Constraint('Horizontal', side_top_left_line, 1, side_top_right_line, 1))
-            sketch.addConstraint(Sketcher.Constraint('Horizontal', side_top_left_line, 2, side_top_right_line, 2))
-            sketch.addConstraint(Sketcher.Constraint('Angle', side_top_right_line, 2, side_bottom_right_line, 2, -alpha))
-            sketch.addConstraint(Sketcher.Constraint('Angle', side_top_left_line, 2, side_bottom_left_line, 2, alpha))
-            if familySubtype == '1':
-                sketch.addConstraint(Sketcher.Constraint('Horizontal', side_top_left_line, 2, -1, 1))
-                sketch.addConstraint(Sketcher.Constraint('PointOnObject', side_top_right_line, 2, central_circle))
-                sketch.addConstraint(Sketcher.Constraint('PointOnObject', side_top_left_line, 2, central_circle))
-                sketch.addConstraint(Sketcher.Constraint('Coincident', side_top_right_line, 2, side_bottom_right_line, 2))
-                sketch.addConstraint(Sketcher.Constraint('Coincident', side_top_left_line, 2, side_bottom_left_line, 2))
-
-                sketch.fillet(side_top_right_line, side_bottom_right_line, FreeCAD.Vector(e * math.cos(beta), e * math.sin(beta), 0), FreeCAD.Vector(e * math.cos(beta), -e * math.sin(beta), 0), a - c, True, False)
-                right_fillet = len(sketch.Geometry) - 1
-
-                sketch.addConstraint(Sketcher.Constraint('Vertical', right_fillet, 1, right_fillet, 2))
-                sketch.split(right_fillet, FreeCAD.Vector(c, 0, 0))
-                right_fillet_bottom = len(sketch.Geometry) - 1
-                sketch.addConstraint(Sketcher.Constraint('DistanceX', right_fillet_bottom, 1, -1, 1, -c))
-
-                sketch.fillet(side_top_left_line, side_bottom_left_line, FreeCAD.Vector(-e * math.cos(beta), e * math.sin(beta), 0), FreeCAD.Vector(-e * math.cos(beta), -e * math.sin(beta), 0), a - c, True, False)
-                left_fillet = len(sketch.Geometry) - 1
-                sketch.addConstraint(Sketcher.Constraint('Vertical', left_fillet, 1, left_fillet, 2))
-                sketch.split(left_fillet, FreeCAD.Vector(-c, 0, 0))
-                left_fillet_bottom = len(sketch.Geometry) - 1
-                sketch.addConstraint(Sketcher.Constraint('DistanceX', left_fillet_bottom, 1, -1, 1, c))
-            elif familySubtype == '2':
-                side_right_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(c, z, 0), FreeCAD.Vector(c, -z, 0)), False)
-                side_left_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(-c, z, 0), FreeCAD.Vector(-c, -z, 0)), False)
-                sketch.addConstraint(Sketcher.Constraint('DistanceX', side_right_line, 1, -1, 1, -c))
-                sketch.addConstraint(Sketcher.Constraint('DistanceX', side_left_line, 1, -1, 1, c))
-                # sketch.addConstraint(Sketcher.Constraint('Symmetric', side_right_line, 1, side_right_line, 2, -1, 1)) 
-
-                # sketch.addConstraint(Sketcher.Constraint('DistanceY', side_right_line, 1, -1, 1, -z))
-                # sketch.addConstraint(Sketcher.Constraint('DistanceY', side_right_line, 2, -1, 1, z))
-
-                sketch.addConstraint(Sketcher.Constraint('Vertical', side_right_line, 1, side_right_line, 2))
-                sketch.addConstraint(Sketcher.Constraint('Vertical', side_left_line, 1, side_left_line, 2))
-                sketch.addConstraint(Sketcher.Constraint('Coincident', side_top_right_line, 2, side_right_line, 1))
-                sketch.addConstraint(Sketcher.Constraint('Coincident', side_bottom_right_line, 2, side_right_line, 2))
-                sketch.addConstraint(Sketcher.Constraint('Coincident', side_top_left_line, 2, side_left_line, 1))
-                sketch.addConstraint(Sketcher.Constraint('Coincident', side_bottom_left_line, 2, side_left_line, 2))
+
+            internal_circle = sketch.addGeometry(Part.Circle(_ORIGIN, _Z_AXIS, dimensions["H"] / 2), False)
+            external_circle = sketch.addGeometry(Part.Circle(_ORIGIN, _Z_AXIS, dimensions["A"] / 2), False)
+            winding_circle = sketch.addGeometry(Part.Circle(_ORIGIN, _Z_AXIS, dimensions["E"] / 2), False)
+            constraints = [
+                Sketcher.Constraint('Coincident', external_circle, 3, -1, 1),
+                Sketcher.Constraint('Coincident', internal_circle, 3, -1, 1),
+                Sketcher.Constraint('Coincident', winding_circle, 3, -1, 1),
+                Sketcher.Constraint('Diameter', external_circle, dimensions["A"]),
+                Sketcher.Constraint('Diameter', internal_circle, dimensions["H"]),
+                Sketcher.Constraint('Diameter', winding_circle, dimensions["E"]),
+            ]
+
+            # top right, bottom right, top left and bottom left, reflections of each other
+            side_lines = sketch.addGeometry([
+                Part.LineSegment(FreeCAD.Vector(sign_x * e_cos, sign_y * e_sin, 0), FreeCAD.Vector(sign_x * xc, 0, 0))
+                for sign_x, sign_y in [(1, 1), (1, -1), (-1, 1), (-1, -1)]
+            ], False)
+            side_top_right_line, side_bottom_right_line, side_top_left_line, side_bottom_left_line = side_lines
+
+            constraints += [
+                Sketcher.Constraint('PointOnObject', side_top_right_line, 1, external_circle),
+                Sketcher.Constraint('PointOnObject', side_bottom_right_line, 1, external_circle),
+                Sketcher.Constraint('PointOnObject', side_top_left_line, 1, external_circle),
+                Sketcher.Constraint('PointOnObject', side_bottom_left_line, 1, external_circle),
+                Sketcher.Constraint('Vertical', side_top_right_line, 1, side_bottom_right_line, 1),
+                Sketcher.Constraint('Vertical', side_top_left_line, 1, side_bottom_left_line, 1),
+                Sketcher.Constraint('Horizontal', side_top_left_line, 1, side_top_right_line, 1),
+                Sketcher.Constraint('Horizontal', side_top_left_line, 2, side_top_right_line, 2),
+                Sketcher.Constraint('Angle', side_top_right_line, 2, side_bottom_right_line, 2, -alpha),
+                Sketcher.Constraint('Angle', side_top_left_line, 2, side_bottom_left_line, 2, alpha),
+            ]
+            construction_circles = [winding_circle] + self._sides_per_subtype[familySubtype](self, sketch, constraints, side_lines, dimensions, e_cos, e_sin)
 
             sketch.trim(winding_circle, FreeCAD.Vector(e, 0, 0))
-            sketch.addConstraint(Sketcher.Constraint('DistanceY', winding_circle, 1, -1, 1, -g))
-            sketch.addConstraint(Sketcher.Constraint('DistanceY', winding_circle, 2, -1, 1, g))
+            sketch.addConstraint([
+                Sketcher.Constraint('DistanceY', winding_circle, 1, -1, 1, -g),
+                Sketcher.Constraint('DistanceY', winding_circle, 2, -1, 1, g),
+            ])
 
             top_dent_left = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(-b, a, 0), FreeCAD.Vector(-b, a - t, 0)), False)
             sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(-b, a - t, 0), FreeCAD.Vector(b, a - t, 0)), False)
@@ -1922,8 +2034,72 @@ class FreeCADBuilder:
             sketch.trim(bottom_dent_left, FreeCAD.Vector(-b, -a, 0))
             sketch.trim(bottom_dent_right, FreeCAD.Vector(b, -a, 0))
             sketch.trim(external_circle_bottom, FreeCAD.Vector(0, -a, 0))
-            sketch.delGeometries([winding_circle])
-            sketch.delGeometries([central_circle])
+            sketch.delGeometries(construction_circles)
+
+        def _sides_subtype_1(self, sketch, constraints, side_lines, dimensions, e_cos, e_sin):
+            import Part
+            import Sketcher
+            side_top_right_line, side_bottom_right_line, side_top_left_line, side_bottom_left_line = side_lines
+            a = dimensions["A"] / 2
+            c = dimensions["C"] / 2
+
+            # only anchors the side line ends, the central column itself comes from the fillets
+            central_circle = sketch.addGeometry(Part.Circle(_ORIGIN, _Z_AXIS, dimensions["F"] / 2), False)
+            constraints += [
+                Sketcher.Constraint('Coincident', central_circle, 3, -1, 1),
+                Sketcher.Constraint('Diameter', central_circle, dimensions["F"]),
+                Sketcher.Constraint('Horizontal', side_top_left_line, 2, -1, 1),
+                Sketcher.Constraint('PointOnObject', side_top_right_line, 2, central_circle),
+                Sketcher.Constraint('PointOnObject', side_top_left_line, 2, central_circle),
+                Sketcher.Constraint('Coincident', side_top_right_line, 2, side_bottom_right_line, 2),
+                Sketcher.Constraint('Coincident', side_top_left_line, 2, side_bottom_left_line, 2),
+            ]
+            # the fillets below need the lines already constrained
+            sketch.addConstraint(constraints)
+
+            # split deletes and re-adds the edge it cuts, so each new index is read right after the operation that creates it
+            sketch.fillet(side_top_right_line, side_bottom_right_line, FreeCAD.Vector(e_cos, e_sin, 0), FreeCAD.Vector(e_cos, -e_sin, 0), a - c, True, False)
+            right_fillet = len(sketch.Geometry) - 1
+            sketch.addConstraint(Sketcher.Constraint('Vertical', right_fillet, 1, right_fillet, 2))
+            sketch.split(right_fillet, FreeCAD.Vector(c, 0, 0))
+            right_fillet_bottom = len(sketch.Geometry) - 1
+            sketch.addConstraint(Sketcher.Constraint('DistanceX', right_fillet_bottom, 1, -1, 1, -c))
+
+            sketch.fillet(side_top_left_line, side_bottom_left_line, FreeCAD.Vector(-e_cos, e_sin, 0), FreeCAD.Vector(-e_cos, -e_sin, 0), a - c, True, False)
+            left_fillet = len(sketch.Geometry) - 1
+            sketch.addConstraint(Sketcher.Constraint('Vertical', left_fillet, 1, left_fillet, 2))
+            sketch.split(left_fillet, FreeCAD.Vector(-c, 0, 0))
+            left_fillet_bottom = len(sketch.Geometry) - 1
+            sketch.addConstraint(Sketcher.Constraint('DistanceX', left_fillet_bottom, 1, -1, 1, c))
+            return [central_circle]
+
+        def _sides_subtype_2(self, sketch, constraints, side_lines, dimensions, e_cos, e_sin):
+            import Part
+            import Sketcher
+            side_top_right_line, side_bottom_right_line, side_top_left_line, side_bottom_left_line = side_lines
+            c = dimensions["C"] / 2
+            z = c - e_cos + e_sin
+
+            side_right_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(c, z, 0), FreeCAD.Vector(c, -z, 0)), False)
+            side_left_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(-c, z, 0), FreeCAD.Vector(-c, -z, 0)), False)
+            constraints += [
+                Sketcher.Constraint('DistanceX', side_right_line, 1, -1, 1, -c),
+                Sketcher.Constraint('DistanceX', side_left_line, 1, -1, 1, c),
+                Sketcher.Constraint('Vertical', side_right_line, 1, side_right_line, 2),
+                Sketcher.Constraint('Vertical', side_left_line, 1, side_left_line, 2),
+                Sketcher.Constraint('Coincident', side_top_right_line, 2, side_right_line, 1),
+                Sketcher.Constraint('Coincident', side_bottom_right_line, 2, side_right_line, 2),
+                Sketcher.Constraint('Coincident', side_top_left_line, 2, side_left_line, 1),
+                Sketcher.Constraint('Coincident', side_bottom_left_line, 2, side_left_line, 2),
+            ]
+            sketch.addConstraint(constraints)
+            return []
+
+        # each returns the construction geometry to delete once the outline is trimmed
+        _sides_per_subtype = {
+            '1': _sides_subtype_1,
+            '2': _sides_subtype_2,
+        }
 
         def get_shape_extras(self, data, piece):
             # rotation in order to avoid cut in projection
@@ -1932,61 +2108,56 @@ class FreeCADBuilder:
             piece.Base.Placement.Matrix = m
             return piece
 
+        def shape_extras_need_refine(self, data):
+            return False
+
     class E(IPiece):
         def get_negative_winding_window(self, dimensions):
-            import FreeCAD
+            import Part
             document = FreeCAD.ActiveDocument
+            length = dimensions["C"]
+            height = dimensions["D"]
+            zmin = dimensions["B"] - height
 
-            winding_window_cube = document.addObject("Part::Box", "winding_window_cube")
-            winding_window_cube.Length = dimensions["C"]
-            winding_window_cube.Width = dimensions["E"]
-            winding_window_cube.Height = dimensions["D"]
-            winding_window_cube.Placement = FreeCAD.Placement(FreeCAD.Vector(-dimensions["C"] / 2, -dimensions["E"] / 2, dimensions["B"] - dimensions["D"]), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
-
-            central_column_cube = document.addObject("Part::Box", "central_column_cube")
-            central_column_cube.Length = dimensions["C"]
-            central_column_cube.Width = dimensions["F"]
-            central_column_cube.Height = dimensions["D"]
-            central_column_cube.Placement = FreeCAD.Placement(FreeCAD.Vector(-dimensions["C"] / 2, -dimensions["F"] / 2, dimensions["B"] - dimensions["D"]), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
-
-            negative_winding_window = document.addObject("Part::Cut", "negative_winding_window")
-            negative_winding_window.Base = winding_window_cube
-            negative_winding_window.Tool = central_column_cube
-            document.recompute()
+            winding_window_cube = Part.makeBox(length, dimensions["E"], height, FreeCAD.Vector(-length / 2, -dimensions["E"] / 2, zmin))
+            central_column_cube = Part.makeBox(length, dimensions["F"], height, FreeCAD.Vector(-length / 2, -dimensions["F"] / 2, zmin))
+
+            negative_winding_window = document.addObject("Part::Feature", "negative_winding_window")
+            negative_winding_window.Shape = winding_window_cube.cut(central_column_cube)
 
             return negative_winding_window
 
+        _winding_window_dimensions = ("B", "C", "D", "E", "F", "G", "K")
+
+        @classmethod
+        def make_winding_window_shape(cls, b, c, d, e, f, g, k):
+            raise NotImplementedError
+
+        @classmethod
+        @functools.lru_cache(maxsize=128)
+        def get_winding_window_shape(cls, *dimensions):
+            # Only depends on the family and its dimensions, so sweeps over the same core reuse the booleans; callers copy the result
+            return cls.make_winding_window_shape(*dimensions)
+
+        def add_cached_winding_window(self, dimensions):
+            document = FreeCAD.ActiveDocument
+            winding_window = document.addObject("Part::Feature", "winding_window")
+            winding_window.Shape = self.get_winding_window_shape(*self.get_dimensions_key(dimensions, self._winding_window_dimensions)).copy()
+
+            return winding_window
+
         def get_shape_base(self, data, sketch):
-            import FreeCAD
-            import Part
-            import Sketcher
             dimensions = data["dimensions"]
 
             c = dimensions["C"] / 2
             a = dimensions["A"] / 2
 
-            top_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(-c, a, 0), FreeCAD.Vector(c, a, 0)), False)
-            right_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(c, a, 0), FreeCAD.Vector(c, -a, 0)), False)
-            bottom_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(c, -a, 0), FreeCAD.Vector(-c, -a, 0)), False)
-            left_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(-c, -a, 0), FreeCAD.Vector(-c, a, 0)), False)
-            sketch.addConstraint(Sketcher.Constraint('Coincident', top_line, 2, right_line, 1))
-            sketch.addConstraint(Sketcher.Constraint('Coincident', right_line, 2, bottom_line, 1))
-            sketch.addConstraint(Sketcher.Constraint('Coincident', bottom_line, 2, left_line, 1))
-            sketch.addConstraint(Sketcher.Constraint('Coincident', left_line, 2, top_line, 1))
-            sketch.addConstraint(Sketcher.Constraint('DistanceY', bottom_line, 1, -1, 1, a))
-            sketch.addConstraint(Sketcher.Constraint('DistanceY', top_line, 1, -1, 1, -a))
-            sketch.addConstraint(Sketcher.Constraint('DistanceX', left_line, 1, -1, 1, c))
-            sketch.addConstraint(Sketcher.Constraint('DistanceX', right_line, 1, -1, 1, -c))
-            sketch.addConstraint(Sketcher.Constraint('Vertical', right_line))
-            sketch.addConstraint(Sketcher.Constraint('Vertical', left_line))
-            sketch.addConstraint(Sketcher.Constraint('Horizontal', top_line))
-            sketch.addConstraint(Sketcher.Constraint('Horizontal', bottom_line))
+            self.add_centered_rectangle(sketch, c, a)
 
         def get_shape_extras(self, data, piece):
             return piece
 
         def apply_machining(self, piece, machining, dimensions):
-            import FreeCAD
             document = FreeCAD.ActiveDocument
 
             original_tool = document.addObject("Part::Box", "tool")
@@ -2008,7 +2179,7 @@ class FreeCADBuilder:
                     y_coordinate = -dimensions["A"] / 2
 
             original_tool.Height = machining['length'] * 1000
-            original_tool.Placement = FreeCAD.Placement(FreeCAD.Vector(x_coordinate, y_coordinate, (machining['coordinates'][1] - machining['length'] / 2) * 1000), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
+            original_tool.Placement = FreeCAD.Placement(FreeCAD.Vector(x_coordinate, y_coordinate, (machining['coordinates'][1] - machining['length'] / 2) * 1000), _IDENTITY_ROT)
 
             if machining['coordinates'][0] == 0:
                 tool = original_tool
@@ -2021,7 +2192,7 @@ class FreeCADBuilder:
                 central_column_tool.Length = central_column_length
                 central_column_tool.Width = central_column_width
                 central_column_tool.Height = machining['length'] * 1000
-                central_column_tool.Placement = FreeCAD.Placement(FreeCAD.Vector(-central_column_length / 2, -central_column_width / 2, (machining['coordinates'][1] - machining['length'] / 2) * 1000), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
+                central_column_tool.Placement = FreeCAD.Placement(FreeCAD.Vector(-central_column_length / 2, -central_column_width / 2, (machining['coordinates'][1] - machining['length'] / 2) * 1000), _IDENTITY_ROT)
 
                 tool = document.addObject("Part::Cut", "machined_piece")
                 tool.Base = original_tool
@@ -2040,115 +2211,73 @@ class FreeCADBuilder:
             return {1: ["A", "B", "C", "D", "E", "F", "G"]}
 
         def get_negative_winding_window(self, dimensions):
-            import FreeCAD
             from BasicShapes import Shapes
             document = FreeCAD.ActiveDocument
-            winding_window = Shapes.addTube(FreeCAD.ActiveDocument, "winding_window")
-            winding_window.Height = dimensions["D"]
-            winding_window.InnerRadius = dimensions["F"] / 2
-            winding_window.OuterRadius = dimensions["E"] / 2
-            winding_window.Placement = FreeCAD.Placement(FreeCAD.Vector(0, 0, dimensions["B"] - dimensions["D"]), FreeCAD.Rotation(90, 0, 0))
-            document.recompute()
+            zmin = dimensions["B"] - dimensions["D"]
 
             if 'G' in dimensions and dimensions["G"] > dimensions["F"]:
+                import Part
+                Vector = FreeCAD.Vector
+                base = Vector(0, 0, zmin)
+                tube = Part.makeCylinder(dimensions["E"] / 2, dimensions["D"], base).cut(Part.makeCylinder(dimensions["F"] / 2, dimensions["D"], base))
+                lateral_width = dimensions["G"] / 2 - dimensions["F"] / 2
+                lateral_cubes = [
+                    Part.makeBox(dimensions["C"], lateral_width, dimensions["D"], Vector(-dimensions["C"] / 2, dimensions["F"] / 2, zmin)),
+                    Part.makeBox(dimensions["C"], lateral_width, dimensions["D"], Vector(-dimensions["C"] / 2, -dimensions["G"] / 2, zmin)),
+                ]
                 if dimensions["C"] > dimensions["F"]:
-                    lateral_top_cube = document.addObject("Part::Box", "lateral_top_cube")
-                    lateral_top_cube.Length = dimensions["C"]
-                    lateral_top_cube.Width = dimensions["G"] / 2 - dimensions["F"] / 2
-                    lateral_top_cube.Height = dimensions["D"]
-                    lateral_top_cube.Placement = FreeCAD.Placement(FreeCAD.Vector(-dimensions["C"] / 2, dimensions["F"] / 2, dimensions["B"] - dimensions["D"]), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
-
-                    lateral_bottom_cube = document.addObject("Part::Box", "lateral_bottom_cube")
-                    lateral_bottom_cube.Length = dimensions["C"]
-                    lateral_bottom_cube.Width = dimensions["G"] / 2 - dimensions["F"] / 2
-                    lateral_bottom_cube.Height = dimensions["D"]
-                    lateral_bottom_cube.Placement = FreeCAD.Placement(FreeCAD.Vector(-dimensions["C"] / 2, -dimensions["G"] / 2, dimensions["B"] - dimensions["D"]), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
-
-                    lateral_right_cube = document.addObject("Part::Box", "lateral_right_cube")
-                    lateral_right_cube.Length = dimensions["C"] / 2 - dimensions["F"] / 2
-                    lateral_right_cube.Width = dimensions["G"]
-                    lateral_right_cube.Height = dimensions["D"]
-                    lateral_right_cube.Placement = FreeCAD.Placement(FreeCAD.Vector(dimensions["F"] / 2, -dimensions["G"] / 2, dimensions["B"] - dimensions["D"]), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
-
-                    lateral_left_cube = document.addObject("Part::Box", "lateral_left_cube")
-                    lateral_left_cube.Length = dimensions["C"] / 2 - dimensions["F"] / 2
-                    lateral_left_cube.Width = dimensions["G"]
-                    lateral_left_cube.Height = dimensions["D"]
-                    lateral_left_cube.Placement = FreeCAD.Placement(FreeCAD.Vector(-dimensions["C"] / 2, -dimensions["G"] / 2, dimensions["B"] - dimensions["D"]), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
-                    winding_window_aux = document.addObject("Part::MultiFuse", "Fusion")
-                    winding_window_aux.Shapes = [winding_window, lateral_top_cube, lateral_bottom_cube, lateral_right_cube, lateral_left_cube]
-                else:
-                    lateral_top_cube = document.addObject("Part::Box", "lateral_top_cube")
-                    lateral_top_cube.Length = dimensions["C"]
-                    lateral_top_cube.Width = dimensions["G"] / 2 - dimensions["F"] / 2
-                    lateral_top_cube.Height = dimensions["D"]
-                    lateral_top_cube.Placement = FreeCAD.Placement(FreeCAD.Vector(-dimensions["C"] / 2, dimensions["F"] / 2, dimensions["B"] - dimensions["D"]), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
-
-                    lateral_bottom_cube = document.addObject("Part::Box", "lateral_bottom_cube")
-                    lateral_bottom_cube.Length = dimensions["C"]
-                    lateral_bottom_cube.Width = dimensions["G"] / 2 - dimensions["F"] / 2
-                    lateral_bottom_cube.Height = dimensions["D"]
-                    lateral_bottom_cube.Placement = FreeCAD.Placement(FreeCAD.Vector(-dimensions["C"] / 2, -dimensions["G"] / 2, dimensions["B"] - dimensions["D"]), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
-                    winding_window_aux = document.addObject("Part::MultiFuse", "Fusion")
-                    winding_window_aux.Shapes = [winding_window, lateral_top_cube, lateral_bottom_cube]
-
-                document.recompute()
-                winding_window = winding_window_aux
+                    lateral_length = dimensions["C"] / 2 - dimensions["F"] / 2
+                    lateral_cubes += [
+                        Part.makeBox(lateral_length, dimensions["G"], dimensions["D"], Vector(dimensions["F"] / 2, -dimensions["G"] / 2, zmin)),
+                        Part.makeBox(lateral_length, dimensions["G"], dimensions["D"], Vector(-dimensions["C"] / 2, -dimensions["G"] / 2, zmin)),
+                    ]
+
+                winding_window = document.addObject("Part::Feature", "winding_window")
+                winding_window.Shape = tube.fuse(lateral_cubes)
+            else:
+                winding_window = Shapes.addTube(document, "winding_window")
+                winding_window.Height = dimensions["D"]
+                winding_window.InnerRadius = dimensions["F"] / 2
+                winding_window.OuterRadius = dimensions["E"] / 2
+                winding_window.Placement = FreeCAD.Placement(FreeCAD.Vector(0, 0, zmin), _QUARTER_TURN_ROT)
 
             return winding_window
 
         def get_shape_extras(self, data, piece):
             return piece
 
+        def shape_extras_need_refine(self, data):
+            return False
+
     class El(E):
         def get_dimensions_and_subtypes(self):
             return {1: ["A", "B", "C", "D", "E", "F", "F2"]}
 
         def get_negative_winding_window(self, dimensions):
-            import FreeCAD
+            import Part
             document = FreeCAD.ActiveDocument
+            height = dimensions["D"]
+            zmin = dimensions["B"] - height
+            half_f = dimensions["F"] / 2
+            column_straight_length = dimensions["F2"] - dimensions["F"]
 
-            winding_window_cube = document.addObject("Part::Box", "winding_window_cube")
-            winding_window_cube.Length = dimensions["C"]
-            winding_window_cube.Width = dimensions["E"]
-            winding_window_cube.Height = dimensions["D"]
-            winding_window_cube.Placement = FreeCAD.Placement(FreeCAD.Vector(-dimensions["C"] / 2, -dimensions["E"] / 2, dimensions["B"] - dimensions["D"]), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
-
-            central_column_cube = document.addObject("Part::Box", "central_column_cube")
-            central_column_cube.Length = dimensions["F2"] - dimensions["F"]
-            central_column_cube.Width = dimensions["F"]
-            central_column_cube.Height = dimensions["D"]
-            central_column_cube.Placement = FreeCAD.Placement(FreeCAD.Vector(-(dimensions["F2"] - dimensions["F"]) / 2, -dimensions["F"] / 2, dimensions["B"] - dimensions["D"]), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
-
-            cylinder_left = document.addObject("Part::Cylinder", "cylinder_left")
-            cylinder_left.Height = dimensions["D"]
-            cylinder_left.Radius = dimensions["F"] / 2
-            cylinder_left.Angle = 180
-            cylinder_left.Placement = FreeCAD.Placement(FreeCAD.Vector(-(dimensions["F2"] - dimensions["F"]) / 2, 0, dimensions["B"] - dimensions["D"]), FreeCAD.Rotation(90, 0, 0))
-            document.recompute()
-
-            cylinder_right = document.addObject("Part::Cylinder", "cylinder_right")
-            cylinder_right.Height = dimensions["D"]
-            cylinder_right.Radius = dimensions["F"] / 2
-            cylinder_right.Angle = 180
-            cylinder_right.Placement = FreeCAD.Placement(FreeCAD.Vector((dimensions["F2"] - dimensions["F"]) / 2, 0, dimensions["B"] - dimensions["D"]), FreeCAD.Rotation(-90, 0, 0))
-            document.recompute()
-
-            central_column = document.addObject("Part::MultiFuse", "central_column")
-            central_column.Shapes = [cylinder_left, central_column_cube, cylinder_right]
-
-            document.recompute()
+            winding_window_cube = Part.makeBox(dimensions["C"], dimensions["E"], height, FreeCAD.Vector(-dimensions["C"] / 2, -dimensions["E"] / 2, zmin))
+            central_column_cube = Part.makeBox(column_straight_length, dimensions["F"], height, FreeCAD.Vector(-column_straight_length / 2, -half_f, zmin))
+            cylinder_left = self.make_half_cylinder(half_f, height, FreeCAD.Vector(-column_straight_length / 2, 0, zmin), 90)
+            cylinder_right = self.make_half_cylinder(half_f, height, FreeCAD.Vector(column_straight_length / 2, 0, zmin), -90)
+            central_column = central_column_cube.fuse([cylinder_left, cylinder_right])
 
-            negative_winding_window = document.addObject("Part::Cut", "negative_winding_window")
-            negative_winding_window.Base = winding_window_cube
-            negative_winding_window.Tool = central_column
-            document.recompute()
+            negative_winding_window = document.addObject("Part::Feature", "negative_winding_window")
+            negative_winding_window.Shape = winding_window_cube.cut(central_column)
 
             return negative_winding_window
 
         def get_shape_extras(self, data, piece):
             return piece
 
+        def shape_extras_need_refine(self, data):
+            return False
+
     class Etd(Er):
         def get_dimensions_and_subtypes(self):
             return {1: ["A", "B", "C", "D", "E", "F"]}
@@ -2159,74 +2288,50 @@ class FreeCADBuilder:
                 1: ["A", "B", "C", "D", "E", "F", "G"],
             }
 
+        def shape_extras_need_refine(self, data):
+            return True
+
         def get_shape_extras(self, data, piece):
-            import FreeCAD
             document = FreeCAD.ActiveDocument
             dimensions = data["dimensions"]
 
-            refined_piece = document.addObject('Part::Refine', 'RefineAux')
-            refined_piece.Source = piece
+            refined_shape = piece.Shape.removeSplitter()
 
-            document.recompute()
-
-            right_side_vertex = self.edges_in_boundbox(part=refined_piece,
+            ymax = dimensions["E"] / 2 + (dimensions["A"] - dimensions["E"]) / 4
+            zmax = dimensions["B"] - dimensions["D"]
+            right_side_vertex = self.edges_in_boundbox(shape=refined_shape,
                                                        xmin=dimensions["F"] / 2 + (dimensions["C"] - dimensions["F"]) / 4,
                                                        xmax=dimensions["C"],
-                                                       ymin=-(dimensions["E"] / 2 + (dimensions["A"] - dimensions["E"]) / 4),
-                                                       ymax=dimensions["E"] / 2 + (dimensions["A"] - dimensions["E"]) / 4,
-                                                       zmin=(dimensions["B"] - dimensions["D"]) / 2,
-                                                       zmax=dimensions["B"] - dimensions["D"])
+                                                       ymin=-ymax,
+                                                       ymax=ymax,
+                                                       zmin=zmax / 2,
+                                                       zmax=zmax)
 
-            vertexes = right_side_vertex
-            fillet = document.addObject("Part::Fillet", "Fillet")
-            fillet.Base = refined_piece
-            fillet_radius = (dimensions["B"] - dimensions["D"]) / 2
-            __fillets__ = []
-            for i in vertexes:  
-                __fillets__.append((i + 1, fillet_radius, fillet_radius))
-            fillet.Edges = __fillets__
-            document.recompute()
+            fillet = document.addObject("Part::Feature", "Fillet")
+            fillet.Shape = refined_shape.makeFillet(zmax / 2, [refined_shape.Edges[i] for i in right_side_vertex])
             return fillet
 
         def get_negative_winding_window(self, dimensions):
-            import FreeCAD
-            from BasicShapes import Shapes
+            import Part
             document = FreeCAD.ActiveDocument
-            winding_window = Shapes.addTube(FreeCAD.ActiveDocument, "winding_window")
-            winding_window.Height = dimensions["D"]
-            winding_window.InnerRadius = dimensions["F"] / 2
-            winding_window.OuterRadius = dimensions["E"] / 2
-            winding_window.Placement = FreeCAD.Placement(FreeCAD.Vector(0, 0, dimensions["B"] - dimensions["D"]), FreeCAD.Rotation(90, 0, 0))
-            document.recompute()
+            height = dimensions["D"]
+            zmin = dimensions["B"] - height
+            half_c = dimensions["C"] / 2
+            half_e = dimensions["E"] / 2
+            half_f = dimensions["F"] / 2
+
+            Vector = FreeCAD.Vector
+            base = Vector(0, 0, zmin)
+            tube = Part.makeCylinder(half_e, height, base).cut(Part.makeCylinder(half_f, height, base))
+            lateral_cubes = [
+                Part.makeBox(half_c, half_e - half_f, height, Vector(0, half_f, zmin)),
+                Part.makeBox(half_c, half_e - half_f, height, Vector(0, -half_e, zmin)),
+                Part.makeBox(half_c - half_f, dimensions["E"], height, Vector(half_f, -half_e, zmin)),
+                Part.makeBox(half_c - half_f, dimensions["G"], height, Vector(-half_c, -dimensions["G"] / 2, zmin)),
+            ]
 
-            lateral_top_cube = document.addObject("Part::Box", "lateral_top_cube")
-            lateral_top_cube.Length = dimensions["C"] / 2
-            lateral_top_cube.Width = dimensions["E"] / 2 - dimensions["F"] / 2
-            lateral_top_cube.Height = dimensions["D"]
-            lateral_top_cube.Placement = FreeCAD.Placement(FreeCAD.Vector(0, dimensions["F"] / 2, dimensions["B"] - dimensions["D"]), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
-
-            lateral_bottom_cube = document.addObject("Part::Box", "lateral_bottom_cube")
-            lateral_bottom_cube.Length = dimensions["C"] / 2
-            lateral_bottom_cube.Width = dimensions["E"] / 2 - dimensions["F"] / 2
-            lateral_bottom_cube.Height = dimensions["D"]
-            lateral_bottom_cube.Placement = FreeCAD.Placement(FreeCAD.Vector(0, -dimensions["E"] / 2, dimensions["B"] - dimensions["D"]), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
-
-            lateral_right_cube = document.addObject("Part::Box", "lateral_right_cube")
-            lateral_right_cube.Length = dimensions["C"] / 2 - dimensions["F"] / 2
-            lateral_right_cube.Width = dimensions["E"]
-            lateral_right_cube.Height = dimensions["D"]
-            lateral_right_cube.Placement = FreeCAD.Placement(FreeCAD.Vector(dimensions["F"] / 2, -dimensions["E"] / 2, dimensions["B"] - dimensions["D"]), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
-
-            lateral_left_cube = document.addObject("Part::Box", "lateral_left_cube")
-            lateral_left_cube.Length = dimensions["C"] / 2 - dimensions["F"] / 2
-            lateral_left_cube.Width = dimensions["G"]
-            lateral_left_cube.Height = dimensions["D"]
-            lateral_left_cube.Placement = FreeCAD.Placement(FreeCAD.Vector(-dimensions["C"] / 2, -dimensions["G"] / 2, dimensions["B"] - dimensions["D"]), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
-
-            winding_window_aux = document.addObject("Part::MultiFuse", "Fusion")
-            winding_window_aux.Shapes = [winding_window, lateral_top_cube, lateral_bottom_cube, lateral_right_cube, lateral_left_cube]
-            document.recompute()
-            winding_window = winding_window_aux
+            winding_window = document.addObject("Part::Feature", "winding_window")
+            winding_window.Shape = tube.fuse(lateral_cubes)
 
             return winding_window
 
@@ -2234,41 +2339,30 @@ class FreeCADBuilder:
         def get_dimensions_and_subtypes(self):
             return {1: ["A", "B", "C", "D", "E", "F", "G"]}
 
+        def shape_extras_need_refine(self, data):
+            return True
+
         def get_shape_extras(self, data, piece):
-            import FreeCAD
             document = FreeCAD.ActiveDocument
             dimensions = data["dimensions"]
 
-            refined_piece = document.addObject('Part::Refine', 'RefineAux')
-            refined_piece.Source = piece
-
-            document.recompute()
-
-            right_side_vertex = self.edges_in_boundbox(part=refined_piece,
-                                                       xmin=dimensions["C"] / 2 - (dimensions["C"] / 2 - dimensions["E"] / 2 * math.cos(math.asin(dimensions["G"] / dimensions["E"]))) / 2,
-                                                       xmax=dimensions["C"] / 2,
-                                                       ymin=-(dimensions["E"] / 2 + (dimensions["A"] - dimensions["E"]) / 4),
-                                                       ymax=dimensions["E"] / 2 + (dimensions["A"] - dimensions["E"]) / 4,
-                                                       zmin=(dimensions["B"] - dimensions["D"]) / 2,
-                                                       zmax=dimensions["B"] - dimensions["D"])
-            left_side_vertex = self.edges_in_boundbox(part=refined_piece,
-                                                      xmin=-dimensions["C"] / 2,
-                                                      xmax=-dimensions["C"] / 2 + (dimensions["C"] / 2 - dimensions["E"] / 2 * math.cos(math.asin(dimensions["G"] / dimensions["E"]))) / 2,
-                                                      ymin=-(dimensions["E"] / 2 + (dimensions["A"] - dimensions["E"]) / 4),
-                                                      ymax=dimensions["E"] / 2 + (dimensions["A"] - dimensions["E"]) / 4,
-                                                      zmin=(dimensions["B"] - dimensions["D"]) / 2,
-                                                      zmax=dimensions["B"] - dimensions["D"])
-
-            vertexes = right_side_vertex
-            vertexes.extend(left_side_vertex)
-            fillet = document.addObject("Part::Fillet", "Fillet")
-            fillet.Base = refined_piece
-            fillet_radius = min(dimensions["C"] / 2 - dimensions["E"] / 2 * math.cos(math.asin(dimensions["G"] / dimensions["E"])), (dimensions["B"] - dimensions["D"]) / 2)
-            __fillets__ = []
-            for i in vertexes:  
-                __fillets__.append((i + 1, fillet_radius, fillet_radius))
-            fillet.Edges = __fillets__
-            document.recompute()
+            refined_shape = piece.Shape.removeSplitter()
+
+            # x where the winding window arc meets the slot edge, as E / 2 * cos(asin(G / E))
+            slot_x = math.sqrt(dimensions["E"] ** 2 - dimensions["G"] ** 2) / 2
+            column_gap = dimensions["C"] / 2 - slot_x
+            lateral_width = column_gap / 2
+            ymax = dimensions["E"] / 2 + (dimensions["A"] - dimensions["E"]) / 4
+            zmin = (dimensions["B"] - dimensions["D"]) / 2
+            zmax = dimensions["B"] - dimensions["D"]
+            right_side_vertex, left_side_vertex = self.edges_in_boundboxes(refined_shape, [
+                (dimensions["C"] / 2 - lateral_width, -ymax, zmin, dimensions["C"] / 2, ymax, zmax),
+                (-dimensions["C"] / 2, -ymax, zmin, -dimensions["C"] / 2 + lateral_width, ymax, zmax),
+            ])
+
+            vertexes = right_side_vertex + left_side_vertex
+            fillet = document.addObject("Part::Feature", "Fillet")
+            fillet.Shape = refined_shape.makeFillet(min(column_gap, zmin), [refined_shape.Edges[i] for i in vertexes])
             return fillet
 
     class Ec(Er):
@@ -2276,7 +2370,6 @@ class FreeCADBuilder:
             return {1: ["A", "B", "C", "D", "E", "F", "T", "s"]}
 
         def get_shape_base(self, data, sketch):
-            import FreeCAD
             import Part
             import Sketcher
             dimensions = data["dimensions"]
@@ -2286,28 +2379,14 @@ class FreeCADBuilder:
             t = dimensions["T"] / 2
             s = dimensions["s"] / 2
 
-            top_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(-c, a, 0), FreeCAD.Vector(c, a, 0)), False)
-            right_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(c, a, 0), FreeCAD.Vector(c, -a, 0)), False)
-            bottom_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(c, -a, 0), FreeCAD.Vector(-c, -a, 0)), False)
-            left_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(-c, -a, 0), FreeCAD.Vector(-c, a, 0)), False)
-            sketch.addConstraint(Sketcher.Constraint('Coincident', top_line, 2, right_line, 1))
-            sketch.addConstraint(Sketcher.Constraint('Coincident', right_line, 2, bottom_line, 1))
-            sketch.addConstraint(Sketcher.Constraint('Coincident', bottom_line, 2, left_line, 1))
-            sketch.addConstraint(Sketcher.Constraint('Coincident', left_line, 2, top_line, 1))
-            sketch.addConstraint(Sketcher.Constraint('DistanceY', bottom_line, 1, -1, 1, a))
-            sketch.addConstraint(Sketcher.Constraint('DistanceX', left_line, 1, -1, 1, c))
-            sketch.addConstraint(Sketcher.Constraint('DistanceX', right_line, 1, -1, 1, -c))
-            sketch.addConstraint(Sketcher.Constraint('Vertical', right_line))
-            sketch.addConstraint(Sketcher.Constraint('Vertical', left_line))
-            sketch.addConstraint(Sketcher.Constraint('Horizontal', top_line))
-            sketch.addConstraint(Sketcher.Constraint('Horizontal', bottom_line))
+            top_line, right_line, bottom_line, left_line = self.add_centered_rectangle(sketch, c, a)
 
             sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(-s, a, 0), FreeCAD.Vector(-s, t + s, 0)), False)
             sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(s, a, 0), FreeCAD.Vector(s, t + s, 0)), False)
             sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(-s, -a, 0), FreeCAD.Vector(-s, -t - s, 0)), False)
             sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(s, -a, 0), FreeCAD.Vector(s, -t - s, 0)), False)
-            sketch.addGeometry(Part.ArcOfCircle(Part.Circle(FreeCAD.Vector(0, t + s, 0), FreeCAD.Vector(0, 0, 1), s), math.pi, 0))
-            sketch.addGeometry(Part.ArcOfCircle(Part.Circle(FreeCAD.Vector(0, -t - s, 0), FreeCAD.Vector(0, 0, 1), s), 0, math.pi))
+            sketch.addGeometry(Part.ArcOfCircle(Part.Circle(FreeCAD.Vector(0, t + s, 0), _Z_AXIS, s), math.pi, 0))
+            sketch.addGeometry(Part.ArcOfCircle(Part.Circle(FreeCAD.Vector(0, -t - s, 0), _Z_AXIS, s), 0, math.pi))
 
             sketch.trim(top_line, FreeCAD.Vector(0, a, 0))
             sketch.trim(bottom_line, FreeCAD.Vector(0, -a, 0))
@@ -2316,54 +2395,34 @@ class FreeCADBuilder:
         def get_dimensions_and_subtypes(self):
             return {1: ["A", "B", "C", "D", "E", "F", "G", "K"]}
 
-        def get_negative_winding_window(self, dimensions):
-            import FreeCAD
-            from BasicShapes import Shapes
-            document = FreeCAD.ActiveDocument
-            winding_window = Shapes.addTube(FreeCAD.ActiveDocument, "winding_window")
-            winding_window.Height = dimensions["D"]
-            winding_window.InnerRadius = dimensions["F"] / 2
-            winding_window.OuterRadius = dimensions["E"] / 2
-            winding_window.Placement = FreeCAD.Placement(FreeCAD.Vector(dimensions["C"] / 2 - dimensions["K"], 0, dimensions["B"] - dimensions["D"]), FreeCAD.Rotation(90, 0, 0))
-            document.recompute()
-
-            lateral_top_cube = document.addObject("Part::Box", "lateral_top_cube")
-            lateral_top_cube.Length = dimensions["C"] / 2
-            lateral_top_cube.Width = dimensions["E"] / 2 - dimensions["F"] / 2
-            lateral_top_cube.Height = dimensions["D"]
-            lateral_top_cube.Placement = FreeCAD.Placement(FreeCAD.Vector(dimensions["C"] / 2 - dimensions["K"], dimensions["F"] / 2, dimensions["B"] - dimensions["D"]), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
-
-            lateral_bottom_cube = document.addObject("Part::Box", "lateral_bottom_cube")
-            lateral_bottom_cube.Length = dimensions["C"] / 2
-            lateral_bottom_cube.Width = dimensions["E"] / 2 - dimensions["F"] / 2
-            lateral_bottom_cube.Height = dimensions["D"]
-            lateral_bottom_cube.Placement = FreeCAD.Placement(FreeCAD.Vector(dimensions["C"] / 2 - dimensions["K"], -dimensions["E"] / 2, dimensions["B"] - dimensions["D"]), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
-
-            lateral_right_cube = document.addObject("Part::Box", "lateral_right_cube")
-            lateral_right_cube.Length = dimensions["C"] / 2 - dimensions["F"] / 2
-            lateral_right_cube.Width = dimensions["E"]
-            lateral_right_cube.Height = dimensions["D"]
-            lateral_right_cube.Placement = FreeCAD.Placement(FreeCAD.Vector(dimensions["C"] - dimensions["F"] / 2, -dimensions["E"] / 2, dimensions["B"] - dimensions["D"]), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
-
-            shapes = [winding_window, lateral_top_cube, lateral_bottom_cube, lateral_right_cube]
-            if "G" in dimensions and dimensions['G'] > 0:
-                lateral_left_cube = document.addObject("Part::Box", "lateral_left_cube")
-                lateral_left_cube.Length = dimensions["C"] / 2 - dimensions["F"] / 2
-                lateral_left_cube.Width = dimensions["G"]
-                lateral_left_cube.Height = dimensions["D"]
-                lateral_left_cube.Placement = FreeCAD.Placement(FreeCAD.Vector(-dimensions["C"] / 2, -dimensions["G"] / 2, dimensions["B"] - dimensions["D"]), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
-                shapes.append(lateral_left_cube)
-
-            winding_window_aux = document.addObject("Part::MultiFuse", "Fusion")
-            winding_window_aux.Shapes = shapes
+        @classmethod
+        def make_winding_window_shape(cls, b, c, d, e, f, g, k):
+            import Part
+            Vector = FreeCAD.Vector
+            height = d
+            zmin = b - height
+            center_x = c / 2 - k
+            half_c = c / 2
+            half_e = e / 2
+            half_f = f / 2
+
+            tube_center = Vector(center_x, 0, zmin)
+            tube = Part.makeCylinder(half_e, height, tube_center).cut(Part.makeCylinder(half_f, height, tube_center))
+
+            lateral_cubes = [
+                Part.makeBox(half_c, half_e - half_f, height, Vector(center_x, half_f, zmin)),
+                Part.makeBox(half_c, half_e - half_f, height, Vector(center_x, -half_e, zmin)),
+                Part.makeBox(half_c - half_f, e, height, Vector(c - half_f, -half_e, zmin)),
+            ]
+            if g > 0:
+                lateral_cubes.append(Part.makeBox(half_c - half_f, g, height, Vector(-half_c, -g / 2, zmin)))
 
-            document.recompute()
-            winding_window = winding_window_aux
+            return tube.fuse(lateral_cubes)
 
-            return winding_window
+        def get_negative_winding_window(self, dimensions):
+            return self.add_cached_winding_window(dimensions)
 
         def apply_machining(self, piece, machining, dimensions):
-            import FreeCAD
             document = FreeCAD.ActiveDocument
 
             original_tool = document.addObject("Part::Box", "tool")
@@ -2386,7 +2445,7 @@ class FreeCADBuilder:
                 y_coordinate = -dimensions["A"] / 2
 
             original_tool.Height = machining['length'] * 1000
-            original_tool.Placement = FreeCAD.Placement(FreeCAD.Vector(x_coordinate, y_coordinate, (machining['coordinates'][1] - machining['length'] / 2) * 1000), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
+            original_tool.Placement = FreeCAD.Placement(FreeCAD.Vector(x_coordinate, y_coordinate, (machining['coordinates'][1] - machining['length'] / 2) * 1000), _IDENTITY_ROT)
 
             if machining['coordinates'][0] == 0 and machining['coordinates'][2] == 0:
                 tool = original_tool
@@ -2395,7 +2454,7 @@ class FreeCADBuilder:
                 central_column_width = dimensions["F"] * 1.001
                 central_column_tool.Radius = central_column_width / 2
                 central_column_tool.Height = machining['length'] * 1000
-                central_column_tool.Placement = FreeCAD.Placement(FreeCAD.Vector(0, 0, (machining['coordinates'][1] - machining['length'] / 2) * 1000), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
+                central_column_tool.Placement = FreeCAD.Placement(FreeCAD.Vector(0, 0, (machining['coordinates'][1] - machining['length'] / 2) * 1000), _IDENTITY_ROT)
 
                 tool = document.addObject("Part::Cut", "machined_piece_with_central_column")
                 tool.Base = original_tool
@@ -2410,7 +2469,6 @@ class FreeCADBuilder:
             return machined_piece
 
         def get_shape_extras(self, data, piece):
-            import FreeCAD
             # movement to center column
             dimensions = data["dimensions"]
 
@@ -2423,112 +2481,52 @@ class FreeCADBuilder:
         def get_dimensions_and_subtypes(self):
             return {1: ["A", "B", "C", "D", "E", "F", "G", "K"]}
 
-        def get_negative_winding_window(self, dimensions):
-            import FreeCAD
-            document = FreeCAD.ActiveDocument
-
-            if dimensions["K"] >= dimensions["F"] / 2:
-                cylinder_left = document.addObject("Part::Cylinder", "cylinder_left")
-                cylinder_left.Height = dimensions["D"]
-                cylinder_left.Radius = dimensions["F"] / 2
-                cylinder_left.Angle = 180
-                cylinder_left.Placement = FreeCAD.Placement(FreeCAD.Vector(dimensions["C"] / 2 - dimensions["K"], 0, dimensions["B"] - dimensions["D"]), FreeCAD.Rotation(90, 0, 0))
-                document.recompute()
-
-                if dimensions["K"] != dimensions["F"] / 2:
-                    central_column_cube = document.addObject("Part::Box", "central_column_cube")
-                    central_column_cube.Length = dimensions["K"] - dimensions["F"] / 2
-                    central_column_cube.Width = dimensions["F"]
-                    central_column_cube.Height = dimensions["D"]
-                    central_column_cube.Placement = FreeCAD.Placement(FreeCAD.Vector(dimensions["C"] / 2 - dimensions["K"], -dimensions["F"] / 2, dimensions["B"] - dimensions["D"]), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
-
-                cylinder_right = document.addObject("Part::Cylinder", "cylinder_right")
-                cylinder_right.Height = dimensions["D"]
-                cylinder_right.Radius = dimensions["F"] / 2
-                cylinder_right.Angle = 180
-                cylinder_right.Placement = FreeCAD.Placement(FreeCAD.Vector(dimensions["C"] / 2 - dimensions["F"] / 2, 0, dimensions["B"] - dimensions["D"]), FreeCAD.Rotation(-90, 0, 0))
-                document.recompute()
-            else:
-                cylinder_left = document.addObject("Part::Cylinder", "cylinder_left")
-                cylinder_left.Height = dimensions["D"]
-                cylinder_left.Radius = dimensions["K"]
-                cylinder_left.Angle = 180
-                cylinder_left.Placement = FreeCAD.Placement(FreeCAD.Vector(dimensions["C"] / 2 - dimensions["K"], -(dimensions["F"] / 2 - dimensions["K"]), dimensions["B"] - dimensions["D"]), FreeCAD.Rotation(180, 0, 0))
-                document.recompute()
-
-                central_column_cube = document.addObject("Part::Box", "central_column_cube")
-                central_column_cube.Length = dimensions["K"] * 2
-                central_column_cube.Width = dimensions["F"] - dimensions["K"] * 2
-                central_column_cube.Height = dimensions["D"]
-                central_column_cube.Placement = FreeCAD.Placement(FreeCAD.Vector(dimensions["C"] / 2 - dimensions["K"] * 2, -(dimensions["F"] / 2 - dimensions["K"]), dimensions["B"] - dimensions["D"]), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
-                document.recompute()
-
-                cylinder_right = document.addObject("Part::Cylinder", "cylinder_right")
-                cylinder_right.Height = dimensions["D"]
-                cylinder_right.Radius = dimensions["K"]
-                cylinder_right.Angle = 180 
-                cylinder_right.Placement = FreeCAD.Placement(FreeCAD.Vector(dimensions["C"] / 2 - dimensions["K"], (dimensions["F"] / 2 - dimensions["K"]), dimensions["B"] - dimensions["D"]), FreeCAD.Rotation(0, 0, 0))
-                document.recompute()
-
-            central_column = document.addObject("Part::MultiFuse", "central_column")
-            if dimensions["K"] != dimensions["F"] / 2:
-                central_column.Shapes = [cylinder_left, central_column_cube, cylinder_right]
-            else:
-                central_column.Shapes = [cylinder_left, cylinder_right]
-
-            document.recompute()
+        def shape_extras_need_refine(self, data):
+            return False
 
-            winding_window_cylinder_left = document.addObject("Part::Cylinder", "winding_window_cylinder_left")
-            winding_window_cylinder_left.Height = dimensions["D"]
-            winding_window_cylinder_left.Radius = dimensions["E"] / 2
-            winding_window_cylinder_left.Angle = 180
-            winding_window_cylinder_left.Placement = FreeCAD.Placement(FreeCAD.Vector(dimensions["C"] / 2 - dimensions["K"], 0, dimensions["B"] - dimensions["D"]), FreeCAD.Rotation(90, 0, 0))
-
-            lateral_top_cube = document.addObject("Part::Box", "lateral_top_cube")
-            lateral_top_cube.Length = dimensions["C"] / 2
-            lateral_top_cube.Width = dimensions["E"] / 2 - dimensions["F"] / 2
-            lateral_top_cube.Height = dimensions["D"]
-            lateral_top_cube.Placement = FreeCAD.Placement(FreeCAD.Vector(dimensions["C"] / 2 - dimensions["K"], dimensions["F"] / 2, dimensions["B"] - dimensions["D"]), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
-
-            lateral_bottom_cube = document.addObject("Part::Box", "lateral_bottom_cube")
-            lateral_bottom_cube.Length = dimensions["C"] / 2
-            lateral_bottom_cube.Width = dimensions["E"] / 2 - dimensions["F"] / 2
-            lateral_bottom_cube.Height = dimensions["D"]
-            lateral_bottom_cube.Placement = FreeCAD.Placement(FreeCAD.Vector(dimensions["C"] / 2 - dimensions["K"], -dimensions["E"] / 2, dimensions["B"] - dimensions["D"]), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
-
-            lateral_right_cube = document.addObject("Part::Box", "lateral_right_cube")
-            if dimensions["K"] >= dimensions["F"] / 2:
-                lateral_right_cube.Length = dimensions["C"] / 2
+        @classmethod
+        def make_winding_window_shape(cls, b, c, d, e, f, g, k):
+            import Part
+            Vector = FreeCAD.Vector
+            height = d
+            zmin = b - height
+            half_c = c / 2
+            half_e = e / 2
+            half_f = f / 2
+            center_x = half_c - k
+
+            if k >= half_f:
+                central_column = [
+                    cls.make_half_cylinder(half_f, height, Vector(center_x, 0, zmin), 90),
+                    cls.make_half_cylinder(half_f, height, Vector(half_c - half_f, 0, zmin), -90),
+                ]
+                if k != half_f:
+                    central_column.append(Part.makeBox(k - half_f, f, height, Vector(center_x, -half_f, zmin)))
             else:
-                lateral_right_cube.Length = dimensions["K"]
-            lateral_right_cube.Width = dimensions["E"]
-            lateral_right_cube.Height = dimensions["D"]
-            lateral_right_cube.Placement = FreeCAD.Placement(FreeCAD.Vector(dimensions["C"] / 2 - dimensions["K"], -dimensions["E"] / 2, dimensions["B"] - dimensions["D"]), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
-
-            shapes = [winding_window_cylinder_left, lateral_top_cube, lateral_bottom_cube, lateral_right_cube]
-            if "G" in dimensions and dimensions["G"] > 0:
-                lateral_left_cube = document.addObject("Part::Box", "lateral_left_cube")
-                lateral_left_cube.Length = dimensions["C"] / 2 - dimensions["F"] / 2
-                lateral_left_cube.Width = dimensions["G"]
-                lateral_left_cube.Height = dimensions["D"]
-                lateral_left_cube.Placement = FreeCAD.Placement(FreeCAD.Vector(-dimensions["C"] / 2, -dimensions["G"] / 2, dimensions["B"] - dimensions["D"]), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
-                shapes.append(lateral_left_cube)
-
-            winding_window_aux = document.addObject("Part::MultiFuse", "Fusion")
-            winding_window_aux.Shapes = shapes
-
-            document.recompute()
-
-            winding_window = document.addObject("Part::Cut", "winding_window")
-            winding_window.Base = winding_window_aux
-            winding_window.Tool = central_column
+                central_column = [
+                    cls.make_half_cylinder(k, height, Vector(center_x, -(half_f - k), zmin), 180),
+                    cls.make_half_cylinder(k, height, Vector(center_x, (half_f - k), zmin), 0),
+                    Part.makeBox(2 * k, f - 2 * k, height, Vector(center_x - k, -(half_f - k), zmin)),
+                ]
+
+            lateral_right_length = half_c if k >= half_f else k
+            winding_window_parts = [
+                cls.make_half_cylinder(half_e, height, Vector(center_x, 0, zmin), 90),
+                Part.makeBox(half_c, half_e - half_f, height, Vector(center_x, half_f, zmin)),
+                Part.makeBox(half_c, half_e - half_f, height, Vector(center_x, -half_e, zmin)),
+                Part.makeBox(lateral_right_length, e, height, Vector(center_x, -half_e, zmin)),
+            ]
+            if g > 0:
+                winding_window_parts.append(Part.makeBox(half_c - half_f, g, height, Vector(-half_c, -g / 2, zmin)))
 
-            document.recompute()
+            winding_window_aux = winding_window_parts[0].fuse(winding_window_parts[1:])
+            central_column_shape = central_column[0].fuse(central_column[1:])
+            return winding_window_aux.cut(central_column_shape)
 
-            return winding_window
+        def get_negative_winding_window(self, dimensions):
+            return self.add_cached_winding_window(dimensions)
 
         def apply_machining(self, piece, machining, dimensions):
-            import FreeCAD
             document = FreeCAD.ActiveDocument
 
             original_tool = document.addObject("Part::Box", "tool")
@@ -2550,7 +2548,7 @@ class FreeCADBuilder:
                 y_coordinate = -dimensions["A"] / 2
 
             original_tool.Height = machining['length'] * 1000
-            original_tool.Placement = FreeCAD.Placement(FreeCAD.Vector(x_coordinate, y_coordinate, (machining['coordinates'][1] - machining['length'] / 2) * 1000), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
+            original_tool.Placement = FreeCAD.Placement(FreeCAD.Vector(x_coordinate, y_coordinate, (machining['coordinates'][1] - machining['length'] / 2) * 1000), _IDENTITY_ROT)
 
             if machining['coordinates'][0] == 0 and machining['coordinates'][2] == 0:
                 tool = original_tool
@@ -2561,7 +2559,7 @@ class FreeCADBuilder:
                 central_column_tool.Length = central_column_length
                 central_column_tool.Width = central_column_width
                 central_column_tool.Height = machining['length'] * 1000
-                central_column_tool.Placement = FreeCAD.Placement(FreeCAD.Vector((dimensions["C"] / 2 * 1.01 - central_column_length), -central_column_width / 2, (machining['coordinates'][1] - machining['length'] / 2) * 1000), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
+                central_column_tool.Placement = FreeCAD.Placement(FreeCAD.Vector((dimensions["C"] / 2 * 1.01 - central_column_length), -central_column_width / 2, (machining['coordinates'][1] - machining['length'] / 2) * 1000), _IDENTITY_ROT)
 
                 tool = document.addObject("Part::Cut", "machined_piece")
                 tool.Base = original_tool
@@ -2583,7 +2581,6 @@ class FreeCADBuilder:
             }
 
         def get_shape_base(self, data, sketch):
-            import FreeCAD
             import Part
             import Sketcher
             dimensions = data["dimensions"]
@@ -2596,124 +2593,81 @@ class FreeCADBuilder:
             k = dimensions["K"]
             q = dimensions["q"]
 
-            top_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(-c, a, 0), FreeCAD.Vector(c, a, 0)), False)
-            right_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(c, a, 0), FreeCAD.Vector(c, -a, 0)), False)
-            bottom_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(c, -a, 0), FreeCAD.Vector(-c, -a, 0)), False)
-            left_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(-c, -a, 0), FreeCAD.Vector(-c, a, 0)), False)
-            sketch.addConstraint(Sketcher.Constraint('Coincident', top_line, 2, right_line, 1))
-            sketch.addConstraint(Sketcher.Constraint('Coincident', right_line, 2, bottom_line, 1))
-            sketch.addConstraint(Sketcher.Constraint('Coincident', bottom_line, 2, left_line, 1))
-            sketch.addConstraint(Sketcher.Constraint('Coincident', left_line, 2, top_line, 1))
-            sketch.addConstraint(Sketcher.Constraint('DistanceY', bottom_line, 1, -1, 1, a))
-            sketch.addConstraint(Sketcher.Constraint('DistanceY', top_line, 1, -1, 1, -a))
-            sketch.addConstraint(Sketcher.Constraint('DistanceX', left_line, 1, -1, 1, c))
-            sketch.addConstraint(Sketcher.Constraint('DistanceX', right_line, 1, -1, 1, -c))
-            sketch.addConstraint(Sketcher.Constraint('Vertical', right_line))
-            sketch.addConstraint(Sketcher.Constraint('Vertical', left_line))
-            sketch.addConstraint(Sketcher.Constraint('Horizontal', top_line))
-            sketch.addConstraint(Sketcher.Constraint('Horizontal', bottom_line))
-            right_notch_left_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector((f2 + k) / 3, f1, 0), FreeCAD.Vector((f2 + k) / 3, -f1, 0)), False)
-            right_notch_top_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(c, f1, 0), FreeCAD.Vector((f2 + k) / 3, f1, 0)), False)
-            right_notch_bottom_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(c, -f1, 0), FreeCAD.Vector((f2 + k) / 3, -f1, 0)), False)
-            sketch.addConstraint(Sketcher.Constraint('Vertical', right_notch_left_line))
-            sketch.addConstraint(Sketcher.Constraint('PointOnObject', right_notch_top_line, 1, right_line))
-            sketch.addConstraint(Sketcher.Constraint('PointOnObject', right_notch_bottom_line, 1, right_line))
-            sketch.addConstraint(Sketcher.Constraint('Coincident', right_notch_top_line, 2, right_notch_left_line, 1))
-            sketch.addConstraint(Sketcher.Constraint('Coincident', right_notch_bottom_line, 2, right_notch_left_line, 2))
-            sketch.addConstraint(Sketcher.Constraint('DistanceY', right_notch_top_line, 1, -1, 1, -(e - f1)))
-            sketch.addConstraint(Sketcher.Constraint('DistanceY', right_notch_bottom_line, 1, -1, 1, (e - f1)))
-            sketch.addConstraint(Sketcher.Constraint('Angle', right_notch_left_line, 1, right_notch_bottom_line, 2, 75 / 180 * math.pi)) 
-            sketch.addConstraint(Sketcher.Constraint('Angle', right_notch_left_line, 2, right_notch_top_line, 2, -75 / 180 * math.pi)) 
-            sketch.addConstraint(Sketcher.Constraint('DistanceX', right_notch_left_line, 1, -1, 1, -(f2 + k) / 3))
-            sketch.addConstraint(Sketcher.Constraint('DistanceX', right_notch_bottom_line, 1, -1, 1, -c))
+            top_line, right_line, bottom_line, left_line = self.add_centered_rectangle(sketch, c, a)
+
+            # the notches are added and constrained in one call each, before the trims that need them solved
+            right_notch_x = (f2 + k) / 3
+            right_notch_left_line, right_notch_top_line, right_notch_bottom_line = sketch.addGeometry([
+                Part.LineSegment(FreeCAD.Vector(right_notch_x, f1, 0), FreeCAD.Vector(right_notch_x, -f1, 0)),
+                Part.LineSegment(FreeCAD.Vector(c, f1, 0), FreeCAD.Vector(right_notch_x, f1, 0)),
+                Part.LineSegment(FreeCAD.Vector(c, -f1, 0), FreeCAD.Vector(right_notch_x, -f1, 0)),
+            ], False)
+            sketch.addConstraint([
+                Sketcher.Constraint('Vertical', right_notch_left_line),
+                Sketcher.Constraint('PointOnObject', right_notch_top_line, 1, right_line),
+                Sketcher.Constraint('PointOnObject', right_notch_bottom_line, 1, right_line),
+                Sketcher.Constraint('Coincident', right_notch_top_line, 2, right_notch_left_line, 1),
+                Sketcher.Constraint('Coincident', right_notch_bottom_line, 2, right_notch_left_line, 2),
+                Sketcher.Constraint('DistanceY', right_notch_top_line, 1, -1, 1, -(e - f1)),
+                Sketcher.Constraint('DistanceY', right_notch_bottom_line, 1, -1, 1, (e - f1)),
+                Sketcher.Constraint('Angle', right_notch_left_line, 1, right_notch_bottom_line, 2, 75 / 180 * math.pi),
+                Sketcher.Constraint('Angle', right_notch_left_line, 2, right_notch_top_line, 2, -75 / 180 * math.pi),
+                Sketcher.Constraint('DistanceX', right_notch_left_line, 1, -1, 1, -right_notch_x),
+                Sketcher.Constraint('DistanceX', right_notch_bottom_line, 1, -1, 1, -c),
+            ])
             sketch.trim(right_line, FreeCAD.Vector(c, 0, 0))
             sketch.addConstraint(Sketcher.Constraint('DistanceX', bottom_line, 1, -1, 1, -c))
 
             if dimensions["K"] > 0:
-                left_notch_right_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector((-c + k), (f1 - q), 0), FreeCAD.Vector((-c + k), -(f1 - q), 0)), False)
-                left_notch_top_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(c, (f1 - q), 0), FreeCAD.Vector((-c + k), (f1 - q), 0)), False)
-                left_notch_bottom_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(c, -(f1 - q), 0), FreeCAD.Vector((-c + k), -(f1 - q), 0)), False)
-                sketch.addConstraint(Sketcher.Constraint('Vertical', left_notch_right_line))
-                sketch.addConstraint(Sketcher.Constraint('PointOnObject', left_notch_top_line, 1, left_line))
-                sketch.addConstraint(Sketcher.Constraint('PointOnObject', left_notch_bottom_line, 1, left_line))
-                sketch.addConstraint(Sketcher.Constraint('Coincident', left_notch_top_line, 2, left_notch_right_line, 1))
-                sketch.addConstraint(Sketcher.Constraint('Coincident', left_notch_bottom_line, 2, left_notch_right_line, 2))
-                sketch.addConstraint(Sketcher.Constraint('DistanceY', left_notch_top_line, 1, -1, 1, -(e - (f1 - q))))
-                sketch.addConstraint(Sketcher.Constraint('DistanceY', left_notch_bottom_line, 1, -1, 1, (e - (f1 - q))))
-                sketch.addConstraint(Sketcher.Constraint('Angle', left_notch_right_line, 1, left_notch_bottom_line, 2, -75 / 180 * math.pi)) 
-                sketch.addConstraint(Sketcher.Constraint('Angle', left_notch_right_line, 2, left_notch_top_line, 2, 75 / 180 * math.pi)) 
-                sketch.addConstraint(Sketcher.Constraint('DistanceX', left_notch_right_line, 1, -1, 1, -(-c + k)))
-                sketch.addConstraint(Sketcher.Constraint('DistanceX', left_notch_top_line, 1, -1, 1, c))
+                left_notch_x = -c + k
+                left_notch_y = f1 - q
+                left_notch_right_line, left_notch_top_line, left_notch_bottom_line = sketch.addGeometry([
+                    Part.LineSegment(FreeCAD.Vector(left_notch_x, left_notch_y, 0), FreeCAD.Vector(left_notch_x, -left_notch_y, 0)),
+                    Part.LineSegment(FreeCAD.Vector(c, left_notch_y, 0), FreeCAD.Vector(left_notch_x, left_notch_y, 0)),
+                    Part.LineSegment(FreeCAD.Vector(c, -left_notch_y, 0), FreeCAD.Vector(left_notch_x, -left_notch_y, 0)),
+                ], False)
+                sketch.addConstraint([
+                    Sketcher.Constraint('Vertical', left_notch_right_line),
+                    Sketcher.Constraint('PointOnObject', left_notch_top_line, 1, left_line),
+                    Sketcher.Constraint('PointOnObject', left_notch_bottom_line, 1, left_line),
+                    Sketcher.Constraint('Coincident', left_notch_top_line, 2, left_notch_right_line, 1),
+                    Sketcher.Constraint('Coincident', left_notch_bottom_line, 2, left_notch_right_line, 2),
+                    Sketcher.Constraint('DistanceY', left_notch_top_line, 1, -1, 1, -(e - left_notch_y)),
+                    Sketcher.Constraint('DistanceY', left_notch_bottom_line, 1, -1, 1, (e - left_notch_y)),
+                    Sketcher.Constraint('Angle', left_notch_right_line, 1, left_notch_bottom_line, 2, -75 / 180 * math.pi),
+                    Sketcher.Constraint('Angle', left_notch_right_line, 2, left_notch_top_line, 2, 75 / 180 * math.pi),
+                    Sketcher.Constraint('DistanceX', left_notch_right_line, 1, -1, 1, -left_notch_x),
+                    Sketcher.Constraint('DistanceX', left_notch_top_line, 1, -1, 1, c),
+                ])
                 sketch.trim(left_line, FreeCAD.Vector(c, 0, 0))
                 sketch.addConstraint(Sketcher.Constraint('DistanceX', top_line, 1, -1, 1, c))
 
         def get_negative_winding_window(self, dimensions):
-            import FreeCAD
+            import Part
             document = FreeCAD.ActiveDocument
             if dimensions["K"] < 0:
                 k = dimensions["K"]
             else:
                 k = 0
 
-            winding_window_cube = document.addObject("Part::Box", "winding_window_cube")
-            winding_window_cube.Width = dimensions["E"]
-            winding_window_cube.Height = dimensions["D"]
-            winding_window_cube.Length = dimensions["C"] - k
-            winding_window_cube.Placement = FreeCAD.Placement(FreeCAD.Vector(-dimensions["C"] / 2 + k, -dimensions["E"] / 2, dimensions["B"] - dimensions["D"]), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
-
-            document.recompute()
+            winding_window_cube = document.addObject("Part::Feature", "winding_window_cube")
+            winding_window_cube.Shape = Part.makeBox(dimensions["C"] - k, dimensions["E"], dimensions["D"], FreeCAD.Vector(-dimensions["C"] / 2 + k, -dimensions["E"] / 2, dimensions["B"] - dimensions["D"]))
 
             return winding_window_cube
 
         def get_shape_extras(self, data, piece):
-            import FreeCAD
+            import Part
             dimensions = data["dimensions"]
             document = FreeCAD.ActiveDocument
-            central_column_cube = document.addObject("Part::Box", "central_column_cube")
-            central_column_cube.Length = dimensions["F2"]
-            central_column_cube.Width = dimensions["F"]
-            central_column_cube.Height = dimensions["B"]
-            central_column_cube.Placement = FreeCAD.Placement(FreeCAD.Vector(-dimensions["F2"] / 2, -dimensions["F"] / 2, 0), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
-            top_right_vertex = self.edges_in_boundbox(part=central_column_cube,
-                                                      xmin=0,
-                                                      xmax=dimensions["F2"] / 2,
-                                                      ymin=0,
-                                                      ymax=dimensions["F"] / 2,
-                                                      zmin=0,
-                                                      zmax=dimensions["B"])[0]
-            top_left_vertex = self.edges_in_boundbox(part=central_column_cube,
-                                                     xmin=-dimensions["F2"] / 2,
-                                                     xmax=0,
-                                                     ymin=0,
-                                                     ymax=dimensions["F"] / 2,
-                                                     zmin=0,
-                                                     zmax=dimensions["B"])[0]
-            bottom_right_vertex = self.edges_in_boundbox(part=central_column_cube,
-                                                         xmin=0,
-                                                         xmax=dimensions["F2"] / 2,
-                                                         ymin=-dimensions["F"] / 2,
-                                                         ymax=0,
-                                                         zmin=0,
-                                                         zmax=dimensions["B"])[0]
-            bottom_left_vertex = self.edges_in_boundbox(part=central_column_cube,
-                                                        xmin=-dimensions["F2"] / 2,
-                                                        xmax=0,
-                                                        ymin=-dimensions["F"] / 2,
-                                                        ymax=0,
-                                                        zmin=0,
-                                                        zmax=dimensions["B"])[0]
-            vertexes = [top_right_vertex, top_left_vertex, bottom_right_vertex, bottom_left_vertex]
-            chamfer = document.addObject("Part::Chamfer", "Chamfer")
-            chamfer.Base = central_column_cube
-            __chamfers__ = []
-            for i in vertexes:  
-                __chamfers__.append((i + 1, dimensions["q"], dimensions["q"]))
-            chamfer.Edges = __chamfers__
-            central_column_cube.Placement = FreeCAD.Placement(FreeCAD.Vector(-dimensions["C"] / 2 + dimensions["K"], -dimensions["F"] / 2, 0), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
-            document.recompute()
+            half_f = dimensions["F"] / 2
+            central_column_cube = Part.makeBox(dimensions["F2"], dimensions["F"], dimensions["B"], FreeCAD.Vector(-dimensions["C"] / 2 + dimensions["K"], -half_f, 0))
+            vertical_edges = [central_column_cube.Edges[i] for i in _BOX_VERTICAL_EDGES]
+
+            central_column = document.addObject("Part::Feature", "central_column")
+            central_column.Shape = central_column_cube.makeChamfer(dimensions["q"], vertical_edges)
 
             piece_with_column = document.addObject("Part::MultiFuse", "Fusion")
-            piece_with_column.Shapes = [piece, chamfer]
+            piece_with_column.Shapes = [piece, central_column]
             document.recompute()
             return piece_with_column
 
@@ -2722,17 +2676,13 @@ class FreeCADBuilder:
             return {1: ["A", "B", "C", "D", "E"]}
 
         def get_negative_winding_window(self, dimensions):
-            import FreeCAD
+            import Part
             document = FreeCAD.ActiveDocument
-            central_hole = document.addObject("Part::Box", "central_hole")
-            central_hole.Length = dimensions["C"]
-            central_hole.Width = dimensions["E"]
-            central_hole.Height = dimensions["D"]
-            central_hole.Placement = FreeCAD.Placement(FreeCAD.Vector(-dimensions["C"] / 2, -dimensions["E"] / 2, dimensions["B"] - dimensions["D"]), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
+            central_hole = document.addObject("Part::Feature", "central_hole")
+            central_hole.Shape = Part.makeBox(dimensions["C"], dimensions["E"], dimensions["D"], FreeCAD.Vector(-dimensions["C"] / 2, -dimensions["E"] / 2, dimensions["B"] - dimensions["D"]))
             return central_hole
 
         def apply_machining(self, piece, machining, dimensions):
-            import FreeCAD
             document = FreeCAD.ActiveDocument
 
             tool = document.addObject("Part::Box", "tool")
@@ -2746,7 +2696,7 @@ class FreeCADBuilder:
                 y_coordinate = winding_column_width / 2 + dimensions["E"]
 
             tool.Height = machining['length'] * 1000
-            tool.Placement = FreeCAD.Placement(FreeCAD.Vector(x_coordinate, y_coordinate, (machining['coordinates'][1] - machining['length'] / 2) * 1000), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
+            tool.Placement = FreeCAD.Placement(FreeCAD.Vector(x_coordinate, y_coordinate, (machining['coordinates'][1] - machining['length'] / 2) * 1000), _IDENTITY_ROT)
 
             machined_piece = document.addObject("Part::Cut", "machined_piece")
             machined_piece.Base = piece
@@ -2756,7 +2706,6 @@ class FreeCADBuilder:
             return machined_piece
 
         def get_shape_extras(self, data, piece):
-            import FreeCAD
             dimensions = data["dimensions"]
             piece.Placement.move(FreeCAD.Vector(0,
                                                 -(dimensions['E'] / 2 + (dimensions['A'] - dimensions['E']) / 4),
@@ -2772,155 +2721,181 @@ class FreeCADBuilder:
                 4: ["A", "B", "C", "D", "F", "G", "H"]
             }
 
+        _top_diameter_per_subtype = {'1': "C", '2': "C", '3': "F", '4': "F"}
+        _bottom_diameter_per_subtype = {'1': "C", '2': "C", '3': "C", '4': "F"}
+        _box_bottom_subtypes = {'1', '3'}
+
+        @staticmethod
+        def make_column(height, diameter, y, z):
+            import Part
+            return Part.makeCylinder(diameter / 2, height, FreeCAD.Vector(0, y, z))
+
         def get_shape_extras(self, data, piece):
-            import FreeCAD
+            import Part
             dimensions = data["dimensions"]
             document = FreeCAD.ActiveDocument
             familySubtype = data["familySubtype"]
 
-            if familySubtype == '1' or familySubtype == '2':
-                top_diameter = dimensions["C"]
-                bottom_diameter = dimensions["C"]
-            elif familySubtype == '3':
-                top_diameter = dimensions["F"]
-                bottom_diameter = dimensions["C"]
-            elif familySubtype == '4':
-                top_diameter = dimensions["F"]
-                bottom_diameter = dimensions["F"]
-
-            top_column = document.addObject("Part::Cylinder", "top_column")
-            top_column.Height = dimensions["D"]
-            top_column.Radius = top_diameter / 2
-            top_column.Placement = FreeCAD.Placement(FreeCAD.Vector(0, (dimensions["A"] - top_diameter) / 2, dimensions["B"] - dimensions["D"]), FreeCAD.Rotation(90, 0, 0))
-
-            if familySubtype == '1' or familySubtype == '3':
-                bottom_column = document.addObject("Part::Box", "bottom_column")
-                bottom_column.Length = bottom_diameter
-                bottom_column.Width = dimensions["H"]
-                bottom_column.Height = dimensions["D"]
-                bottom_column.Placement = FreeCAD.Placement(FreeCAD.Vector(-bottom_diameter / 2, -dimensions["A"] / 2, dimensions["B"] - dimensions["D"]), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
-            elif familySubtype == '2' or familySubtype == '4':
-                bottom_column = document.addObject("Part::Cylinder", "bottom_column")
-                bottom_column.Height = dimensions["D"]
-                bottom_column.Radius = bottom_diameter / 2
-                bottom_column.Placement = FreeCAD.Placement(FreeCAD.Vector(0, -(dimensions["A"] - bottom_diameter) / 2, dimensions["B"] - dimensions["D"]), FreeCAD.Rotation(90, 0, 0))
+            top_diameter = dimensions[self._top_diameter_per_subtype[familySubtype]]
+            bottom_diameter = dimensions[self._bottom_diameter_per_subtype[familySubtype]]
+            half_a = dimensions["A"] / 2
+            zmin = dimensions["B"] - dimensions["D"]
+            top_y = half_a - top_diameter / 2
+            bottom_y = -(half_a - bottom_diameter / 2)
 
-            if familySubtype == '4':
-                top_column_hole = document.addObject("Part::Cylinder", "top_column_hole")
-                top_column_hole.Height = dimensions["B"]
-                top_column_hole.Radius = dimensions["G"] / 2
-                top_column_hole.Placement = FreeCAD.Placement(FreeCAD.Vector(0, (dimensions["A"] - top_diameter) / 2, 0), FreeCAD.Rotation(90, 0, 0))
+            top_column = self.make_column(dimensions["D"], top_diameter, top_y, zmin)
+            if familySubtype in self._box_bottom_subtypes:
+                bottom_column = Part.makeBox(bottom_diameter, dimensions["H"], dimensions["D"], FreeCAD.Vector(-bottom_diameter / 2, -half_a, zmin))
+            else:
+                bottom_column = self.make_column(dimensions["D"], bottom_diameter, bottom_y, zmin)
 
-                bottom_column_hole = document.addObject("Part::Cylinder", "bottom_column_hole")
-                bottom_column_hole.Height = dimensions["B"]
-                bottom_column_hole.Radius = dimensions["G"] / 2
-                bottom_column_hole.Placement = FreeCAD.Placement(FreeCAD.Vector(0, -(dimensions["A"] - bottom_diameter) / 2, 0), FreeCAD.Rotation(90, 0, 0))
+            lateral_columns = document.addObject("Part::Feature", "lateral_columns")
+            lateral_columns.Shape = top_column.fuse(bottom_column)
 
             columns = document.addObject("Part::MultiFuse", "columns")
-            columns.Shapes = [piece, bottom_column, top_column]
+            columns.Shapes = [piece, lateral_columns]
             document.recompute()
 
             if familySubtype == '4':
-                top_cut = document.addObject("Part::Cut", "top_cut")
-                top_cut.Base = columns
-                top_cut.Tool = top_column_hole
-                document.recompute()
-                columns = top_cut
+                column_holes = document.addObject("Part::Feature", "column_holes")
+                column_holes.Shape = self.make_column(dimensions["B"], dimensions["G"], top_y, 0).fuse(self.make_column(dimensions["B"], dimensions["G"], bottom_y, 0))
 
-                bottom_cut = document.addObject("Part::Cut", "bottom_cut")
-                bottom_cut.Base = columns
-                bottom_cut.Tool = bottom_column_hole
+                columns_cut = document.addObject("Part::Cut", "columns_cut")
+                columns_cut.Base = columns
+                columns_cut.Tool = column_holes
                 document.recompute()
-                columns = bottom_cut
+                columns = columns_cut
 
             columns.Placement.move(FreeCAD.Vector(0,
                                    -dimensions['A'] / 2 + top_diameter / 2,
                                    0))
             return columns
 
-        def get_shape_base(self, data, sketch):
-            import FreeCAD
+        @staticmethod
+        def get_round_end(y, f, first_angle, last_angle):
             import Part
+            return Part.ArcOfCircle(Part.Circle(FreeCAD.Vector(0, y, 0), _Z_AXIS, f), first_angle, last_angle)
+
+        @staticmethod
+        def get_round_end_constraints(arc, y, f):
             import Sketcher
-            dimensions = data["dimensions"]
-            familySubtype = data["familySubtype"]
+            Constraint = Sketcher.Constraint
+            return [
+                Constraint('Diameter', arc, 2 * f),
+                Constraint('DistanceY', arc, 3, -1, 1, -y),
+                Constraint('DistanceY', arc, 2, -1, 1, -y),
+                Constraint('Horizontal', arc, 1, arc, 2),
+            ]
 
-            c = dimensions["C"] / 2
+        def add_outline(self, sketch, c, f, arc_y, side_bottom_y, bottom_geometries):
+            # the sides and top round end shared by every subtype go in with the subtype bottom in a single addGeometry,
+            # so the solver runs once for the geometry and once for the constraints
+            import Part
+            import Sketcher
+            Vector = FreeCAD.Vector
+            right_line, left_line, top_arc, *bottom_edges = sketch.addGeometry([
+                Part.LineSegment(Vector(c, arc_y, 0), Vector(c, side_bottom_y, 0)),
+                Part.LineSegment(Vector(-c, side_bottom_y, 0), Vector(-c, arc_y, 0)),
+                self.get_round_end(arc_y, f, 0, -math.pi),
+            ] + bottom_geometries, False)
+            constraints = [
+                Sketcher.Constraint('DistanceX', left_line, 1, -1, 1, c),
+                Sketcher.Constraint('Vertical', right_line),
+            ] + self.get_round_end_constraints(top_arc, arc_y, f)
+            return right_line, left_line, top_arc, bottom_edges, constraints
+
+        def _outline_flat_bottom(self, sketch, dimensions):
+            import Part
+            import Sketcher
+            Constraint = Sketcher.Constraint
             a = dimensions["A"] / 2
-            if familySubtype == '1' or familySubtype == '2' or familySubtype == '3':
-                f = dimensions["C"] / 2
-            else:
-                f = dimensions["F"] / 2
-
-            if familySubtype == '1' or familySubtype == '3':
-                right_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(c, a - f, 0), FreeCAD.Vector(c, -a, 0)), False)
-                left_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(-c, -a, 0), FreeCAD.Vector(-c, a - f, 0)), False)
-            elif familySubtype == '2' or familySubtype == '4':
-                right_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(c, a - f, 0), FreeCAD.Vector(c, -a + f, 0)), False)
-                left_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(-c, -a + f, 0), FreeCAD.Vector(-c, a - f, 0)), False)
-
-            sketch.addConstraint(Sketcher.Constraint('DistanceX', left_line, 1, -1, 1, c))
-            # sketch.addConstraint(Sketcher.Constraint('DistanceX', right_line, 1, -1, 1, -c))
-            sketch.addConstraint(Sketcher.Constraint('Vertical', right_line))
-
-            if familySubtype == '1' or familySubtype == '3':
-                bottom_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(c, -a, 0), FreeCAD.Vector(-c, -a, 0)), False)
-                sketch.addConstraint(Sketcher.Constraint('Coincident', right_line, 2, bottom_line, 1))
-                sketch.addConstraint(Sketcher.Constraint('Coincident', bottom_line, 2, left_line, 1))
-                sketch.addConstraint(Sketcher.Constraint('DistanceY', bottom_line, 1, -1, 1, a))
-                sketch.addConstraint(Sketcher.Constraint('Horizontal', bottom_line))
-            elif familySubtype == '2' or familySubtype == '4':
-                bottom_arc = sketch.addGeometry(Part.ArcOfCircle(Part.Circle(FreeCAD.Vector(0, -(a - f), 0), FreeCAD.Vector(0, 0, 1), f), -math.pi, 0))
-                sketch.addConstraint(Sketcher.Constraint('Diameter', bottom_arc, 2 * f))
-                sketch.addConstraint(Sketcher.Constraint('DistanceY', bottom_arc, 3, -1, 1, a - f))
-                sketch.addConstraint(Sketcher.Constraint('DistanceY', bottom_arc, 2, -1, 1, a - f))
-                if familySubtype != '4':
-                    sketch.addConstraint(Sketcher.Constraint('Coincident', bottom_arc, 2, right_line, 2))
-                    sketch.addConstraint(Sketcher.Constraint('Coincident', bottom_arc, 1, left_line, 1))
-                sketch.addConstraint(Sketcher.Constraint('Horizontal', bottom_arc, 1, bottom_arc, 2))
-
-            top_arc = sketch.addGeometry(Part.ArcOfCircle(Part.Circle(FreeCAD.Vector(0, a - f, 0), FreeCAD.Vector(0, 0, 1), f), 0, -math.pi))
-            sketch.addConstraint(Sketcher.Constraint('Diameter', top_arc, 2 * f))
-            if familySubtype == '1':
-                sketch.addConstraint(Sketcher.Constraint('Vertical', top_arc, 3, -1, 1))
-            sketch.addConstraint(Sketcher.Constraint('DistanceY', top_arc, 3, -1, 1, -(a - f)))
-            sketch.addConstraint(Sketcher.Constraint('DistanceY', top_arc, 2, -1, 1, -(a - f)))
-            if familySubtype != '4':
-                sketch.addConstraint(Sketcher.Constraint('Coincident', top_arc, 1, right_line, 1))
-                sketch.addConstraint(Sketcher.Constraint('Coincident', top_arc, 2, left_line, 2))
-            sketch.addConstraint(Sketcher.Constraint('Horizontal', top_arc, 1, top_arc, 2))
-            if familySubtype == '4':
-                bottom_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(c, -(a - f), 0), FreeCAD.Vector(-c, -(a - f), 0)), False)
-                sketch.addConstraint(Sketcher.Constraint('Coincident', right_line, 2, bottom_line, 1))
-                sketch.addConstraint(Sketcher.Constraint('Coincident', bottom_line, 2, left_line, 1))
-                sketch.addConstraint(Sketcher.Constraint('DistanceY', bottom_line, 1, -1, 1, (a - f)))
-                sketch.addConstraint(Sketcher.Constraint('Horizontal', bottom_line))
-                top_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(c, a - f, 0), FreeCAD.Vector(-c, a - f, 0)), False)
-                sketch.addConstraint(Sketcher.Constraint('Coincident', right_line, 1, top_line, 1))
-                sketch.addConstraint(Sketcher.Constraint('Coincident', top_line, 2, left_line, 2))
-                sketch.addConstraint(Sketcher.Constraint('DistanceY', top_line, 1, -1, 1, -(a - f)))
-                sketch.addConstraint(Sketcher.Constraint('Horizontal', top_line))
-                sketch.addConstraint(Sketcher.Constraint('Vertical', left_line))
-                sketch.addConstraint(Sketcher.Constraint('DistanceX', right_line, 1, -1, 1, -c))
-                sketch.addConstraint(Sketcher.Constraint('Vertical', top_arc, 3, -1, 1))
-                sketch.addConstraint(Sketcher.Constraint('Vertical', bottom_arc, 3, -1, 1))
-                sketch.trim(bottom_line, FreeCAD.Vector(0, -(a - f), 0))
-                sketch.trim(top_line, FreeCAD.Vector(0, a - f, 0))
+            c = dimensions["C"] / 2
+            right_line, left_line, top_arc, (bottom_line, ), constraints = self.add_outline(sketch, c, c, a - c, -a, [
+                Part.LineSegment(FreeCAD.Vector(c, -a, 0), FreeCAD.Vector(-c, -a, 0)),
+            ])
+            return top_arc, constraints + [
+                Constraint('Coincident', right_line, 2, bottom_line, 1),
+                Constraint('Coincident', bottom_line, 2, left_line, 1),
+                Constraint('DistanceY', bottom_line, 1, -1, 1, a),
+                Constraint('Horizontal', bottom_line),
+                Constraint('Coincident', top_arc, 1, right_line, 1),
+                Constraint('Coincident', top_arc, 2, left_line, 2),
+            ]
+
+        def _outline_subtype_1(self, sketch, dimensions):
+            import Sketcher
+            top_arc, constraints = self._outline_flat_bottom(sketch, dimensions)
+            return constraints + [Sketcher.Constraint('Vertical', top_arc, 3, -1, 1)]
+
+        def _outline_subtype_2(self, sketch, dimensions):
+            import Sketcher
+            Constraint = Sketcher.Constraint
+            c = dimensions["C"] / 2
+            arc_y = dimensions["A"] / 2 - c
+            right_line, left_line, top_arc, (bottom_arc, ), constraints = self.add_outline(sketch, c, c, arc_y, -arc_y, [
+                self.get_round_end(-arc_y, c, -math.pi, 0),
+            ])
+            return constraints + self.get_round_end_constraints(bottom_arc, -arc_y, c) + [
+                Constraint('Coincident', bottom_arc, 2, right_line, 2),
+                Constraint('Coincident', bottom_arc, 1, left_line, 1),
+                Constraint('Coincident', top_arc, 1, right_line, 1),
+                Constraint('Coincident', top_arc, 2, left_line, 2),
+            ]
+
+        def _outline_subtype_3(self, sketch, dimensions):
+            return self._outline_flat_bottom(sketch, dimensions)[1]
+
+        def _outline_subtype_4(self, sketch, dimensions):
+            import Part
+            import Sketcher
+            Vector = FreeCAD.Vector
+            LineSegment = Part.LineSegment
+            Constraint = Sketcher.Constraint
+            c = dimensions["C"] / 2
+            f = dimensions["F"] / 2
+            arc_y = dimensions["A"] / 2 - f
+            # the flat sides are wider than the round ends, so they are joined to the arc ends by short horizontal lines
+            right_line, left_line, top_arc, bottom_edges, constraints = self.add_outline(sketch, c, f, arc_y, -arc_y, [
+                self.get_round_end(-arc_y, f, -math.pi, 0),
+                LineSegment(Vector(c, -arc_y, 0), Vector(f, -arc_y, 0)),
+                LineSegment(Vector(-f, -arc_y, 0), Vector(-c, -arc_y, 0)),
+                LineSegment(Vector(c, arc_y, 0), Vector(f, arc_y, 0)),
+                LineSegment(Vector(-f, arc_y, 0), Vector(-c, arc_y, 0)),
+            ])
+            bottom_arc, bottom_right_line, bottom_left_line, top_right_line, top_left_line = bottom_edges
+            # the joints are built at their final coordinates and only need to stay attached to their neighbours
+            return constraints + self.get_round_end_constraints(bottom_arc, -arc_y, f) + [
+                Constraint('Coincident', right_line, 2, bottom_right_line, 1),
+                Constraint('Coincident', bottom_right_line, 2, bottom_arc, 2),
+                Constraint('Coincident', bottom_arc, 1, bottom_left_line, 1),
+                Constraint('Coincident', bottom_left_line, 2, left_line, 1),
+                Constraint('Coincident', right_line, 1, top_right_line, 1),
+                Constraint('Coincident', top_right_line, 2, top_arc, 1),
+                Constraint('Coincident', top_arc, 2, top_left_line, 1),
+                Constraint('Coincident', top_left_line, 2, left_line, 2),
+                Constraint('Vertical', top_arc, 3, -1, 1),
+                Constraint('Vertical', bottom_arc, 3, -1, 1),
+            ]
+
+        _outline_per_subtype = {
+            '1': _outline_subtype_1,
+            '2': _outline_subtype_2,
+            '3': _outline_subtype_3,
+            '4': _outline_subtype_4,
+        }
+
+        def get_shape_base(self, data, sketch):
+            constraints = self._outline_per_subtype[data["familySubtype"]](self, sketch, data["dimensions"])
+            sketch.addConstraint(constraints)
 
         def get_negative_winding_window(self, dimensions):
-            import FreeCAD
+            import Part
             document = FreeCAD.ActiveDocument
-            central_hole = document.addObject("Part::Box", "central_hole")
-            central_hole.Length = dimensions["C"]
-            central_hole.Width = dimensions["A"]
-            central_hole.Height = dimensions["D"]
-            central_hole.Placement = FreeCAD.Placement(FreeCAD.Vector(-dimensions["C"] / 2, -dimensions["A"] / 2, dimensions["B"] - dimensions["D"]), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
+            central_hole = document.addObject("Part::Feature", "central_hole")
+            central_hole.Shape = Part.makeBox(dimensions["C"], dimensions["A"], dimensions["D"], FreeCAD.Vector(-dimensions["C"] / 2, -dimensions["A"] / 2, dimensions["B"] - dimensions["D"]))
             return central_hole
 
         def add_dimensions_and_export_view(self, data, original_dimensions, view, project_name, margin, colors, save_files, piece):
-            import FreeCAD
-            import TechDraw
-
             def calculate_total_dimensions():
                 if view.Name == "TopView":
                     base_width = data['dimensions']['A'] + margin
@@ -2955,53 +2930,52 @@ class FreeCADBuilder:
                 return base_width, base_height
 
             def create_dimension(starting_coordinates, ending_coordinates, dimension_type, dimension_label, label_offset=0, label_alignment=0):
-                dimension_svg = ""
+                dimension_svg = []
+                starting_x, starting_y = starting_coordinates
+                ending_x, ending_y = ending_coordinates
+                fields = {
+                    'color': colors['dimension_color'],
+                    'font_size': dimension_font_size,
+                    'line_thickness': dimension_line_thickness,
+                    'view_x': view.X.Value,
+                    'view_y': 1000 - view.Y.Value,
+                    'label': dimension_label,
+                }
 
                 if dimension_type == "DistanceY":
-                    main_line_start = [starting_coordinates[0] + label_offset, starting_coordinates[1]]
-                    main_line_end = [ending_coordinates[0] + label_offset, ending_coordinates[1]]
-                    left_aux_line_start = [starting_coordinates[0], starting_coordinates[1]]
-                    left_aux_line_end = [starting_coordinates[0] + label_offset, starting_coordinates[1]]
-                    right_aux_line_start = [ending_coordinates[0], ending_coordinates[1]]
-                    right_aux_line_end = [ending_coordinates[0] + label_offset, ending_coordinates[1]]
-
-                    dimension_svg += f"""   <g font-size="29.1042" font-style="normal" stroke-opacity="1" fill="none" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="1" font-weight="400" transform="matrix(1,0,0,1,{view.X.Value + ending_coordinates[0] + label_offset - dimension_font_size / 4},{1000 - view.Y.Value + label_alignment})" stroke-linecap="square" stroke-linejoin="bevel">
-                                             <text x="0" y="0" text-anchor="middle" fill-opacity="1" font-size="{dimension_font_size}" font-style="normal" fill="{colors['dimension_color']}" font-family="osifont" stroke="none" xml:space="preserve" font-weight="400" transform="rotate(-90)">{dimension_label}</text>
-                                            </g>\n""".replace("                                    ", "")
-                    dimension_svg += f"""   <g font-size="29.1042" font-style="normal" stroke-opacity="1" fill="none" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="{dimension_line_thickness}" font-weight="400" transform="matrix(1,0,0,1,{view.X.Value},{1000 - view.Y.Value})" stroke-linecap="round" stroke-linejoin="bevel">
-                                              <path fill-rule="evenodd" vector-effect="none" d="M{main_line_start[0]},{main_line_start[1]} L{main_line_end[0]},{main_line_end[1]} M{left_aux_line_start[0]},{left_aux_line_start[1]} L{left_aux_line_end[0]},{left_aux_line_end[1]} M{right_aux_line_start[0]},{right_aux_line_start[1]} L{right_aux_line_end[0]},{right_aux_line_end[1]}"/>
-                                            </g>\n""".replace("                                     ", "")
-                    dimension_svg += f"""   <g font-size="29.1042" font-style="normal" stroke-opacity="1" fill="none" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="{dimension_line_thickness}" font-weight="400" transform="matrix(1,0,0,1,{view.X.Value},{1000 - view.Y.Value})" stroke-linecap="round" stroke-linejoin="bevel">
-                                             <g fill-opacity="1" font-size="29.1042" font-style="normal" stroke-opacity="1" fill="{colors['dimension_color']}" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="1" font-weight="400" transform="matrix(1,0,0,1,{ending_coordinates[0] + label_offset},{ending_coordinates[1]})" stroke-linecap="round" stroke-linejoin="bevel">
-                                              <path fill-rule="evenodd" vector-effect="none" d="M0,0 L6,-15 L-6,-15 L0,0"/>
-                                             </g>
-                                             <g fill-opacity="1" font-size="29.1042" font-style="normal" stroke-opacity="1" fill="{colors['dimension_color']}" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="1" font-weight="400" transform="matrix(1,0,0,1,{starting_coordinates[0] + label_offset},{starting_coordinates[1]})" stroke-linecap="round" stroke-linejoin="bevel">
-                                              <path fill-rule="evenodd" vector-effect="none" d="M0,0 L-6,15 L6,15 L0,0"/>
-                                             </g>
-                                            </g>\n""".replace("                                     ", "")
+                    offset_starting_x = starting_x + label_offset
+                    offset_ending_x = ending_x + label_offset
+                    fields['label_x'] = view.X.Value + offset_ending_x - dimension_font_size / 4
+                    fields['label_y'] = 1000 - view.Y.Value + label_alignment
+                    fields['path'] = _DIMENSION_PATH % (offset_starting_x, starting_y, offset_ending_x, ending_y, starting_x, starting_y, offset_starting_x, starting_y, ending_x, ending_y, offset_ending_x, ending_y)
+                    fields['ending_arrow_x'] = offset_ending_x
+                    fields['ending_arrow_y'] = ending_y
+                    fields['ending_arrow'] = _DIMENSION_ARROW_PATH % (6, -15, -6, -15)
+                    fields['starting_arrow_x'] = offset_starting_x
+                    fields['starting_arrow_y'] = starting_y
+                    fields['starting_arrow'] = _DIMENSION_ARROW_PATH % (-6, 15, 6, 15)
+
+                    dimension_svg.append(_DIMENSION_LABEL_Y_SVG % fields)
+                    dimension_svg.append(_DIMENSION_LINES_SVG % fields)
+                    dimension_svg.append(_DIMENSION_ARROWS_SVG % fields)
                 elif dimension_type == "DistanceX":
-                    main_line_start = [starting_coordinates[0], starting_coordinates[1] + label_offset]
-                    main_line_end = [ending_coordinates[0], ending_coordinates[1] + label_offset]
-                    left_aux_line_start = [starting_coordinates[0], starting_coordinates[1]]
-                    left_aux_line_end = [starting_coordinates[0], starting_coordinates[1] + label_offset]
-                    right_aux_line_start = [ending_coordinates[0], ending_coordinates[1]]
-                    right_aux_line_end = [ending_coordinates[0], ending_coordinates[1] + label_offset]
-
-                    dimension_svg += f"""   <g font-size="29.1042" font-style="normal" stroke-opacity="1" fill="none" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="1" font-weight="400" transform="matrix(1,0,0,1,{view.X.Value + label_alignment},{1000 - view.Y.Value})" stroke-linecap="square" stroke-linejoin="bevel">
-                                             <text x="0" y="{ending_coordinates[1] + label_offset - dimension_font_size / 4}" text-anchor="middle" fill-opacity="1" font-size="{dimension_font_size}" font-style="normal" fill="{colors['dimension_color']}" font-family="osifont" stroke="none" xml:space="preserve" font-weight="400">{dimension_label}</text>
-                                            </g>\n""".replace("                                    ", "")
-                    dimension_svg += f"""   <g font-size="29.1042" font-style="normal" stroke-opacity="1" fill="none" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="{dimension_line_thickness}" font-weight="400" transform="matrix(1,0,0,1,{view.X.Value},{1000 - view.Y.Value})" stroke-linecap="round" stroke-linejoin="bevel">
-                                              <path fill-rule="evenodd" vector-effect="none" d="M{main_line_start[0]},{main_line_start[1]} L{main_line_end[0]},{main_line_end[1]} M{left_aux_line_start[0]},{left_aux_line_start[1]} L{left_aux_line_end[0]},{left_aux_line_end[1]} M{right_aux_line_start[0]},{right_aux_line_start[1]} L{right_aux_line_end[0]},{right_aux_line_end[1]}"/>
-                                            </g>\n""".replace("                                     ", "")
-                    dimension_svg += f"""   <g font-size="29.1042" font-style="normal" stroke-opacity="1" fill="none" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="{dimension_line_thickness}" font-weight="400" transform="matrix(1,0,0,1,{view.X.Value},{1000 - view.Y.Value})" stroke-linecap="round" stroke-linejoin="bevel">
-                                             <g fill-opacity="1" font-size="29.1042" font-style="normal" stroke-opacity="1" fill="{colors['dimension_color']}" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="1" font-weight="400" transform="matrix(1,0,0,1,{ending_coordinates[0]},{ending_coordinates[1] + label_offset})" stroke-linecap="round" stroke-linejoin="bevel">
-                                              <path fill-rule="evenodd" vector-effect="none" d="M0,0 L-15,-6 L-15,6 L0,0"/>
-                                             </g>
-                                             <g fill-opacity="1" font-size="29.1042" font-style="normal" stroke-opacity="1" fill="{colors['dimension_color']}" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="1" font-weight="400" transform="matrix(1,0,0,1,{starting_coordinates[0]},{starting_coordinates[1] + label_offset})" stroke-linecap="round" stroke-linejoin="bevel">
-                                              <path fill-rule="evenodd" vector-effect="none" d="M0,0 L15,6 L15,-6 L0,0"/>
-                                             </g>
-                                            </g>\n""".replace("                                     ", "")
-                return dimension_svg
+                    offset_starting_y = starting_y + label_offset
+                    offset_ending_y = ending_y + label_offset
+                    fields['label_x'] = view.X.Value + label_alignment
+                    fields['label_y'] = 1000 - view.Y.Value
+                    fields['text_y'] = offset_ending_y - dimension_font_size / 4
+                    fields['path'] = _DIMENSION_PATH % (starting_x, offset_starting_y, ending_x, offset_ending_y, starting_x, starting_y, starting_x, offset_starting_y, ending_x, ending_y, ending_x, offset_ending_y)
+                    fields['ending_arrow_x'] = ending_x
+                    fields['ending_arrow_y'] = offset_ending_y
+                    fields['ending_arrow'] = _DIMENSION_ARROW_PATH % (-15, -6, -15, 6)
+                    fields['starting_arrow_x'] = starting_x
+                    fields['starting_arrow_y'] = offset_starting_y
+                    fields['starting_arrow'] = _DIMENSION_ARROW_PATH % (15, 6, 15, -6)
+
+                    dimension_svg.append(_DIMENSION_LABEL_X_SVG % fields)
+                    dimension_svg.append(_DIMENSION_LINES_SVG % fields)
+                    dimension_svg.append(_DIMENSION_ARROWS_SVG % fields)
+                return "".join(dimension_svg)
 
             projection_line_thickness = 4
             dimension_line_thickness = 1
@@ -3024,9 +2998,7 @@ class FreeCADBuilder:
                      </g>
                     </svg>
                     """.replace("                ", "")
-            svgFile_data = ""
-            svgFile_data += head
-            svgFile_data += projetion_head
+            svg_parts = [head, projetion_head]
             if 'F' not in dimensions:
                 dimensions['F'] = dimensions['C']
 
@@ -3035,15 +3007,15 @@ class FreeCADBuilder:
                 m.rotateZ(math.radians(90))
                 piece.Placement.Matrix = m
                 piece.Placement.move(FreeCAD.Vector(-dimensions["A"] / 2 + dimensions["F"] / 2, 0, 0))
-                svgFile_data += TechDraw.projectToSVG(piece.Shape, FreeCAD.Vector(0., 0., 1.)).replace("><", ">\n<").replace("<", "    <").replace("stroke-width=\"0.7\"", f"stroke-width=\"{projection_line_thickness}\"").replace("#000000", colors['projection_color']).replace("rgb(0, 0, 0)", colors['projection_color'])
+                svg_parts.append(TechDraw.projectToSVG(piece.Shape, _Z_AXIS).replace("><", ">\n<").replace("<", "    <").replace("stroke-width=\"0.7\"", f"stroke-width=\"{projection_line_thickness}\"").replace("#000000", colors['projection_color']).replace("rgb(0, 0, 0)", colors['projection_color']))
             else:
                 m = piece.Placement.Matrix
                 m.rotateY(math.radians(90))
                 piece.Placement.Matrix = m
                 piece.Placement.move(FreeCAD.Vector(-dimensions["B"] / 2, 0, 0))
-                svgFile_data += TechDraw.projectToSVG(piece.Shape, FreeCAD.Vector(0., 1., 0.)).replace("><", ">\n<").replace("<", "    <").replace("stroke-width=\"0.7\"", f"stroke-width=\"{projection_line_thickness}\"").replace("#000000", colors['projection_color']).replace("rgb(0, 0, 0)", colors['projection_color'])
+                svg_parts.append(TechDraw.projectToSVG(piece.Shape, _Y_AXIS).replace("><", ">\n<").replace("<", "    <").replace("stroke-width=\"0.7\"", f"stroke-width=\"{projection_line_thickness}\"").replace("#000000", colors['projection_color']).replace("rgb(0, 0, 0)", colors['projection_color']))
 
-            svgFile_data += projetion_tail
+            svg_parts.append(projetion_tail)
             if 'F' not in original_dimensions:
                 original_dimensions['F'] = original_dimensions['C']
 
@@ -3055,41 +3027,41 @@ class FreeCADBuilder:
 
             if view.Name == "TopView":
                 if "C" in dimensions and dimensions["C"] > 0:
-                    svgFile_data += create_dimension(starting_coordinates=[dimensions['A'] / 2, -dimensions['C'] / 2],
-                                                     ending_coordinates=[dimensions['A'] / 2, dimensions['C'] / 2],
-                                                     dimension_type="DistanceY",
-                                                     dimension_label=f"C: {round(original_dimensions['C'], 2)} mm",
-                                                     label_offset=horizontal_offset)
+                    svg_parts.append(create_dimension(starting_coordinates=[dimensions['A'] / 2, -dimensions['C'] / 2],
+                                                      ending_coordinates=[dimensions['A'] / 2, dimensions['C'] / 2],
+                                                      dimension_type="DistanceY",
+                                                      dimension_label=f"C: {round(original_dimensions['C'], 2)} mm",
+                                                      label_offset=horizontal_offset))
                     horizontal_offset += increment
 
                 if "G" in dimensions and dimensions['G'] > 0:
-                    svgFile_data += create_dimension(starting_coordinates=[-dimensions['A'] / 2 + dimensions['F'] / 2 - dimensions['G'] / 2, 0],
-                                                     ending_coordinates=[-dimensions['A'] / 2 + dimensions['F'] / 2 + dimensions['G'] / 2, 0],
-                                                     dimension_type="DistanceX",
-                                                     dimension_label=f"G: {round(original_dimensions['G'], 2)} mm",
-                                                     label_offset=vertical_offset + shape_semi_height,
-                                                     label_alignment=-dimensions['A'] / 2 + dimensions['F'] / 2)
-                    svgFile_data += create_dimension(starting_coordinates=[dimensions['A'] / 2 - dimensions['F'] / 2 + dimensions['G'] / 2, 0],
-                                                     ending_coordinates=[dimensions['A'] / 2 - dimensions['F'] / 2 - dimensions['G'] / 2, 0],
-                                                     dimension_type="DistanceX",
-                                                     dimension_label=f"G: {round(original_dimensions['G'], 2)} mm",
-                                                     label_offset=vertical_offset + shape_semi_height,
-                                                     label_alignment=dimensions['A'] / 2 - dimensions['F'] / 2)
+                    svg_parts.append(create_dimension(starting_coordinates=[-dimensions['A'] / 2 + dimensions['F'] / 2 - dimensions['G'] / 2, 0],
+                                                      ending_coordinates=[-dimensions['A'] / 2 + dimensions['F'] / 2 + dimensions['G'] / 2, 0],
+                                                      dimension_type="DistanceX",
+                                                      dimension_label=f"G: {round(original_dimensions['G'], 2)} mm",
+                                                      label_offset=vertical_offset + shape_semi_height,
+                                                      label_alignment=-dimensions['A'] / 2 + dimensions['F'] / 2))
+                    svg_parts.append(create_dimension(starting_coordinates=[dimensions['A'] / 2 - dimensions['F'] / 2 + dimensions['G'] / 2, 0],
+                                                      ending_coordinates=[dimensions['A'] / 2 - dimensions['F'] / 2 - dimensions['G'] / 2, 0],
+                                                      dimension_type="DistanceX",
+                                                      dimension_label=f"G: {round(original_dimensions['G'], 2)} mm",
+                                                      label_offset=vertical_offset + shape_semi_height,
+                                                      label_alignment=dimensions['A'] / 2 - dimensions['F'] / 2))
                 vertical_offset += increment
                 if "F" in dimensions and dimensions["F"] > 0:
-                    svgFile_data += create_dimension(starting_coordinates=[-dimensions['A'] / 2, 0],
-                                                     ending_coordinates=[-dimensions['A'] / 2 + dimensions['F'], 0],
-                                                     dimension_type="DistanceX",
-                                                     dimension_label=f"F: {round(original_dimensions['F'], 2)} mm",
-                                                     label_offset=vertical_offset + shape_semi_height,
-                                                     label_alignment=-dimensions['A'] / 2 + dimensions['F'] / 2)
+                    svg_parts.append(create_dimension(starting_coordinates=[-dimensions['A'] / 2, 0],
+                                                      ending_coordinates=[-dimensions['A'] / 2 + dimensions['F'], 0],
+                                                      dimension_type="DistanceX",
+                                                      dimension_label=f"F: {round(original_dimensions['F'], 2)} mm",
+                                                      label_offset=vertical_offset + shape_semi_height,
+                                                      label_alignment=-dimensions['A'] / 2 + dimensions['F'] / 2))
                 if "H" in dimensions and dimensions["H"] > 0:
-                    svgFile_data += create_dimension(starting_coordinates=[dimensions['A'] / 2 - dimensions['H'], 0],
-                                                     ending_coordinates=[dimensions['A'] / 2, 0],
-                                                     dimension_type="DistanceX",
-                                                     dimension_label=f"H: {round(original_dimensions['H'], 2)} mm",
-                                                     label_offset=vertical_offset + shape_semi_height,
-                                                     label_alignment=dimensions['A'] / 2 - dimensions['H'] / 2)
+                    svg_parts.append(create_dimension(starting_coordinates=[dimensions['A'] / 2 - dimensions['H'], 0],
+                                                      ending_coordinates=[dimensions['A'] / 2, 0],
+                                                      dimension_type="DistanceX",
+                                                      dimension_label=f"H: {round(original_dimensions['H'], 2)} mm",
+                                                      label_offset=vertical_offset + shape_semi_height,
+                                                      label_alignment=dimensions['A'] / 2 - dimensions['H'] / 2))
 
                 if 'F' in dimensions:
                     left_column_diameter = dimensions['F']
@@ -3104,43 +3076,43 @@ class FreeCADBuilder:
                 if 'E' not in original_dimensions:
                     original_dimensions['E'] = original_dimensions['A'] - original_dimensions['F'] - original_dimensions['']
 
-                svgFile_data += create_dimension(starting_coordinates=[-dimensions['A'] / 2 + left_column_diameter, 0],
-                                                 ending_coordinates=[dimensions['A'] / 2 - right_column_diameter, 0],
-                                                 dimension_type="DistanceX",
-                                                 dimension_label=f"E: Min {round(original_dimensions['E'], 2)} mm",
-                                                 label_offset=vertical_offset + shape_semi_height,
-                                                 label_alignment=-dimensions['A'] / 2 + left_column_diameter + (dimensions['A'] - left_column_diameter - right_column_diameter) / 2)
+                svg_parts.append(create_dimension(starting_coordinates=[-dimensions['A'] / 2 + left_column_diameter, 0],
+                                                  ending_coordinates=[dimensions['A'] / 2 - right_column_diameter, 0],
+                                                  dimension_type="DistanceX",
+                                                  dimension_label=f"E: Min {round(original_dimensions['E'], 2)} mm",
+                                                  label_offset=vertical_offset + shape_semi_height,
+                                                  label_alignment=-dimensions['A'] / 2 + left_column_diameter + (dimensions['A'] - left_column_diameter - right_column_diameter) / 2))
                 vertical_offset += increment
-                svgFile_data += create_dimension(starting_coordinates=[-dimensions['A'] / 2, 0],
-                                                 ending_coordinates=[dimensions['A'] / 2, 0],
-                                                 dimension_type="DistanceX",
-                                                 dimension_label=f"A: {round(original_dimensions['A'], 2)} mm",
-                                                 label_offset=vertical_offset + shape_semi_height)
+                svg_parts.append(create_dimension(starting_coordinates=[-dimensions['A'] / 2, 0],
+                                                  ending_coordinates=[dimensions['A'] / 2, 0],
+                                                  dimension_type="DistanceX",
+                                                  dimension_label=f"A: {round(original_dimensions['A'], 2)} mm",
+                                                  label_offset=vertical_offset + shape_semi_height))
                 vertical_offset += increment
             else:
                 if 'H' in dimensions:
                     starting_point_for_d = dimensions['H'] / 2
                 else:
                     starting_point_for_d = dimensions['E'] / 2
-                svgFile_data += create_dimension(starting_coordinates=[starting_point_for_d, -dimensions['B'] / 2],
-                                                 ending_coordinates=[starting_point_for_d, -dimensions['B'] / 2 + dimensions['D']],
-                                                 dimension_type="DistanceY",
-                                                 dimension_label=f"D: {round(original_dimensions['D'], 2)} mm",
-                                                 label_offset=horizontal_offset + (dimensions['A'] / 2 - starting_point_for_d),
-                                                 label_alignment=-dimensions['B'] / 2 + dimensions['D'] / 2)
+                svg_parts.append(create_dimension(starting_coordinates=[starting_point_for_d, -dimensions['B'] / 2],
+                                                  ending_coordinates=[starting_point_for_d, -dimensions['B'] / 2 + dimensions['D']],
+                                                  dimension_type="DistanceY",
+                                                  dimension_label=f"D: {round(original_dimensions['D'], 2)} mm",
+                                                  label_offset=horizontal_offset + (dimensions['A'] / 2 - starting_point_for_d),
+                                                  label_alignment=-dimensions['B'] / 2 + dimensions['D'] / 2))
                 horizontal_offset += increment
-                svgFile_data += create_dimension(starting_coordinates=[dimensions['A'] / 2, -dimensions['B'] / 2],
-                                                 ending_coordinates=[dimensions['A'] / 2, dimensions['B'] / 2],
-                                                 dimension_type="DistanceY",
-                                                 dimension_label=f"B: {round(original_dimensions['B'], 2)} mm",
-                                                 label_offset=horizontal_offset)
-
-            svgFile_data += tail
+                svg_parts.append(create_dimension(starting_coordinates=[dimensions['A'] / 2, -dimensions['B'] / 2],
+                                                  ending_coordinates=[dimensions['A'] / 2, dimensions['B'] / 2],
+                                                  dimension_type="DistanceY",
+                                                  dimension_label=f"B: {round(original_dimensions['B'], 2)} mm",
+                                                  label_offset=horizontal_offset))
+
+            svg_parts.append(tail)
+            svgFile_data = "".join(svg_parts)
             
             if save_files:
-                svgFile = open(f"{self.output_path}/{project_name}_{view.Name}.svg", "w")
-                svgFile.write(svgFile_data)
-                svgFile.close() 
+                with open(f"{self.output_path}/{project_name}_{view.Name}.svg", "w", encoding="utf-8") as svgFile:
+                    svgFile.write(svgFile_data)
             return svgFile_data
 
         def apply_machining(self, piece, machining, dimensions):
@@ -3162,7 +3134,7 @@ class FreeCADBuilder:
                 y_coordinate = winding_column_width / 2
 
             tool.Height = machining['length'] * 1000
-            tool.Placement = FreeCAD.Placement(FreeCAD.Vector(x_coordinate, y_coordinate, (machining['coordinates'][1] - machining['length'] / 2) * 1000), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
+            tool.Placement = FreeCAD.Placement(FreeCAD.Vector(x_coordinate, y_coordinate, (machining['coordinates'][1] - machining['length'] / 2) * 1000), _IDENTITY_ROT)
 
             machined_piece = document.addObject("Part::Cut", "machined_piece")
             machined_piece.Base = piece
@@ -3178,25 +3150,20 @@ class FreeCADBuilder:
             }
 
         def get_shape_extras(self, data, piece):
-            import FreeCAD
+            import Part
             dimensions = data["dimensions"]
             document = FreeCAD.ActiveDocument
 
-            top_column = document.addObject("Part::Box", "top_column")
-            top_column.Length = dimensions["C"]
-            top_column.Width = dimensions["F"]
-            top_column.Height = dimensions["D"]
-            top_column.Placement = FreeCAD.Placement(FreeCAD.Vector(-dimensions["C"] / 2, -dimensions["A"] / 2, (dimensions["B"] - dimensions["D"]) / 2), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
-        
+            zmin = (dimensions["B"] - dimensions["D"]) / 2
             bottom_column_width = dimensions["A"] - dimensions["E"] - dimensions["F"]
-            bottom_column = document.addObject("Part::Box", "bottom_column")
-            bottom_column.Length = dimensions["C"]
-            bottom_column.Width = bottom_column_width
-            bottom_column.Height = dimensions["D"]
-            bottom_column.Placement = FreeCAD.Placement(FreeCAD.Vector(-dimensions["C"] / 2, dimensions["A"] / 2 - bottom_column_width, (dimensions["B"] - dimensions["D"]) / 2), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
+            top_column = Part.makeBox(dimensions["C"], dimensions["F"], dimensions["D"], FreeCAD.Vector(-dimensions["C"] / 2, -dimensions["A"] / 2, zmin))
+            bottom_column = Part.makeBox(dimensions["C"], bottom_column_width, dimensions["D"], FreeCAD.Vector(-dimensions["C"] / 2, dimensions["A"] / 2 - bottom_column_width, zmin))
+
+            lateral_columns = document.addObject("Part::Feature", "lateral_columns")
+            lateral_columns.Shape = top_column.fuse(bottom_column)
 
             columns = document.addObject("Part::MultiFuse", "columns")
-            columns.Shapes = [piece, bottom_column, top_column]
+            columns.Shapes = [piece, lateral_columns]
             document.recompute()
 
             columns.Placement.move(FreeCAD.Vector(0, 0, dimensions["B"] / 2))
@@ -3204,42 +3171,20 @@ class FreeCADBuilder:
             return columns
 
         def get_shape_base(self, data, sketch):
-            import FreeCAD
-            import Part
-            import Sketcher
             dimensions = data["dimensions"]
             c = dimensions["C"] / 2
             a = dimensions["A"] / 2
 
-            top_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(-c, a, 0), FreeCAD.Vector(c, a, 0)), False)
-            right_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(c, a, 0), FreeCAD.Vector(c, -a, 0)), False)
-            bottom_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(c, -a, 0), FreeCAD.Vector(-c, -a, 0)), False)
-            left_line = sketch.addGeometry(Part.LineSegment(FreeCAD.Vector(-c, -a, 0), FreeCAD.Vector(-c, a, 0)), False)
-            sketch.addConstraint(Sketcher.Constraint('Coincident', top_line, 2, right_line, 1))
-            sketch.addConstraint(Sketcher.Constraint('Coincident', right_line, 2, bottom_line, 1))
-            sketch.addConstraint(Sketcher.Constraint('Coincident', bottom_line, 2, left_line, 1))
-            sketch.addConstraint(Sketcher.Constraint('Coincident', left_line, 2, top_line, 1))
-            sketch.addConstraint(Sketcher.Constraint('DistanceY', bottom_line, 1, -1, 1, a))
-            sketch.addConstraint(Sketcher.Constraint('DistanceY', top_line, 1, -1, 1, -a))
-            sketch.addConstraint(Sketcher.Constraint('DistanceX', left_line, 1, -1, 1, c))
-            sketch.addConstraint(Sketcher.Constraint('DistanceX', right_line, 1, -1, 1, -c))
-            sketch.addConstraint(Sketcher.Constraint('Vertical', right_line))
-            sketch.addConstraint(Sketcher.Constraint('Vertical', left_line))
-            sketch.addConstraint(Sketcher.Constraint('Horizontal', top_line))
-            sketch.addConstraint(Sketcher.Constraint('Horizontal', bottom_line))
+            self.add_centered_rectangle(sketch, c, a)
 
         def get_negative_winding_window(self, dimensions):
-            import FreeCAD
+            import Part
             document = FreeCAD.ActiveDocument
-            central_hole = document.addObject("Part::Box", "central_hole")
-            central_hole.Length = dimensions["C"]
-            central_hole.Width = dimensions["A"]
-            central_hole.Height = dimensions["D"]
-            central_hole.Placement = FreeCAD.Placement(FreeCAD.Vector(-dimensions["C"] / 2, -dimensions["A"] / 2, (dimensions["B"] - dimensions["D"]) / 2), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
+            central_hole = document.addObject("Part::Feature", "central_hole")
+            central_hole.Shape = Part.makeBox(dimensions["C"], dimensions["A"], dimensions["D"], FreeCAD.Vector(-dimensions["C"] / 2, -dimensions["A"] / 2, (dimensions["B"] - dimensions["D"]) / 2))
             return central_hole
 
         def get_top_projection(self, data, piece, margin):
-            import FreeCAD
 
             dimensions = data["dimensions"]
 
@@ -3271,7 +3216,7 @@ class FreeCADBuilder:
             top_view.Scale = 1.000000
             top_view.ScaleType = 0
             top_view.Rotation = 0
-            top_view.Direction = FreeCAD.Vector(0.00, 0.00, 1.00)
+            top_view.Direction = _Z_AXIS
             top_view.XDirection = FreeCAD.Vector(0.00, 1.00, 0.00)
             top_view.X = margin + dimensions['A'] / 2
 
@@ -3284,7 +3229,6 @@ class FreeCADBuilder:
             return top_view
 
         def get_front_projection(self, data, piece, margin):
-            import FreeCAD
 
             dimensions = data["dimensions"]
 
@@ -3307,9 +3251,6 @@ class FreeCADBuilder:
             return front_view
 
         def add_dimensions_and_export_view(self, data, original_dimensions, view, project_name, margin, colors, save_files, piece):
-            import FreeCAD
-            import TechDraw
-
             def calculate_total_dimensions():
                 if view.Name == "TopView":
                     base_width = data['dimensions']['A'] + margin
@@ -3340,53 +3281,52 @@ class FreeCADBuilder:
                 return base_width, base_height
 
             def create_dimension(starting_coordinates, ending_coordinates, dimension_type, dimension_label, label_offset=0, label_alignment=0):
-                dimension_svg = ""
+                dimension_svg = []
+                starting_x, starting_y = starting_coordinates
+                ending_x, ending_y = ending_coordinates
+                fields = {
+                    'color': colors['dimension_color'],
+                    'font_size': dimension_font_size,
+                    'line_thickness': dimension_line_thickness,
+                    'view_x': view.X.Value,
+                    'view_y': 1000 - view.Y.Value,
+                    'label': dimension_label,
+                }
 
                 if dimension_type == "DistanceY":
-                    main_line_start = [starting_coordinates[0] + label_offset, starting_coordinates[1]]
-                    main_line_end = [ending_coordinates[0] + label_offset, ending_coordinates[1]]
-                    left_aux_line_start = [starting_coordinates[0], starting_coordinates[1]]
-                    left_aux_line_end = [starting_coordinates[0] + label_offset, starting_coordinates[1]]
-                    right_aux_line_start = [ending_coordinates[0], ending_coordinates[1]]
-                    right_aux_line_end = [ending_coordinates[0] + label_offset, ending_coordinates[1]]
-
-                    dimension_svg += f"""   <g font-size="29.1042" font-style="normal" stroke-opacity="1" fill="none" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="1" font-weight="400" transform="matrix(1,0,0,1,{view.X.Value + ending_coordinates[0] + label_offset - dimension_font_size / 4},{1000 - view.Y.Value + label_alignment})" stroke-linecap="square" stroke-linejoin="bevel">
-                                             <text x="0" y="0" text-anchor="middle" fill-opacity="1" font-size="{dimension_font_size}" font-style="normal" fill="{colors['dimension_color']}" font-family="osifont" stroke="none" xml:space="preserve" font-weight="400" transform="rotate(-90)">{dimension_label}</text>
-                                            </g>\n""".replace("                                    ", "")
-                    dimension_svg += f"""   <g font-size="29.1042" font-style="normal" stroke-opacity="1" fill="none" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="{dimension_line_thickness}" font-weight="400" transform="matrix(1,0,0,1,{view.X.Value},{1000 - view.Y.Value})" stroke-linecap="round" stroke-linejoin="bevel">
-                                              <path fill-rule="evenodd" vector-effect="none" d="M{main_line_start[0]},{main_line_start[1]} L{main_line_end[0]},{main_line_end[1]} M{left_aux_line_start[0]},{left_aux_line_start[1]} L{left_aux_line_end[0]},{left_aux_line_end[1]} M{right_aux_line_start[0]},{right_aux_line_start[1]} L{right_aux_line_end[0]},{right_aux_line_end[1]}"/>
-                                            </g>\n""".replace("                                     ", "")
-                    dimension_svg += f"""   <g font-size="29.1042" font-style="normal" stroke-opacity="1" fill="none" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="{dimension_line_thickness}" font-weight="400" transform="matrix(1,0,0,1,{view.X.Value},{1000 - view.Y.Value})" stroke-linecap="round" stroke-linejoin="bevel">
-                                             <g fill-opacity="1" font-size="29.1042" font-style="normal" stroke-opacity="1" fill="{colors['dimension_color']}" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="1" font-weight="400" transform="matrix(1,0,0,1,{ending_coordinates[0] + label_offset},{ending_coordinates[1]})" stroke-linecap="round" stroke-linejoin="bevel">
-                                              <path fill-rule="evenodd" vector-effect="none" d="M0,0 L6,-15 L-6,-15 L0,0"/>
-                                             </g>
-                                             <g fill-opacity="1" font-size="29.1042" font-style="normal" stroke-opacity="1" fill="{colors['dimension_color']}" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="1" font-weight="400" transform="matrix(1,0,0,1,{starting_coordinates[0] + label_offset},{starting_coordinates[1]})" stroke-linecap="round" stroke-linejoin="bevel">
-                                              <path fill-rule="evenodd" vector-effect="none" d="M0,0 L-6,15 L6,15 L0,0"/>
-                                             </g>
-                                            </g>\n""".replace("                                     ", "")
+                    offset_starting_x = starting_x + label_offset
+                    offset_ending_x = ending_x + label_offset
+                    fields['label_x'] = view.X.Value + offset_ending_x - dimension_font_size / 4
+                    fields['label_y'] = 1000 - view.Y.Value + label_alignment
+                    fields['path'] = _DIMENSION_PATH % (offset_starting_x, starting_y, offset_ending_x, ending_y, starting_x, starting_y, offset_starting_x, starting_y, ending_x, ending_y, offset_ending_x, ending_y)
+                    fields['ending_arrow_x'] = offset_ending_x
+                    fields['ending_arrow_y'] = ending_y
+                    fields['ending_arrow'] = _DIMENSION_ARROW_PATH % (6, -15, -6, -15)
+                    fields['starting_arrow_x'] = offset_starting_x
+                    fields['starting_arrow_y'] = starting_y
+                    fields['starting_arrow'] = _DIMENSION_ARROW_PATH % (-6, 15, 6, 15)
+
+                    dimension_svg.append(_DIMENSION_LABEL_Y_SVG % fields)
+                    dimension_svg.append(_DIMENSION_LINES_SVG % fields)
+                    dimension_svg.append(_DIMENSION_ARROWS_SVG % fields)
                 elif dimension_type == "DistanceX":
-                    main_line_start = [starting_coordinates[0], starting_coordinates[1] + label_offset]
-                    main_line_end = [ending_coordinates[0], ending_coordinates[1] + label_offset]
-                    left_aux_line_start = [starting_coordinates[0], starting_coordinates[1]]
-                    left_aux_line_end = [starting_coordinates[0], starting_coordinates[1] + label_offset]
-                    right_aux_line_start = [ending_coordinates[0], ending_coordinates[1]]
-                    right_aux_line_end = [ending_coordinates[0], ending_coordinates[1] + label_offset]
-
-                    dimension_svg += f"""   <g font-size="29.1042" font-style="normal" stroke-opacity="1" fill="none" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="1" font-weight="400" transform="matrix(1,0,0,1,{view.X.Value + label_alignment},{1000 - view.Y.Value})" stroke-linecap="square" stroke-linejoin="bevel">
-                                             <text x="0" y="{ending_coordinates[1] + label_offset - dimension_font_size / 4}" text-anchor="middle" fill-opacity="1" font-size="{dimension_font_size}" font-style="normal" fill="{colors['dimension_color']}" font-family="osifont" stroke="none" xml:space="preserve" font-weight="400">{dimension_label}</text>
-                                            </g>\n""".replace("                                    ", "")
-                    dimension_svg += f"""   <g font-size="29.1042" font-style="normal" stroke-opacity="1" fill="none" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="{dimension_line_thickness}" font-weight="400" transform="matrix(1,0,0,1,{view.X.Value},{1000 - view.Y.Value})" stroke-linecap="round" stroke-linejoin="bevel">
-                                              <path fill-rule="evenodd" vector-effect="none" d="M{main_line_start[0]},{main_line_start[1]} L{main_line_end[0]},{main_line_end[1]} M{left_aux_line_start[0]},{left_aux_line_start[1]} L{left_aux_line_end[0]},{left_aux_line_end[1]} M{right_aux_line_start[0]},{right_aux_line_start[1]} L{right_aux_line_end[0]},{right_aux_line_end[1]}"/>
-                                            </g>\n""".replace("                                     ", "")
-                    dimension_svg += f"""   <g font-size="29.1042" font-style="normal" stroke-opacity="1" fill="none" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="{dimension_line_thickness}" font-weight="400" transform="matrix(1,0,0,1,{view.X.Value},{1000 - view.Y.Value})" stroke-linecap="round" stroke-linejoin="bevel">
-                                             <g fill-opacity="1" font-size="29.1042" font-style="normal" stroke-opacity="1" fill="{colors['dimension_color']}" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="1" font-weight="400" transform="matrix(1,0,0,1,{ending_coordinates[0]},{ending_coordinates[1] + label_offset})" stroke-linecap="round" stroke-linejoin="bevel">
-                                              <path fill-rule="evenodd" vector-effect="none" d="M0,0 L-15,-6 L-15,6 L0,0"/>
-                                             </g>
-                                             <g fill-opacity="1" font-size="29.1042" font-style="normal" stroke-opacity="1" fill="{colors['dimension_color']}" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="1" font-weight="400" transform="matrix(1,0,0,1,{starting_coordinates[0]},{starting_coordinates[1] + label_offset})" stroke-linecap="round" stroke-linejoin="bevel">
-                                              <path fill-rule="evenodd" vector-effect="none" d="M0,0 L15,6 L15,-6 L0,0"/>
-                                             </g>
-                                            </g>\n""".replace("                                     ", "")
-                return dimension_svg
+                    offset_starting_y = starting_y + label_offset
+                    offset_ending_y = ending_y + label_offset
+                    fields['label_x'] = view.X.Value + label_alignment
+                    fields['label_y'] = 1000 - view.Y.Value
+                    fields['text_y'] = offset_ending_y - dimension_font_size / 4
+                    fields['path'] = _DIMENSION_PATH % (starting_x, offset_starting_y, ending_x, offset_ending_y, starting_x, starting_y, starting_x, offset_starting_y, ending_x, ending_y, ending_x, offset_ending_y)
+                    fields['ending_arrow_x'] = ending_x
+                    fields['ending_arrow_y'] = offset_ending_y
+                    fields['ending_arrow'] = _DIMENSION_ARROW_PATH % (-15, -6, -15, 6)
+                    fields['starting_arrow_x'] = starting_x
+                    fields['starting_arrow_y'] = offset_starting_y
+                    fields['starting_arrow'] = _DIMENSION_ARROW_PATH % (15, 6, 15, -6)
+
+                    dimension_svg.append(_DIMENSION_LABEL_X_SVG % fields)
+                    dimension_svg.append(_DIMENSION_LINES_SVG % fields)
+                    dimension_svg.append(_DIMENSION_ARROWS_SVG % fields)
+                return "".join(dimension_svg)
 
             projection_line_thickness = 4
             dimension_line_thickness = 1
@@ -3409,83 +3349,80 @@ class FreeCADBuilder:
                      </g>
                     </svg>
                     """.replace("                ", "")
-            svgFile_data = ""
-            svgFile_data += head
-            svgFile_data += projetion_head
+            svg_parts = [head, projetion_head]
 
             if view.Name == "TopView":
                 m = piece.Placement.Matrix
                 m.rotateZ(math.radians(90))
                 piece.Placement.Matrix = m
-                svgFile_data += TechDraw.projectToSVG(piece.Shape, FreeCAD.Vector(0., 0., 1.)).replace("><", ">\n<").replace("<", "    <").replace("stroke-width=\"0.7\"", f"stroke-width=\"{projection_line_thickness}\"").replace("#000000", colors['projection_color']).replace("rgb(0, 0, 0)", colors['projection_color'])
+                svg_parts.append(TechDraw.projectToSVG(piece.Shape, _Z_AXIS).replace("><", ">\n<").replace("<", "    <").replace("stroke-width=\"0.7\"", f"stroke-width=\"{projection_line_thickness}\"").replace("#000000", colors['projection_color']).replace("rgb(0, 0, 0)", colors['projection_color']))
             else:
                 m = piece.Placement.Matrix
                 m.rotateY(math.radians(90))
                 piece.Placement.Matrix = m
                 piece.Placement.move(FreeCAD.Vector(-dimensions["B"], 0, 0))
-                svgFile_data += TechDraw.projectToSVG(piece.Shape, FreeCAD.Vector(0., 1., 0.)).replace("><", ">\n<").replace("<", "    <").replace("stroke-width=\"0.7\"", f"stroke-width=\"{projection_line_thickness}\"").replace("#000000", colors['projection_color']).replace("rgb(0, 0, 0)", colors['projection_color'])
-            svgFile_data += projetion_tail
+                svg_parts.append(TechDraw.projectToSVG(piece.Shape, _Y_AXIS).replace("><", ">\n<").replace("<", "    <").replace("stroke-width=\"0.7\"", f"stroke-width=\"{projection_line_thickness}\"").replace("#000000", colors['projection_color']).replace("rgb(0, 0, 0)", colors['projection_color']))
+            svg_parts.append(projetion_tail)
             if view.Name == "TopView":
                 if "C" in dimensions and dimensions["C"] > 0:
-                    svgFile_data += create_dimension(starting_coordinates=[dimensions['A'] / 2, -dimensions['C'] / 2],
-                                                     ending_coordinates=[dimensions['A'] / 2, dimensions['C'] / 2],
-                                                     dimension_type="DistanceY",
-                                                     dimension_label=f"C: {round(original_dimensions['C'], 2)} mm",
-                                                     label_offset=horizontal_offset)
+                    svg_parts.append(create_dimension(starting_coordinates=[dimensions['A'] / 2, -dimensions['C'] / 2],
+                                                      ending_coordinates=[dimensions['A'] / 2, dimensions['C'] / 2],
+                                                      dimension_type="DistanceY",
+                                                      dimension_label=f"C: {round(original_dimensions['C'], 2)} mm",
+                                                      label_offset=horizontal_offset))
                     horizontal_offset += increment
 
                 if "F" in dimensions and dimensions["F"] > 0:
-                    svgFile_data += create_dimension(starting_coordinates=[-dimensions['A'] / 2, 0],
-                                                     ending_coordinates=[-dimensions['A'] / 2 + dimensions['F'], 0],
-                                                     dimension_type="DistanceX",
-                                                     dimension_label=f"F: {round(original_dimensions['F'], 2)} mm",
-                                                     label_offset=vertical_offset + shape_semi_height,
-                                                     label_alignment=-dimensions['A'] / 2 + dimensions['F'] / 2)
+                    svg_parts.append(create_dimension(starting_coordinates=[-dimensions['A'] / 2, 0],
+                                                      ending_coordinates=[-dimensions['A'] / 2 + dimensions['F'], 0],
+                                                      dimension_type="DistanceX",
+                                                      dimension_label=f"F: {round(original_dimensions['F'], 2)} mm",
+                                                      label_offset=vertical_offset + shape_semi_height,
+                                                      label_alignment=-dimensions['A'] / 2 + dimensions['F'] / 2))
 
                 left_column_diameter = dimensions['F']
                 right_column_diameter = dimensions['A'] - dimensions['E'] - dimensions['F']
 
-                svgFile_data += create_dimension(starting_coordinates=[-dimensions['A'] / 2 + left_column_diameter, 0],
-                                                 ending_coordinates=[dimensions['A'] / 2 - right_column_diameter, 0],
-                                                 dimension_type="DistanceX",
-                                                 dimension_label=f"E: {round(original_dimensions['E'], 2)} mm",
-                                                 label_offset=vertical_offset + shape_semi_height,
-                                                 label_alignment=-dimensions['A'] / 2 + left_column_diameter + (dimensions['A'] - left_column_diameter - right_column_diameter) / 2)
+                svg_parts.append(create_dimension(starting_coordinates=[-dimensions['A'] / 2 + left_column_diameter, 0],
+                                                  ending_coordinates=[dimensions['A'] / 2 - right_column_diameter, 0],
+                                                  dimension_type="DistanceX",
+                                                  dimension_label=f"E: {round(original_dimensions['E'], 2)} mm",
+                                                  label_offset=vertical_offset + shape_semi_height,
+                                                  label_alignment=-dimensions['A'] / 2 + left_column_diameter + (dimensions['A'] - left_column_diameter - right_column_diameter) / 2))
                 vertical_offset += increment
-                svgFile_data += create_dimension(starting_coordinates=[-dimensions['A'] / 2, 0],
-                                                 ending_coordinates=[dimensions['A'] / 2, 0],
-                                                 dimension_type="DistanceX",
-                                                 dimension_label=f"A: {round(original_dimensions['A'], 2)} mm",
-                                                 label_offset=vertical_offset + shape_semi_height)
+                svg_parts.append(create_dimension(starting_coordinates=[-dimensions['A'] / 2, 0],
+                                                  ending_coordinates=[dimensions['A'] / 2, 0],
+                                                  dimension_type="DistanceX",
+                                                  dimension_label=f"A: {round(original_dimensions['A'], 2)} mm",
+                                                  label_offset=vertical_offset + shape_semi_height))
                 vertical_offset += increment
             else:
                 if 'H' in dimensions:
                     starting_point_for_d = dimensions['H'] / 2
                 else:
                     starting_point_for_d = dimensions['E'] / 2
-                svgFile_data += create_dimension(starting_coordinates=[starting_point_for_d, -dimensions['D'] / 2],
-                                                 ending_coordinates=[starting_point_for_d, dimensions['D'] / 2],
-                                                 dimension_type="DistanceY",
-                                                 dimension_label=f"D: {round(original_dimensions['D'], 2)} mm",
-                                                 label_offset=horizontal_offset + (dimensions['A'] / 2 - starting_point_for_d),
-                                                 label_alignment=-dimensions['B'] / 2 + dimensions['D'] / 2)
+                svg_parts.append(create_dimension(starting_coordinates=[starting_point_for_d, -dimensions['D'] / 2],
+                                                  ending_coordinates=[starting_point_for_d, dimensions['D'] / 2],
+                                                  dimension_type="DistanceY",
+                                                  dimension_label=f"D: {round(original_dimensions['D'], 2)} mm",
+                                                  label_offset=horizontal_offset + (dimensions['A'] / 2 - starting_point_for_d),
+                                                  label_alignment=-dimensions['B'] / 2 + dimensions['D'] / 2))
                 horizontal_offset += increment
-                svgFile_data += create_dimension(starting_coordinates=[dimensions['A'] / 2, -dimensions['B'] / 2],
-                                                 ending_coordinates=[dimensions['A'] / 2, dimensions['B'] / 2],
-                                                 dimension_type="DistanceY",
-                                                 dimension_label=f"B: {round(original_dimensions['B'], 2)} mm",
-                                                 label_offset=horizontal_offset)
-
-            svgFile_data += tail
+                svg_parts.append(create_dimension(starting_coordinates=[dimensions['A'] / 2, -dimensions['B'] / 2],
+                                                  ending_coordinates=[dimensions['A'] / 2, dimensions['B'] / 2],
+                                                  dimension_type="DistanceY",
+                                                  dimension_label=f"B: {round(original_dimensions['B'], 2)} mm",
+                                                  label_offset=horizontal_offset))
+
+            svg_parts.append(tail)
+            svgFile_data = "".join(svg_parts)
             
             if save_files:
-                svgFile = open(f"{self.output_path}/{project_name}_{view.Name}.svg", "w")
-                svgFile.write(svgFile_data)
-                svgFile.close() 
+                with open(f"{self.output_path}/{project_name}_{view.Name}.svg", "w", encoding="utf-8") as svgFile:
+                    svgFile.write(svgFile_data)
             return svgFile_data
 
         def apply_machining(self, piece, machining, dimensions):
-            import FreeCAD
             document = FreeCAD.ActiveDocument
 
             tool = document.addObject("Part::Box", "tool")
@@ -3498,7 +3435,7 @@ class FreeCADBuilder:
                 y_coordinate = 0
 
             tool.Height = machining['length'] * 1000
-            tool.Placement = FreeCAD.Placement(FreeCAD.Vector(x_coordinate, y_coordinate, (machining['coordinates'][1] - machining['length'] / 2) * 1000), FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00))
+            tool.Placement = FreeCAD.Placement(FreeCAD.Vector(x_coordinate, y_coordinate, (machining['coordinates'][1] - machining['length'] / 2) * 1000), _IDENTITY_ROT)
 
             machined_piece = document.addObject("Part::Cut", "machined_piece")
             machined_piece.Base = piece
@@ -3515,15 +3452,14 @@ class FreeCADBuilder:
             return None
 
         def get_shape_base(self, data, sketch):
-            import FreeCAD
             import Part
             import Sketcher
             dimensions = data["dimensions"]
 
-            inner_circle = sketch.addGeometry(Part.Circle(FreeCAD.Vector(0, 0, 0), FreeCAD.Vector(0, 0, 1), dimensions["B"] / 2), False)
+            inner_circle = sketch.addGeometry(Part.Circle(_ORIGIN, _Z_AXIS, dimensions["B"] / 2), False)
             sketch.addConstraint(Sketcher.Constraint('Coincident', inner_circle, 3, -1, 1))
             sketch.addConstraint(Sketcher.Constraint('Diameter', inner_circle, dimensions["B"]))
-            outer_circle = sketch.addGeometry(Part.Circle(FreeCAD.Vector(0, 0, 0), FreeCAD.Vector(0, 0, 1), dimensions["A"] / 2), False)
+            outer_circle = sketch.addGeometry(Part.Circle(_ORIGIN, _Z_AXIS, dimensions["A"] / 2), False)
             sketch.addConstraint(Sketcher.Constraint('Coincident', outer_circle, 3, -1, 1))
             sketch.addConstraint(Sketcher.Constraint('Diameter', outer_circle, dimensions["A"]))
 
@@ -3535,7 +3471,6 @@ class FreeCADBuilder:
             return piece
 
         def get_top_projection(self, data, piece, margin):
-            import FreeCAD
             dimensions = data["dimensions"]
 
             document = FreeCAD.ActiveDocument
@@ -3547,8 +3482,8 @@ class FreeCADBuilder:
             top_view = document.addObject('TechDraw::DrawViewPart', 'TopView')
             page.addView(top_view)
             top_view.Source = [piece]
-            top_view.Direction = FreeCAD.Vector(0.00, 0.00, 1.00)
-            top_view.XDirection = FreeCAD.Vector(0.00, -1.00, 0.00)
+            top_view.Direction = _Z_AXIS
+            top_view.XDirection = _NEGATIVE_Y_AXIS
             top_view.X = margin + dimensions['A'] / 2
             top_view.Y = 1000 - data['dimensions']['A'] / 2 - margin / 2
 
@@ -3557,7 +3492,6 @@ class FreeCADBuilder:
             return top_view
 
         def get_front_projection(self, data, piece, margin):
-            import FreeCAD
             dimensions = data["dimensions"]
 
             document = FreeCAD.ActiveDocument
@@ -3574,15 +3508,15 @@ class FreeCADBuilder:
             section_front_view.Source = document.getObject('TopView').Source
             section_front_view.ScaleType = 0
             section_front_view.SectionDirection = 'Down'
-            section_front_view.SectionNormal = FreeCAD.Vector(-1.000, 0.000, 0.000)
+            section_front_view.SectionNormal = _NEGATIVE_X_AXIS
             section_front_view.SectionOrigin = FreeCAD.Vector(semi_depth, 0.000, 0)
             section_front_view.SectionSymbol = ''
             section_front_view.Label = 'Section  - '
             section_front_view.Scale = 1.000000
             section_front_view.ScaleType = 0
             section_front_view.Rotation = 0
-            section_front_view.Direction = FreeCAD.Vector(-1.00, 0.00, 0.00)
-            section_front_view.XDirection = FreeCAD.Vector(0.00, -1.00, 0.00)
+            section_front_view.Direction = _NEGATIVE_X_AXIS
+            section_front_view.XDirection = _NEGATIVE_Y_AXIS
             section_front_view.X = margin + dimensions['A'] / 2
             section_front_view.Y = 1000 - margin - dimensions['C'] / 2
             document.recompute()
@@ -3590,9 +3524,6 @@ class FreeCADBuilder:
             return section_front_view
 
         def add_dimensions_and_export_view(self, data, original_dimensions, view, project_name, margin, colors, save_files, piece):
-            import FreeCAD
-            import TechDraw
-
             def calculate_total_dimensions():
                 if view.Name == "TopView":
                     base_width = data['dimensions']['A'] + margin
@@ -3612,53 +3543,52 @@ class FreeCADBuilder:
                 return base_width, base_height
 
             def create_dimension(starting_coordinates, ending_coordinates, dimension_type, dimension_label, label_offset=0, label_alignment=0):
-                dimension_svg = ""
+                dimension_svg = []
+                starting_x, starting_y = starting_coordinates
+                ending_x, ending_y = ending_coordinates
+                fields = {
+                    'color': colors['dimension_color'],
+                    'font_size': dimension_font_size,
+                    'line_thickness': dimension_line_thickness,
+                    'view_x': view.X.Value,
+                    'view_y': 1000 - view.Y.Value,
+                    'label': dimension_label,
+                }
 
                 if dimension_type == "DistanceY":
-                    main_line_start = [starting_coordinates[0] + label_offset, starting_coordinates[1]]
-                    main_line_end = [ending_coordinates[0] + label_offset, ending_coordinates[1]]
-                    left_aux_line_start = [starting_coordinates[0], starting_coordinates[1]]
-                    left_aux_line_end = [starting_coordinates[0] + label_offset, starting_coordinates[1]]
-                    right_aux_line_start = [ending_coordinates[0], ending_coordinates[1]]
-                    right_aux_line_end = [ending_coordinates[0] + label_offset, ending_coordinates[1]]
-
-                    dimension_svg += f"""   <g font-size="29.1042" font-style="normal" stroke-opacity="1" fill="none" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="1" font-weight="400" transform="matrix(1,0,0,1,{view.X.Value + ending_coordinates[0] + label_offset - dimension_font_size / 4},{1000 - view.Y.Value + label_alignment})" stroke-linecap="square" stroke-linejoin="bevel">
-                                             <text x="0" y="0" text-anchor="middle" fill-opacity="1" font-size="{dimension_font_size}" font-style="normal" fill="{colors['dimension_color']}" font-family="osifont" stroke="none" xml:space="preserve" font-weight="400" transform="rotate(-90)">{dimension_label}</text>
-                                            </g>\n""".replace("                                    ", "")
-                    dimension_svg += f"""   <g font-size="29.1042" font-style="normal" stroke-opacity="1" fill="none" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="{dimension_line_thickness}" font-weight="400" transform="matrix(1,0,0,1,{view.X.Value},{1000 - view.Y.Value})" stroke-linecap="round" stroke-linejoin="bevel">
-                                              <path fill-rule="evenodd" vector-effect="none" d="M{main_line_start[0]},{main_line_start[1]} L{main_line_end[0]},{main_line_end[1]} M{left_aux_line_start[0]},{left_aux_line_start[1]} L{left_aux_line_end[0]},{left_aux_line_end[1]} M{right_aux_line_start[0]},{right_aux_line_start[1]} L{right_aux_line_end[0]},{right_aux_line_end[1]}"/>
-                                            </g>\n""".replace("                                     ", "")
-                    dimension_svg += f"""   <g font-size="29.1042" font-style="normal" stroke-opacity="1" fill="none" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="{dimension_line_thickness}" font-weight="400" transform="matrix(1,0,0,1,{view.X.Value},{1000 - view.Y.Value})" stroke-linecap="round" stroke-linejoin="bevel">
-                                             <g fill-opacity="1" font-size="29.1042" font-style="normal" stroke-opacity="1" fill="{colors['dimension_color']}" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="1" font-weight="400" transform="matrix(1,0,0,1,{ending_coordinates[0] + label_offset},{ending_coordinates[1]})" stroke-linecap="round" stroke-linejoin="bevel">
-                                              <path fill-rule="evenodd" vector-effect="none" d="M0,0 L6,-15 L-6,-15 L0,0"/>
-                                             </g>
-                                             <g fill-opacity="1" font-size="29.1042" font-style="normal" stroke-opacity="1" fill="{colors['dimension_color']}" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="1" font-weight="400" transform="matrix(1,0,0,1,{starting_coordinates[0] + label_offset},{starting_coordinates[1]})" stroke-linecap="round" stroke-linejoin="bevel">
-                                              <path fill-rule="evenodd" vector-effect="none" d="M0,0 L-6,15 L6,15 L0,0"/>
-                                             </g>
-                                            </g>\n""".replace("                                     ", "")
+                    offset_starting_x = starting_x + label_offset
+                    offset_ending_x = ending_x + label_offset
+                    fields['label_x'] = view.X.Value + offset_ending_x - dimension_font_size / 4
+                    fields['label_y'] = 1000 - view.Y.Value + label_alignment
+                    fields['path'] = _DIMENSION_PATH % (offset_starting_x, starting_y, offset_ending_x, ending_y, starting_x, starting_y, offset_starting_x, starting_y, ending_x, ending_y, offset_ending_x, ending_y)
+                    fields['ending_arrow_x'] = offset_ending_x
+                    fields['ending_arrow_y'] = ending_y
+                    fields['ending_arrow'] = _DIMENSION_ARROW_PATH % (6, -15, -6, -15)
+                    fields['starting_arrow_x'] = offset_starting_x
+                    fields['starting_arrow_y'] = starting_y
+                    fields['starting_arrow'] = _DIMENSION_ARROW_PATH % (-6, 15, 6, 15)
+
+                    dimension_svg.append(_DIMENSION_LABEL_Y_SVG % fields)
+                    dimension_svg.append(_DIMENSION_LINES_SVG % fields)
+                    dimension_svg.append(_DIMENSION_ARROWS_SVG % fields)
                 elif dimension_type == "DistanceX":
-                    main_line_start = [starting_coordinates[0], starting_coordinates[1] + label_offset]
-                    main_line_end = [ending_coordinates[0], ending_coordinates[1] + label_offset]
-                    left_aux_line_start = [starting_coordinates[0], starting_coordinates[1]]
-                    left_aux_line_end = [starting_coordinates[0], starting_coordinates[1] + label_offset]
-                    right_aux_line_start = [ending_coordinates[0], ending_coordinates[1]]
-                    right_aux_line_end = [ending_coordinates[0], ending_coordinates[1] + label_offset]
-
-                    dimension_svg += f"""   <g font-size="29.1042" font-style="normal" stroke-opacity="1" fill="none" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="1" font-weight="400" transform="matrix(1,0,0,1,{view.X.Value + label_alignment},{1000 - view.Y.Value})" stroke-linecap="square" stroke-linejoin="bevel">
-                                             <text x="0" y="{ending_coordinates[1] + label_offset - dimension_font_size / 4}" text-anchor="middle" fill-opacity="1" font-size="{dimension_font_size}" font-style="normal" fill="{colors['dimension_color']}" font-family="osifont" stroke="none" xml:space="preserve" font-weight="400">{dimension_label}</text>
-                                            </g>\n""".replace("                                    ", "")
-                    dimension_svg += f"""   <g font-size="29.1042" font-style="normal" stroke-opacity="1" fill="none" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="{dimension_line_thickness}" font-weight="400" transform="matrix(1,0,0,1,{view.X.Value},{1000 - view.Y.Value})" stroke-linecap="round" stroke-linejoin="bevel">
-                                              <path fill-rule="evenodd" vector-effect="none" d="M{main_line_start[0]},{main_line_start[1]} L{main_line_end[0]},{main_line_end[1]} M{left_aux_line_start[0]},{left_aux_line_start[1]} L{left_aux_line_end[0]},{left_aux_line_end[1]} M{right_aux_line_start[0]},{right_aux_line_start[1]} L{right_aux_line_end[0]},{right_aux_line_end[1]}"/>
-                                            </g>\n""".replace("                                     ", "")
-                    dimension_svg += f"""   <g font-size="29.1042" font-style="normal" stroke-opacity="1" fill="none" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="{dimension_line_thickness}" font-weight="400" transform="matrix(1,0,0,1,{view.X.Value},{1000 - view.Y.Value})" stroke-linecap="round" stroke-linejoin="bevel">
-                                             <g fill-opacity="1" font-size="29.1042" font-style="normal" stroke-opacity="1" fill="{colors['dimension_color']}" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="1" font-weight="400" transform="matrix(1,0,0,1,{ending_coordinates[0]},{ending_coordinates[1] + label_offset})" stroke-linecap="round" stroke-linejoin="bevel">
-                                              <path fill-rule="evenodd" vector-effect="none" d="M0,0 L-15,-6 L-15,6 L0,0"/>
-                                             </g>
-                                             <g fill-opacity="1" font-size="29.1042" font-style="normal" stroke-opacity="1" fill="{colors['dimension_color']}" font-family="MS Shell Dlg 2" stroke="{colors['dimension_color']}" stroke-width="1" font-weight="400" transform="matrix(1,0,0,1,{starting_coordinates[0]},{starting_coordinates[1] + label_offset})" stroke-linecap="round" stroke-linejoin="bevel">
-                                              <path fill-rule="evenodd" vector-effect="none" d="M0,0 L15,6 L15,-6 L0,0"/>
-                                             </g>
-                                            </g>\n""".replace("                                     ", "")
-                return dimension_svg
+                    offset_starting_y = starting_y + label_offset
+                    offset_ending_y = ending_y + label_offset
+                    fields['label_x'] = view.X.Value + label_alignment
+                    fields['label_y'] = 1000 - view.Y.Value
+                    fields['text_y'] = offset_ending_y - dimension_font_size / 4
+                    fields['path'] = _DIMENSION_PATH % (starting_x, offset_starting_y, ending_x, offset_ending_y, starting_x, starting_y, starting_x, offset_starting_y, ending_x, ending_y, ending_x, offset_ending_y)
+                    fields['ending_arrow_x'] = ending_x
+                    fields['ending_arrow_y'] = offset_ending_y
+                    fields['ending_arrow'] = _DIMENSION_ARROW_PATH % (-15, -6, -15, 6)
+                    fields['starting_arrow_x'] = starting_x
+                    fields['starting_arrow_y'] = offset_starting_y
+                    fields['starting_arrow'] = _DIMENSION_ARROW_PATH % (15, 6, 15, -6)
+
+                    dimension_svg.append(_DIMENSION_LABEL_X_SVG % fields)
+                    dimension_svg.append(_DIMENSION_LINES_SVG % fields)
+                    dimension_svg.append(_DIMENSION_ARROWS_SVG % fields)
+                return "".join(dimension_svg)
 
             projection_line_thickness = 4
             dimension_line_thickness = 1
@@ -3681,59 +3611,52 @@ class FreeCADBuilder:
                      </g>
                     </svg>
                     """.replace("                ", "")
-            svgFile_data = ""
-            svgFile_data += head
-            svgFile_data += projetion_head
+            svg_parts = [head, projetion_head]
 
             if view.Name == "TopView":
                 m = piece.Placement.Matrix
                 m.rotateZ(math.radians(90))
                 piece.Placement.Matrix = m
-                svgFile_data += TechDraw.projectToSVG(piece.Shape, FreeCAD.Vector(0., 0., 1.)).replace("><", ">\n<").replace("<", "    <").replace("stroke-width=\"0.7\"", f"stroke-width=\"{projection_line_thickness}\"").replace("#000000", colors['projection_color']).replace("rgb(0, 0, 0)", colors['projection_color'])
+                svg_parts.append(TechDraw.projectToSVG(piece.Shape, _Z_AXIS).replace("><", ">\n<").replace("<", "    <").replace("stroke-width=\"0.7\"", f"stroke-width=\"{projection_line_thickness}\"").replace("#000000", colors['projection_color']).replace("rgb(0, 0, 0)", colors['projection_color']))
             else:
                 m = piece.Placement.Matrix
                 m.rotateY(math.radians(90))
                 piece.Placement.Matrix = m
                 piece.Placement.move(FreeCAD.Vector(-dimensions["B"] / 2, 0, 0))
-                svgFile_data += TechDraw.projectToSVG(piece.Shape, FreeCAD.Vector(0., 1., 0.)).replace("><", ">\n<").replace("<", "    <").replace("stroke-width=\"0.7\"", f"stroke-width=\"{projection_line_thickness}\"").replace("#000000", colors['projection_color']).replace("rgb(0, 0, 0)", colors['projection_color'])
-            svgFile_data += projetion_tail
+                svg_parts.append(TechDraw.projectToSVG(piece.Shape, _Y_AXIS).replace("><", ">\n<").replace("<", "    <").replace("stroke-width=\"0.7\"", f"stroke-width=\"{projection_line_thickness}\"").replace("#000000", colors['projection_color']).replace("rgb(0, 0, 0)", colors['projection_color']))
+            svg_parts.append(projetion_tail)
             if view.Name == "TopView":
-                svgFile_data += create_dimension(starting_coordinates=[-dimensions['B'] / 2, 0],
-                                                 ending_coordinates=[dimensions['B'] / 2, 0],
-                                                 dimension_type="DistanceX",
-                                                 dimension_label=f"B: {round(original_dimensions['B'], 2)} mm",
-                                                 label_offset=vertical_offset + shape_semi_height)
+                svg_parts.append(create_dimension(starting_coordinates=[-dimensions['B'] / 2, 0],
+                                                  ending_coordinates=[dimensions['B'] / 2, 0],
+                                                  dimension_type="DistanceX",
+                                                  dimension_label=f"B: {round(original_dimensions['B'], 2)} mm",
+                                                  label_offset=vertical_offset + shape_semi_height))
                 vertical_offset += increment
-                svgFile_data += create_dimension(starting_coordinates=[-dimensions['A'] / 2, 0],
-                                                 ending_coordinates=[dimensions['A'] / 2, 0],
-                                                 dimension_type="DistanceX",
-                                                 dimension_label=f"A: {round(original_dimensions['A'], 2)} mm",
-                                                 label_offset=vertical_offset + shape_semi_height)
+                svg_parts.append(create_dimension(starting_coordinates=[-dimensions['A'] / 2, 0],
+                                                  ending_coordinates=[dimensions['A'] / 2, 0],
+                                                  dimension_type="DistanceX",
+                                                  dimension_label=f"A: {round(original_dimensions['A'], 2)} mm",
+                                                  label_offset=vertical_offset + shape_semi_height))
                 vertical_offset += increment
             else:
-                svgFile_data += create_dimension(starting_coordinates=[0, -dimensions['C'] / 2],
-                                                 ending_coordinates=[0, dimensions['C'] / 2],
-                                                 dimension_type="DistanceY",
-                                                 dimension_label=f"C: {round(original_dimensions['C'], 2)} mm",
-                                                 label_offset=horizontal_offset)
-
-            svgFile_data += tail
+                svg_parts.append(create_dimension(starting_coordinates=[0, -dimensions['C'] / 2],
+                                                  ending_coordinates=[0, dimensions['C'] / 2],
+                                                  dimension_type="DistanceY",
+                                                  dimension_label=f"C: {round(original_dimensions['C'], 2)} mm",
+                                                  label_offset=horizontal_offset))
+
+            svg_parts.append(tail)
+            svgFile_data = "".join(svg_parts)
             
             if save_files:
-                svgFile = open(f"{self.output_path}/{project_name}_{view.Name}.svg", "w")
-                svgFile.write(svgFile_data)
-                svgFile.close() 
+                with open(f"{self.output_path}/{project_name}_{view.Name}.svg", "w", encoding="utf-8") as svgFile:
+                    svgFile.write(svgFile_data)
             return svgFile_data
 
 
 if __name__ == '__main__':  # pragma: no cover
 
-    with open(f'{os.path.dirname(os.path.abspath(__file__))}/../../MAS/data/core_shapes.ndjson', 'r') as f:
-        for ndjson_line in f.readlines():
-            data = json.loads(ndjson_line)
-            if data["name"] == "PQ 40/40":
-                # if data["family"] in ['pm']:
-                # if data["family"] not in ['ui']:
-                core = FreeCADBuilder().factory(data)
-                core.get_core(data, None)
-                # break
+    # the shape to build can be given by name, e.g. "E 42/21/15"
+    data = utils.load_core_shape(sys.argv[1] if len(sys.argv) > 1 else "PQ 40/40")
+    core = FreeCADBuilder().factory(data)
+    core.get_piece(data)
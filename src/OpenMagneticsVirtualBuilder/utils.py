@@ -1,6 +1,13 @@
 import enum
+import functools
+import json
+import os
 import numpy
 
+core_shapes_path = f'{os.path.dirname(os.path.abspath(__file__))}/../../MAS/data/core_shapes.ndjson'
+default_output_path = f'{os.path.dirname(os.path.abspath(__file__))}/../../output/'
+core_shapes_indexes = {}
+
 
 class Meta(enum.EnumMeta):
     def __contains__(cls, item):
@@ -11,7 +18,7 @@ class Meta(enum.EnumMeta):
         return True
 
 
-class ShapeFamily(enum.Enum, metaclass=Meta):
+class ShapeFamily(enum.IntEnum, metaclass=Meta):
     ETD = enum.auto()
     ER = enum.auto()
     EP = enum.auto()
@@ -34,9 +41,48 @@ class ShapeFamily(enum.Enum, metaclass=Meta):
     T = enum.auto()
 
 
+@functools.lru_cache(maxsize=None)
+def get_shape_family(family):
+    return ShapeFamily[family.upper().replace(" ", "_")]
+
+
 def decimal_ceil(a, precision=0):
     return numpy.true_divide(numpy.ceil(a * 10**precision), 10**precision)
 
 
 def decimal_floor(a, precision=0):
     return numpy.true_divide(numpy.floor(a * 10**precision), 10**precision)
+
+
+def build_core_shapes_index(path):
+    index = {}
+    offset = 0
+    with open(path, 'rb') as f:
+        for ndjson_line in f:
+            if ndjson_line.strip():
+                index[json.loads(ndjson_line)["name"]] = offset
+            offset += len(ndjson_line)
+    return index
+
+
+def get_core_shapes_index(path=core_shapes_path):
+    mtime = os.path.getmtime(path)
+    if path in core_shapes_indexes and core_shapes_indexes[path][0] == mtime:
+        return core_shapes_indexes[path][1]
+
+    index = build_core_shapes_index(path)
+    core_shapes_indexes[path] = (mtime, index)
+    return index
+
+
+@functools.lru_cache(maxsize=1024)
+def read_core_shape_line(path, mtime, name):
+    index = get_core_shapes_index(path)
+    with open(path, 'rb') as f:
+        f.seek(index[name])
+        return f.readline()
+
+
+def load_core_shape(name, path=core_shapes_path):
+    # The raw line is cached per file version and decoded on every call, as callers modify the returned shape
+    return json.loads(read_core_shape_line(path, os.path.getmtime(path), name))
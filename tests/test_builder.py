@@ -1,10 +1,14 @@
 import unittest
 import os
+import types
 import json
 import glob
 
 import context  # noqa: F401
 import builder
+import cadquery_builder
+import freecad_builder
+import utils
 import copy
 import PyMKF
 
@@ -68,6 +72,13 @@ class Tests(unittest.TestCase):
                 if data["family"] not in ['ui', 'pqi']:
                     self.assertTrue(data["family"] in list(families.keys()))
 
+    def test_load_core_shape(self):
+        core_shapes_path = f'{os.path.dirname(os.path.abspath(__file__))}/../../MAS/data/core_shapes.ndjson'
+        with open(core_shapes_path, 'r') as f:
+            for ndjson_line in f:
+                data = json.loads(ndjson_line)
+                self.assertEqual(data, utils.load_core_shape(data["name"], path=core_shapes_path))
+
     def test_all_subtractive_gapped_cores_generated(self):
         dummyGapping = [
             {
@@ -538,6 +549,102 @@ class Tests(unittest.TestCase):
         # self.assertTrue(os.path.exists(f"{self.output_path}/{filename}_core_gaps_FrontView.svg"))
 
 
+    def test_edges_in_boundboxes(self):
+        def fake_edge(xmin, ymin, zmin, xmax, ymax, zmax):
+            return types.SimpleNamespace(BoundBox=types.SimpleNamespace(XMin=xmin, YMin=ymin, ZMin=zmin, XMax=xmax, YMax=ymax, ZMax=zmax))
+
+        edges = [
+            (0, 0, 0, 1, 1, 1),  # inside the first box
+            (0, 0, 0, 2, 2, 2),  # exactly on the first box boundary
+            (-0.5, 0, 0, 1, 1, 1),  # starting before the first box
+            (1, 1, 1, 2.5, 2, 2),  # ending after the first box
+            (5, 5, 5, 5, 5, 5),  # a single point on the second box corner
+            (10, 10, 10, 11, 11, 11),  # outside every box
+        ]
+        boundboxes = [(0, 0, 0, 2, 2, 2), (3, 3, 3, 5, 5, 5), (-1, -1, -1, 3, 3, 3)]
+        shape = types.SimpleNamespace(Edges=[fake_edge(*edge) for edge in edges])
+
+        # the per-edge comparisons edges_in_boundbox used to do
+        expected = [
+            [i for i, (edge_xmin, edge_ymin, edge_zmin, edge_xmax, edge_ymax, edge_zmax) in enumerate(edges)
+             if edge_xmin >= xmin and edge_ymin >= ymin and edge_zmin >= zmin and edge_xmax <= xmax and edge_ymax <= ymax and edge_zmax <= zmax]
+            for xmin, ymin, zmin, xmax, ymax, zmax in boundboxes
+        ]
+        self.assertEqual(expected, [[0, 1], [4], [0, 1, 2, 3]])
+
+        piece = freecad_builder.FreeCADBuilder.IPiece
+        self.assertEqual(piece.edges_in_boundboxes(shape, boundboxes), expected)
+        edges_bounds = piece.get_edges_bounds(shape)
+        for boundbox, expected_edges in zip(boundboxes, expected):
+            self.assertEqual(piece.edges_in_boundbox(shape, *boundbox), expected_edges)
+            self.assertEqual(piece.edges_in_boundbox(shape, *boundbox, edges_bounds=edges_bounds), expected_edges)
+
+
+    def test_flatten_dimensions(self):
+        def shape_data():
+            return {
+                "name": "Test",
+                "dimensions": {
+                    "A": 0.01,
+                    "B": {"nominal": None, "minimum": 0.004, "maximum": 0.006},
+                    "C": {"minimum": 0.002},
+                    "D": {"minimum": None, "maximum": 0.003},
+                    "E": {"nominal": 0.005, "minimum": 0.001, "maximum": 0.009},
+                    "alpha": 0.5
+                }
+            }
+
+        expected_flat_dimensions = {"A": 0.01, "B": 0.005, "C": 0.002, "D": 0.003, "E": 0.005}
+        expected_dimensions = {
+            "A": {"nominal": 0.01},
+            "B": {"nominal": 0.005, "minimum": 0.004, "maximum": 0.006},
+            "C": {"minimum": 0.002, "nominal": 0.002},
+            "D": {"minimum": None, "maximum": 0.003, "nominal": 0.003},
+            "E": {"nominal": 0.005, "minimum": 0.001, "maximum": 0.009},
+            "alpha": {"nominal": 0.5}
+        }
+
+        for module, scale in [(cadquery_builder, 1), (freecad_builder, 1000)]:
+            data = shape_data()
+            self.assertEqual(module.flatten_dimensions(data), {k: v * scale for k, v in expected_flat_dimensions.items()})
+            self.assertEqual(data["dimensions"], expected_dimensions)
+
+            data = shape_data()
+            module.flatten_dimensions(module.copy_shape_data(data))
+            self.assertEqual(data, shape_data())
+
+
+    def test_get_families_returns_a_copy(self):
+        core_builder = builder.Builder()
+        families = core_builder.get_families()
+        expected_families = copy.deepcopy(families)
+
+        family, subtypes = next(iter(families.items()))
+        subtype, dimensions = next(iter(subtypes.items()))
+        dimensions.append("Z")
+        subtypes[subtype] = []
+        subtypes["new subtype"] = ["A"]
+        del families[family]
+        families["new family"] = {}
+
+        self.assertEqual(core_builder.get_families(), expected_families)
+
+
+    def test_generate_many(self):
+        core_shapes_path = f'{os.path.dirname(os.path.abspath(__file__))}/../../MAS/data/core_shapes.ndjson'
+        names = ["PQ 40/40", "E 42/21/15", "ETD 39/20/13"]
+        data_list = [utils.load_core_shape(name, path=core_shapes_path) for name in names]
+
+        paths = builder.generate_many(data_list, output_path=self.output_path, workers=1)
+
+        self.assertEqual(len(paths), len(names))
+        for name, (step_path, stl_path) in zip(names, paths):
+            filename = f"{name}_piece".replace(" ", "_").replace("-", "_").replace("/", "_").replace(".", "__")
+            self.assertEqual(step_path, f"{self.output_path}/{filename}.step")
+            self.assertEqual(stl_path, f"{self.output_path}/{filename}.stl")
+            self.assertTrue(os.path.exists(step_path))
+
+
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
 